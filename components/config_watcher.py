@@ -0,0 +1,90 @@
+import json
+import os
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+from config import config, apply_config
+from config_schema import ConfigError
+
+class ConfigWatcher(QObject):
+    """
+    config.json 변경 감시 (앱을 다시 시작하지 않고 설정 적용)
+
+    파일이 바뀌면 잠시 기다렸다가(저장이 끝나도록) 다시 읽고, 검증에 통과하면
+    config/get_settings()를 새 값으로 바꾼 뒤 바뀐 최상위 섹션 이름 집합을 config_changed로 알립니다.
+    JSON이 깨졌거나 검증에 실패하면 기존 설정을 그대로 둡니다.
+    바뀐 섹션은 마지막으로 읽은 파일 내용과 비교하므로, 다시 시작할 때까지 기존 값을 유지하는
+    섹션(config.RESTART_SECTIONS)도 파일에서 실제로 바뀐 한 번만 알립니다.
+    저장 프로그램이 임시 파일을 만든 뒤 이름을 바꾸는 방식이면 파일 감시가 풀리므로
+    설정 파일이 있는 폴더도 함께 감시하고, 파일이 다시 생기면 감시 목록에 다시 추가합니다.
+
+    config.json 선택 설정:
+        "config_watch": {"enabled": true, "debounce_ms": 500}
+    """
+    config_changed = Signal(object)  # 바뀐 섹션 이름 (frozenset)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        settings = config.get("config_watch", {})
+        self.path = os.path.abspath(path)
+        self.last_text = self.read_text()
+        self.last_config = self.parse(self.last_text)
+
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(settings.get("debounce_ms", 500))
+        self.debounce.timeout.connect(self.reload)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_path_changed)
+        self.watcher.directoryChanged.connect(self.on_path_changed)
+        self.watcher.addPath(os.path.dirname(self.path))
+        self.watch_file()
+
+    def watch_file(self):
+        if os.path.exists(self.path) and self.path not in self.watcher.files():
+            self.watcher.addPath(self.path)
+
+    def on_path_changed(self, path):
+        self.watch_file()
+        self.debounce.start()
+
+    def read_text(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def parse(self, text):
+        try:
+            return json.loads(text) if text is not None else dict(config)
+        except json.JSONDecodeError:
+            return dict(config)
+
+    def reload(self):
+        text = self.read_text()
+        # 폴더의 다른 파일이 바뀌었거나 내용이 같으면 무시
+        if text is None or text == self.last_text:
+            return
+        try:
+            new_config = json.loads(text)
+        except json.JSONDecodeError as e:
+            print(f"설정 파일을 읽지 못했습니다 (기존 설정 유지): {e}")
+            return
+
+        old_config = self.last_config
+        try:
+            apply_config(new_config)
+        except ConfigError as e:
+            print(f"설정 파일 다시 읽기 실패 (기존 설정 유지): {e}")
+            return
+        self.last_text = text
+        self.last_config = new_config
+
+        changed = frozenset(
+            key for key in old_config.keys() | new_config.keys()
+            if old_config.get(key) != new_config.get(key)
+        )
+        if changed:
+            print(f"설정 변경 적용: {', '.join(sorted(changed))}")
+            self.config_changed.emit(changed)
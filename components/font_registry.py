@@ -0,0 +1,172 @@
+import os
+import threading
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QFont, QFontDatabase
+from config import config
+
+FONT_DIR = os.path.join("resources", "font")
+DEFAULT_FAMILY = "맑은 고딕"  # 폰트 로드 실패 시 기본 폰트
+PHRASE_SECTIONS = ("splash", "process", "complete")
+
+class FontRegistry(QObject):
+    """
+    공용 폰트 등록기
+
+    resources/font 의 모든 폰트 파일을 백그라운드 스레드에서 한 번만 읽고,
+    GUI 스레드에서 QFontDatabase에 등록한 뒤 파일명별 패밀리 이름을 캐시합니다.
+    각 화면 문구(splash/process/complete)의 QFont도 미리 만들어 두므로
+    화면 생성 중에는 폰트 파일을 읽지 않습니다.
+
+    등록이 끝나기 전에 만들어진 라벨은 bind_label()로 연결해 두면
+    폰트가 등록되는 즉시 새 폰트로 갱신됩니다. 폴더를 다 읽었는데도 없는 폰트나
+    등록에 실패한 폰트는 기본 폰트로 확정하고 기다리던 라벨을 목록에서 지웁니다.
+    폴더를 다 읽은 뒤에 처음 요청된 폰트(설정 변경으로 바뀐 폰트 등)는
+    request_font()가 그 파일 하나만 같은 방식으로 읽어 등록합니다.
+    삭제된 라벨은 대기 목록에서 바로 빠집니다.
+    """
+    font_data_read = Signal(str, bytes)
+    font_read_failed = Signal(str)
+    font_scan_finished = Signal()
+    font_loaded = Signal(str, str)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.families = {}
+        self.phrase_fonts = {}
+        self.pending_labels = {}
+        self.loading = set()  # 폴더를 다 읽은 뒤 따로 읽고 있는 파일명
+        self.started = False
+        self.scanned = False
+        self.loader_thread = None
+        self.font_data_read.connect(self.register_font_data)
+        self.font_read_failed.connect(self.mark_missing)
+        self.font_scan_finished.connect(self.drop_missing_fonts)
+        self.build_phrase_fonts()
+
+    def start(self):
+        """폰트 파일 읽기 시작 (여러 번 호출해도 한 번만 수행)"""
+        if self.started:
+            return
+        self.started = True
+        if not os.path.isdir(FONT_DIR):
+            self.drop_missing_fonts()
+            return
+        self.loader_thread = threading.Thread(target=self.read_font_files, name="font-loader", daemon=True)
+        self.loader_thread.start()
+
+    def read_font_files(self):
+        """백그라운드 스레드: 파일 내용만 읽어서 GUI 스레드로 전달"""
+        for file_name in sorted(os.listdir(FONT_DIR)):
+            if not file_name.lower().endswith((".ttf", ".otf", ".ttc")):
+                continue
+            try:
+                with open(os.path.join(FONT_DIR, file_name), "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                print(f"폰트 파일 읽기 실패 ({file_name}): {e}")
+                continue
+            # 시그널은 큐 연결로 GUI 스레드에서 처리됨
+            self.font_data_read.emit(file_name, data)
+        # 앞서 보낸 폰트 데이터가 모두 처리된 뒤에 실행됨 (같은 큐)
+        self.font_scan_finished.emit()
+
+    def request_font(self, file_name):
+        """폴더를 다 읽은 뒤 처음 쓰는 폰트면 그 파일만 백그라운드에서 읽어 등록"""
+        if not self.scanned or not file_name or file_name in self.families or file_name in self.loading:
+            return
+        self.loading.add(file_name)
+        threading.Thread(target=self.read_font_file, args=(file_name,),
+                         name="font-loader", daemon=True).start()
+
+    def read_font_file(self, file_name):
+        """백그라운드 스레드: 폰트 파일 하나를 읽어서 GUI 스레드로 전달"""
+        try:
+            with open(os.path.join(FONT_DIR, file_name), "rb") as f:
+                data = f.read()
+        except OSError as e:
+            print(f"폰트 파일 읽기 실패 ({file_name}): {e}")
+            self.font_read_failed.emit(file_name)
+            return
+        self.font_data_read.emit(file_name, data)
+
+    def register_font_data(self, file_name, data):
+        """GUI 스레드: 폰트 등록 후 대기 중인 라벨 갱신"""
+        self.loading.discard(file_name)
+        font_id = QFontDatabase.addApplicationFontFromData(data)
+        families = QFontDatabase.applicationFontFamilies(font_id) if font_id != -1 else []
+        if not families:
+            print(f"폰트 등록 실패: {file_name}")
+            self.mark_missing(file_name)
+            return
+
+        self.families[file_name] = families[0]
+        self.build_phrase_fonts()
+        for label, section in self.pending_labels.pop(file_name, []):
+            self.apply_font(label, section)
+        self.font_loaded.emit(file_name, families[0])
+
+    def mark_missing(self, file_name):
+        """GUI 스레드: 읽거나 등록하지 못한 폰트는 기본 폰트로 확정하고 대기 라벨 제거"""
+        self.loading.discard(file_name)
+        self.families[file_name] = DEFAULT_FAMILY
+        self.pending_labels.pop(file_name, None)
+
+    def drop_missing_fonts(self):
+        """GUI 스레드: 폴더를 다 읽었는데도 없는 폰트는 기본 폰트로 확정하고 대기 라벨 제거"""
+        self.scanned = True
+        for file_name in list(self.pending_labels):
+            print(f"폰트 파일 없음: {file_name}")
+            self.mark_missing(file_name)
+
+    def family(self, file_name):
+        """파일명에 해당하는 패밀리 이름 (아직 등록 전이면 기본 폰트)"""
+        return self.families.get(file_name, DEFAULT_FAMILY)
+
+    def build_phrase_fonts(self):
+        for section in PHRASE_SECTIONS:
+            if section not in config:
+                continue
+            font = QFont(self.family(config[section].get("font", "")))
+            font.setPointSize(config[section]["font_size"])
+            self.phrase_fonts[section] = font
+
+    def phrase_font(self, section):
+        """미리 만든 화면 문구용 QFont 사본"""
+        return QFont(self.phrase_fonts[section])
+
+    def bind_label(self, label, section):
+        """문구 라벨에 폰트 적용, 등록 전이면 등록 완료 시 다시 적용"""
+        label.setFont(self.phrase_font(section))
+        file_name = config[section].get("font", "")
+        if file_name and file_name not in self.families:
+            self.pending_labels.setdefault(file_name, []).append((label, section))
+            label.destroyed.connect(lambda: self.release_label(label))
+            self.request_font(file_name)
+
+    def release_label(self, label):
+        """삭제된 라벨을 대기 목록에서 제거"""
+        for file_name, labels in list(self.pending_labels.items()):
+            labels[:] = [entry for entry in labels if entry[0] is not label]
+            if not labels:
+                del self.pending_labels[file_name]
+
+    def apply_font(self, label, section):
+        try:
+            label.setFont(self.phrase_font(section))
+            # 위치는 그대로 두고 새 폰트에 맞게 크기만 조정
+            label.resize(label.sizeHint())
+        except RuntimeError:
+            # 라벨이 이미 삭제된 경우
+            pass
+
+def font_registry():
+    return FontRegistry.instance()
@@ -0,0 +1,226 @@
+from components.hangul_composer import HangulComposer
+
+# ---- 상태 (조합 중인 글자의 모양) ----
+EMPTY = 0           # 조합 중 아님
+CHO = 1             # 초성만
+JUNG = 2            # 중성만 (모음 단독)
+CHO_JUNG = 3        # 초성 + 중성
+CHO_JUNG_JONG = 4   # 초성 + 중성 + 홑받침
+CHO_JUNG_COMPLEX = 5  # 초성 + 중성 + 겹받침
+
+# ---- 입력 자모 분류 ----
+CONSONANT = 0          # 받침이 될 수 있는 자음
+CONSONANT_NO_JONG = 1  # 받침이 될 수 없는 자음 (ㄸ, ㅃ, ㅉ)
+VOWEL = 2
+OTHER = 3              # 그 밖의 문자 (겹받침 낱자 등, 조합 상태를 바꾸지 않음)
+
+# ---- 동작 ----
+SET_CHO = 0       # 초성 입력
+SET_JUNG = 1      # 중성 입력
+SET_JONG = 2      # 받침 입력
+COMMIT_CHO = 3    # 현재 글자 완성 후 새 초성
+COMMIT_JUNG = 4   # 현재 글자 완성 후 새 중성
+EXTEND_JONG = 5   # 겹받침 시도, 안 되면 COMMIT_CHO
+EXTEND_JUNG = 6   # 복합 모음 시도, 안 되면 COMMIT_JUNG
+MOVE_JONG = 7     # 홑받침을 다음 글자 초성으로 넘김
+SPLIT_JONG = 8    # 겹받침의 뒤 자음을 다음 글자 초성으로 넘김
+NOOP = 9
+
+# TRANSITIONS[상태][자모 분류] -> 동작
+TRANSITIONS = (
+    # CONSONANT     CONSONANT_NO_JONG  VOWEL         OTHER
+    (SET_CHO,       SET_CHO,           COMMIT_JUNG,  NOOP),  # EMPTY
+    (COMMIT_CHO,    COMMIT_CHO,        SET_JUNG,     NOOP),  # CHO
+    (COMMIT_CHO,    COMMIT_CHO,        COMMIT_JUNG,  NOOP),  # JUNG
+    (SET_JONG,      COMMIT_CHO,        EXTEND_JUNG,  NOOP),  # CHO_JUNG
+    (EXTEND_JONG,   EXTEND_JONG,       MOVE_JONG,    NOOP),  # CHO_JUNG_JONG
+    (COMMIT_CHO,    COMMIT_CHO,        SPLIT_JONG,   NOOP),  # CHO_JUNG_COMPLEX
+)
+
+JAMO_CLASS = {}
+for _jamo in HangulComposer.CHOSUNG:
+    JAMO_CLASS[_jamo] = CONSONANT if _jamo in HangulComposer.JONGSUNG else CONSONANT_NO_JONG
+for _jamo in HangulComposer.JUNGSUNG:
+    JAMO_CLASS[_jamo] = VOWEL
+
+# 완성형 코드 = 0xAC00 + 초성 오프셋 + 중성 오프셋 + 종성 오프셋
+SYLLABLE_BASE = 0xAC00
+CHO_OFFSET = {jamo: index * 588 for index, jamo in enumerate(HangulComposer.CHOSUNG)}
+JUNG_OFFSET = {jamo: index * 28 for index, jamo in enumerate(HangulComposer.JUNGSUNG)}
+JONG_OFFSET = {jamo: index for index, jamo in enumerate(HangulComposer.JONGSUNG) if jamo}
+
+COMPLEX_JONGSUNG_MAP = HangulComposer.COMPLEX_JONGSUNG_MAP
+COMPLEX_VOWEL_MAP = HangulComposer.COMPLEX_VOWEL_MAP
+REVERSE_COMPLEX_JONGSUNG = HangulComposer.REVERSE_COMPLEX_JONGSUNG
+
+class HangulAutomaton:
+    """
+    표 기반 한글 조합기 (HangulComposer와 입출력이 같음)
+
+    자모 분류 × 상태 → 동작 표와 완성형 코드 오프셋 표를 import할 때 한 번 만들어 두고,
+    키 입력마다 list.index 검색이나 조건 분기 없이 표를 찾아 동작합니다.
+    HangulComposer의 세부 동작도 그대로 따릅니다:
+    - reset()은 current_text를 지우지 않음
+    - 복합 모음이 만들어질 때는 last_jamo를 바꾸지 않음
+    같은지는 tools/hangul_equivalence.py로 확인합니다.
+    """
+
+    def __init__(self):
+        self.reset()
+        self.current_text = ""
+
+    def reset(self):
+        self.cho = None
+        self.jung = None
+        self.jong = None
+        self.last_jamo = None
+        self.state = EMPTY
+
+    def combine(self):
+        state = self.state
+        if state >= CHO_JUNG:
+            code = SYLLABLE_BASE + CHO_OFFSET[self.cho] + JUNG_OFFSET[self.jung]
+            if state != CHO_JUNG:
+                code += JONG_OFFSET[self.jong]
+            return chr(code)
+        if state == CHO:
+            return self.cho
+        if state == JUNG:
+            return self.jung
+        return None
+
+    def commit(self):
+        result = self.combine()
+        self.reset()
+        return result
+
+    def add_jamo(self, jamo):
+        action = TRANSITIONS[self.state][JAMO_CLASS.get(jamo, OTHER)]
+        result = self.ACTIONS[action](self, jamo)
+        if result is False:
+            # 복합 모음: last_jamo를 그대로 두고 바로 반환 (HangulComposer와 같음)
+            self.current_text = self.combine()
+            return None, self.current_text
+
+        self.last_jamo = jamo
+        current = self.combine()
+        if current:
+            self.current_text = current
+        return result, self.current_text
+
+    def compose(self, jamos):
+        """
+        자모를 차례로 넣고 (완성된 글자들 + 조합 중인 글자) 문자열 반환
+
+        조합 상태는 유지되므로 이어서 add_jamo/compose를 호출할 수 있습니다.
+        """
+        pieces = []
+        transitions = TRANSITIONS
+        jamo_class = JAMO_CLASS
+        actions = self.ACTIONS
+        for jamo in jamos:
+            result = actions[transitions[self.state][jamo_class.get(jamo, OTHER)]](self, jamo)
+            if result is False:
+                continue
+            if result:
+                pieces.append(result)
+            self.last_jamo = jamo
+        current = self.combine()
+        if current:
+            self.current_text = current
+            pieces.append(current)
+        return "".join(pieces)
+
+    def backspace(self):
+        """
+        초성, 중성, 종성 순으로 하나씩 삭제
+        반환값: (삭제된 후의 현재 조합중인 글자, 변경 여부)
+        """
+        state = self.state
+        if state == CHO_JUNG_COMPLEX:
+            self.jong = REVERSE_COMPLEX_JONGSUNG[self.jong][0]
+            self.state = CHO_JUNG_JONG
+        elif state == CHO_JUNG_JONG:
+            self.jong = None
+            self.state = CHO_JUNG
+        elif state == CHO_JUNG:
+            self.jung = None
+            self.state = CHO
+        else:
+            self.reset()
+
+        self.current_text = self.combine() or ""
+        return self.current_text, True
+
+    # ---- 동작 (복합 모음으로 끝나면 False, 아니면 완성된 글자 또는 None 반환) ----
+
+    def _set_cho(self, jamo):
+        self.cho = jamo
+        self.state = CHO
+        return None
+
+    def _set_jung(self, jamo):
+        self.jung = jamo
+        self.state = CHO_JUNG
+        return None
+
+    def _set_jong(self, jamo):
+        self.jong = jamo
+        self.state = CHO_JUNG_JONG
+        return None
+
+    def _commit_cho(self, jamo):
+        result = self.commit()
+        self.cho = jamo
+        self.state = CHO
+        return result
+
+    def _commit_jung(self, jamo):
+        result = self.commit()
+        self.jung = jamo
+        self.state = JUNG
+        return result
+
+    def _extend_jong(self, jamo):
+        complex_jong = COMPLEX_JONGSUNG_MAP.get((self.jong, jamo))
+        if complex_jong is None:
+            return self._commit_cho(jamo)
+        self.jong = complex_jong
+        self.state = CHO_JUNG_COMPLEX
+        return None
+
+    def _extend_jung(self, jamo):
+        complex_vowel = COMPLEX_VOWEL_MAP.get((self.jung, jamo))
+        if complex_vowel is None:
+            return self._commit_jung(jamo)
+        self.jung = complex_vowel
+        return False
+
+    def _move_jong(self, jamo):
+        new_cho = self.jong
+        self.jong = None
+        self.state = CHO_JUNG
+        result = self.commit()
+        self.cho = new_cho
+        self.jung = jamo
+        self.state = CHO_JUNG
+        return result
+
+    def _split_jong(self, jamo):
+        cons1, cons2 = REVERSE_COMPLEX_JONGSUNG[self.jong]
+        self.jong = cons1
+        self.state = CHO_JUNG_JONG
+        result = self.commit()
+        self.cho = cons2
+        self.jung = jamo
+        self.state = CHO_JUNG
+        return result
+
+    def _noop(self, jamo):
+        return None
+
+    # 동작 번호 순서 (SET_CHO ... NOOP)
+    ACTIONS = (
+        _set_cho, _set_jung, _set_jong, _commit_cho, _commit_jung,
+        _extend_jong, _extend_jung, _move_jong, _split_jong, _noop,
+    )
@@ -0,0 +1,52 @@
+def is_hangul_syllable(char):
+    """완성형 한글 (가~힣)"""
+    return 0xAC00 <= ord(char) <= 0xD7A3
+
+def is_hangul_jamo(char):
+    """호환용 한글 자모 낱자 (ㄱ~ㅣ)"""
+    return 0x3131 <= ord(char) <= 0x3163
+
+class KeyboardInput:
+    """
+    가상 키보드 입력 문자열과 글자 수
+
+    키 입력은 항상 끝에서 몇 글자를 지우고 붙이는 형태이므로(replace_tail),
+    완성형 한글 수와 자모 낱자 수를 바뀐 글자만 보고 갱신합니다.
+    키를 누를 때마다 전체 문자열을 다시 세지 않습니다.
+    """
+
+    def __init__(self, text=""):
+        self.reset(text)
+
+    def reset(self, text=""):
+        """입력 필드가 바깥에서 바뀐 경우 (전체를 다시 셈)"""
+        self.text = text
+        self.syllable_count = 0
+        self.jamo_count = 0
+        for char in text:
+            self._count(char, 1)
+
+    def __len__(self):
+        return len(self.text)
+
+    @property
+    def last(self):
+        return self.text[-1] if self.text else ""
+
+    def _count(self, char, delta):
+        if is_hangul_syllable(char):
+            self.syllable_count += delta
+        elif is_hangul_jamo(char):
+            self.jamo_count += delta
+
+    def replace_tail(self, remove, append=""):
+        """끝에서 remove 글자를 지우고 append를 붙인 뒤 새 문자열 반환"""
+        remove = min(remove, len(self.text))
+        if remove:
+            for char in self.text[-remove:]:
+                self._count(char, -1)
+            self.text = self.text[:-remove]
+        for char in append:
+            self._count(char, 1)
+        self.text += append
+        return self.text
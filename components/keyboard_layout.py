@@ -0,0 +1,88 @@
+KEY_ROWS = (
+    ('1', '2', '3', '4', '5', '6', '7', '8', '9', '0'),
+    ('Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P'),
+    ('A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L'),
+    ('Z', 'X', 'C', 'V', 'B', 'N', 'M'),
+)
+
+# 특수 키 objectName -> KeyboardSettings의 색상 속성
+SPECIAL_KEY_COLORS = {
+    "hangulKey": "hangul_btn_color",
+    "shiftKey": "shift_btn_color",
+    "backspaceKey": "backspace_btn_color",
+    "nextKey": "next_btn_color",
+}
+
+def darken_color(color):
+    # 색상 코드가 #RRGGBB 형식이라고 가정
+    r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+    return f'#{max(0, r-30):02X}{max(0, g-30):02X}{max(0, b-30):02X}'
+
+def compile_stylesheet(settings):
+    """
+    키보드 전체 스타일시트 한 개 (키 종류는 objectName 선택자로 구분)
+
+    키보드 위젯에 한 번만 설정하면 자식 버튼에 적용되므로, 버튼마다 스타일시트 문자열을
+    만들고 파싱하지 않습니다.
+    """
+    rules = [f"""
+        VirtualKeyboard {{
+            background-color: {settings.bg_color};
+            border: {settings.border_width}px solid {settings.border_color};
+            border-radius: {settings.border_radius}px;
+            padding: {settings.padding}px;
+        }}
+        QPushButton#key {{
+            background-color: {settings.button_bg_color};
+            color: {settings.button_text_color};
+            border: none;
+            border-radius: {settings.button_radius}px;
+        }}
+        QPushButton#key:pressed {{
+            background-color: {settings.button_pressed_color};
+        }}
+    """]
+    for object_name, color_key in SPECIAL_KEY_COLORS.items():
+        color = getattr(settings, color_key)
+        rules.append(f"""
+        QPushButton#{object_name} {{
+            background-color: {color};
+            color: {settings.button_text_color};
+            border: none;
+            border-radius: {settings.button_radius}px;
+        }}
+        QPushButton#{object_name}:pressed {{
+            background-color: {darken_color(color)};
+        }}
+        """)
+    return "".join(rules)
+
+def compile_label_tables(hangul_map, shift_hangul_map, rows=KEY_ROWS):
+    """
+    (한글 여부, 대문자 여부) -> {키: 라벨} 네 가지 표
+
+    한/영, Shift 전환 때 버튼마다 매핑을 찾지 않고 표만 바꿔 씁니다.
+    """
+    tables = {}
+    for is_hangul in (True, False):
+        for is_uppercase in (True, False):
+            table = {}
+            for row in rows:
+                for key in row:
+                    if is_hangul:
+                        if is_uppercase and key in shift_hangul_map:
+                            table[key] = shift_hangul_map[key]
+                        else:
+                            table[key] = hangul_map.get(key, key)
+                    else:
+                        table[key] = key.upper() if is_uppercase else key.lower()
+            tables[(is_hangul, is_uppercase)] = table
+    return tables
+
+class KeyboardLayout:
+    """KeyboardSettings에서 한 번 만들어 두는 키 배열, 스타일시트, 라벨 표"""
+
+    def __init__(self, settings, hangul_map, shift_hangul_map):
+        self.rows = [list(row) for row in KEY_ROWS]
+        self.stylesheet = compile_stylesheet(settings)
+        self.labels = compile_label_tables(hangul_map, shift_hangul_map)
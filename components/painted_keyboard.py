@@ -0,0 +1,208 @@
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
+from components.virtual_keyboard import VirtualKeyboard
+from config import get_settings
+
+# 특수 키 (라벨, KeyboardSettings 색상 속성, 너비 고정 여부, 남는 폭 비율)
+SPECIAL_KEYS = [
+    ("hangul", "한/영", "hangul_btn_color", True, 2),
+    ("shift", "Shift", "shift_btn_color", True, 2),
+    ("space", "Space", None, False, 4),
+    ("backspace", "←", "backspace_btn_color", False, 2),
+    ("next", "다음", "next_btn_color", True, 2),
+]
+SPACING = 5
+
+class PaintedKey:
+    def __init__(self, name, rect, color, pressed_color):
+        self.name = name  # 문자 키는 'Q' 같은 키 이름, 특수 키는 SPECIAL_KEYS의 이름
+        self.rect = rect
+        self.color = color
+        self.pressed_color = pressed_color
+
+class PaintedKeyboard(VirtualKeyboard):
+    """
+    키 전체를 paintEvent 한 번으로 그리는 가상 키보드 (VirtualKeyboard와 입력 처리 동일)
+
+    키마다 QPushButton과 스타일시트를 만들지 않고,
+    - 크기가 바뀔 때 키 배치(QRect 목록)를 한 번 계산하고
+    - 한/영, Shift 조합별 키보드 전체 그림을 QPixmap으로 캐시해서 모드 전환은 그림 교체로 처리
+    - 터치 위치는 직접 키 영역과 비교하고, 눌린 키 영역만 다시 그림
+    기존 키보드와 같이 키 사이는 투명하게 둡니다 (스타일시트 배경은 QWidget 하위 클래스에서 그려지지 않았음).
+    config.json의 "keyboard"에서 "renderer": "buttons"로 두면 기존 버튼 키보드를 사용합니다.
+    """
+
+    def initUI(self):
+        settings = get_settings().keyboard
+        self.padding = settings.padding
+        self.key_font = QFont('맑은 고딕', settings.font_size)
+        self.text_color = QColor(settings.button_text_color)
+        self.button_radius = settings.button_radius
+        self.special_btn_width = settings.special_btn_width
+
+        self.keys = self.keyboard_layout().rows
+        self.button_widgets = []  # 버튼이 없음 (tools/soak_driver는 key_rect 사용)
+        self.painted_keys = []
+        self.layer_cache = {}  # (한글, 대문자) -> 키보드 전체 QPixmap
+        self.pressed_key = None
+
+    # ---- 배치 ----
+
+    def layout_keys(self):
+        """현재 크기에 맞춰 키 영역 계산 (크기가 바뀔 때만)"""
+        settings = get_settings().keyboard
+        key_color = QColor(settings.button_bg_color)
+        key_pressed = QColor(settings.button_pressed_color)
+
+        inner = self.rect().adjusted(self.padding, self.padding, -self.padding, -self.padding)
+        rows = len(self.keys) + 1
+        row_height = (inner.height() - SPACING * (rows - 1)) / rows
+
+        self.painted_keys = []
+        for row_index, row in enumerate(self.keys):
+            top = inner.top() + row_index * (row_height + SPACING)
+            key_width = (inner.width() - SPACING * (len(row) - 1)) / len(row)
+            for column, key in enumerate(row):
+                left = inner.left() + column * (key_width + SPACING)
+                rect = QRectF(left, top, key_width, row_height).toRect()
+                self.painted_keys.append(PaintedKey(key, rect, key_color, key_pressed))
+
+        # 특수 키 줄: 한/영, Shift, 다음은 고정 폭, 나머지 폭은 비율대로
+        top = inner.top() + len(self.keys) * (row_height + SPACING)
+        fixed = sum(self.special_btn_width for _, _, _, is_fixed, _ in SPECIAL_KEYS if is_fixed)
+        flexible = inner.width() - fixed - SPACING * (len(SPECIAL_KEYS) - 1)
+        flexible_parts = sum(part for _, _, _, is_fixed, part in SPECIAL_KEYS if not is_fixed)
+        left = inner.left()
+        for name, _, color_key, is_fixed, part in SPECIAL_KEYS:
+            width = self.special_btn_width if is_fixed else flexible * part / flexible_parts
+            rect = QRectF(left, top, width, row_height).toRect()
+            if color_key is None:
+                color, pressed = key_color, key_pressed
+            else:
+                color = QColor(getattr(settings, color_key))
+                pressed = QColor(self.darken_color(getattr(settings, color_key)))
+            self.painted_keys.append(PaintedKey(name, rect, color, pressed))
+            left += width + SPACING
+
+        self.layer_cache.clear()
+
+    def key_rect(self, name):
+        """키 이름('Q', 'space', 'next' 등)의 영역 (테스트 도구에서 터치 위치 계산용)"""
+        if not self.painted_keys:
+            self.layout_keys()
+        for key in self.painted_keys:
+            if key.name == name:
+                return QRect(key.rect)
+        return QRect()
+
+    def key_at(self, pos):
+        for key in self.painted_keys:
+            if key.rect.contains(pos):
+                return key
+        return None
+
+    # ---- 그리기 ----
+
+    def key_label(self, name):
+        for special, label, _, _, _ in SPECIAL_KEYS:
+            if name == special:
+                return label
+        return self.keyboard_layout().labels[(self.is_hangul, self.is_uppercase)][name]
+
+    def paint_key(self, painter, key, pressed):
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(key.pressed_color if pressed else key.color)
+        painter.drawRoundedRect(QRectF(key.rect), self.button_radius, self.button_radius)
+        painter.setPen(self.text_color)
+        painter.drawText(key.rect, Qt.AlignmentFlag.AlignCenter, self.key_label(key.name))
+
+    def current_layer(self):
+        """현재 한/영, Shift 상태의 키보드 전체 그림 (처음 한 번만 그림)"""
+        mode = (self.is_hangul, self.is_uppercase)
+        layer = self.layer_cache.get(mode)
+        if layer is not None:
+            return layer
+
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(self.size() * ratio)
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(layer)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setFont(self.key_font)
+        for key in self.painted_keys:
+            self.paint_key(painter, key, False)
+        painter.end()
+
+        self.layer_cache[mode] = layer
+        return layer
+
+    def paintEvent(self, event):
+        if not self.painted_keys:
+            self.layout_keys()
+        painter = QPainter(self)
+        # 바뀐 영역만 캐시에서 복사
+        dirty = event.rect()
+        layer = self.current_layer()
+        ratio = layer.devicePixelRatio()
+        source = QRectF(dirty.x() * ratio, dirty.y() * ratio, dirty.width() * ratio, dirty.height() * ratio)
+        painter.drawPixmap(QRectF(dirty), layer, source)
+        if self.pressed_key is not None and self.pressed_key.rect.intersects(dirty):
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setFont(self.key_font)
+            painter.setClipRect(dirty)
+            # 같은 모양의 키를 눌림 색으로 덮어 그림
+            self.paint_key(painter, self.pressed_key, True)
+        painter.end()
+
+    def resizeEvent(self, event):
+        self.layout_keys()
+        super().resizeEvent(event)
+
+    def update_keyboard_labels(self):
+        # 모드별 그림은 캐시에 있으므로 다시 그리기만 요청
+        self.update()
+
+    # ---- 입력 ----
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+        self.set_pressed(self.key_at(event.position().toPoint()))
+
+    def mouseMoveEvent(self, event):
+        # 누른 채로 키 밖으로 나가면 눌림 해제 (QPushButton과 같음)
+        if self.pressed_key is not None and not self.pressed_key.rect.contains(event.position().toPoint()):
+            self.set_pressed(None)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+        key = self.pressed_key
+        self.set_pressed(None)
+        if key is not None and key.rect.contains(event.position().toPoint()):
+            self.activate(key.name)
+
+    def set_pressed(self, key):
+        if key is self.pressed_key:
+            return
+        if self.pressed_key is not None:
+            self.update(self.pressed_key.rect)
+        self.pressed_key = key
+        if key is not None:
+            self.update(key.rect)
+
+    def activate(self, name):
+        if name == "hangul":
+            self.toggle_hangul()
+        elif name == "shift":
+            self.toggle_shift()
+        elif name == "space":
+            self.space_pressed()
+        elif name == "backspace":
+            self.backspace()
+        elif name == "next":
+            self.next_pressed()
+        else:
+            self.button_clicked(name)
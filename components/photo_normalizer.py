@@ -0,0 +1,78 @@
+import math
+
+from PIL import Image
+from PySide6.QtGui import QImage
+
+EXIF_ORIENTATION = 0x0112
+
+# EXIF Orientation 값 → 똑바로 세우는 변환 (1은 그대로)
+ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+# 가로/세로가 바뀌는 경우 (90도/270도 회전 계열)
+TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+def center_crop_box(width, height, aspect):
+    """(width, height) 이미지에서 가로/세로 비율이 aspect인 가운데 영역 (left, top, right, bottom)"""
+    if width / height > aspect:
+        crop_width = max(1, round(height * aspect))
+        left = (width - crop_width) // 2
+        return (left, 0, left + crop_width, height)
+    crop_height = max(1, round(width / aspect))
+    top = (height - crop_height) // 2
+    return (0, top, width, top + crop_height)
+
+def draft_request(source_size, orientation, target_size):
+    """
+    draft()에 넘길 최소 크기 (저장된 방향 기준)
+
+    회전과 가운데 자르기를 한 뒤에도 target_size 이상이 남도록,
+    자르기에서 버려지는 비율만큼 요청 크기를 키웁니다.
+    """
+    width, height = source_size
+    if orientation in TRANSPOSED_ORIENTATIONS:
+        width, height = height, width
+    target_width, target_height = target_size
+    left, top, right, bottom = center_crop_box(width, height, target_width / target_height)
+    request = (math.ceil(target_width * width / (right - left)),
+               math.ceil(target_height * height / (bottom - top)))
+    if orientation in TRANSPOSED_ORIENTATIONS:
+        request = (request[1], request[0])
+    return request
+
+def to_qimage(img):
+    data = img.tobytes("raw", "RGB")
+    # 버퍼 수명과 분리하기 위해 copy()
+    return QImage(data, img.width, img.height, img.width * 3, QImage.Format.Format_RGB888).copy()
+
+def normalize_photo(source_path, print_path, print_size, preview_size, quality=95):
+    """
+    업로드 사진을 인쇄 영역에 맞게 한 번에 정규화 (워커 스레드에서 호출)
+
+    - JPEG는 draft()로 인쇄 크기에 필요한 만큼만 DCT 단계에서 줄여 읽음 (전체 해상도 디코딩 없음)
+    - EXIF 방향을 적용하고 인쇄 영역(print_size) 비율로 가운데를 자름
+    - 인쇄 크기 JPEG를 print_path에 저장하고, 같은 이미지에서 미리보기 QImage를 만들어 반환
+
+    인쇄 파일이 이미 영역 크기이므로 프린터 DLL이 원본을 다시 리샘플링하지 않습니다.
+    """
+    with Image.open(source_path) as img:
+        orientation = img.getexif().get(EXIF_ORIENTATION, 1)
+        img.draft("RGB", draft_request(img.size, orientation, print_size))
+        img = img.convert("RGB")
+    if orientation in ORIENTATION_TRANSPOSE:
+        img = img.transpose(ORIENTATION_TRANSPOSE[orientation])
+
+    img = img.crop(center_crop_box(img.width, img.height, print_size[0] / print_size[1]))
+    if img.size != tuple(print_size):
+        img = img.resize(print_size, Image.Resampling.LANCZOS)
+    img.save(print_path, format="JPEG", quality=quality)
+
+    preview = img.copy()
+    preview.thumbnail(preview_size, Image.Resampling.LANCZOS)
+    return to_qimage(preview)
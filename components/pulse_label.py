@@ -0,0 +1,136 @@
+from PySide6.QtCore import Qt, QTimer, QElapsedTimer, QEvent, QRect, QSize
+from PySide6.QtGui import QColor, QFontMetrics, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QWidget
+
+class PulseLabel(QWidget):
+    """
+    문구가 천천히 밝아졌다 어두워지는 라벨 (스플래시 대기 화면용)
+
+    QGraphicsOpacityEffect는 매 프레임마다 라벨을 오프스크린 버퍼에 다시 그린 뒤
+    합성하므로, 하루 종일 대기하는 키오스크에서는 CPU를 계속 사용합니다.
+    이 라벨은 문구를 미리 곱해진(premultiplied) 알파의 작은 픽스맵으로 한 번만 그려두고,
+    매 틱마다 자기 영역만 painter 투명도로 다시 칠합니다.
+    - fps로 갱신 빈도를 제한하고, 투명도 단계가 바뀌지 않으면 다시 그리지 않음
+    - 화면이 보이지 않거나(hideEvent) 창이 최소화되면 타이머를 완전히 멈춤
+    """
+
+    def __init__(self, text, color, fps=30, parent=None,
+                 min_opacity=0.3, max_opacity=1.0, half_period=1000):
+        super().__init__(parent)
+        self.text = text
+        self.color = QColor(color)
+        self.min_opacity = min_opacity
+        self.max_opacity = max_opacity
+        self.half_period = half_period  # 한 방향 변화 시간(ms)
+        self.opacity = min_opacity
+        self.cache = None
+        self.cache_size = QSize()
+        self.watched_window = None
+
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.elapsed = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.timeout.connect(self.tick)
+        self.setFps(fps)
+        self.renderCache()
+
+    def setFps(self, fps):
+        self.fps = max(1, int(fps))
+        self.timer.setInterval(1000 // self.fps)
+        # fps만큼만 투명도 단계를 나눠서 같은 단계면 다시 그리지 않음
+        self.levels = max(2, self.fps * self.half_period // 1000)
+
+    def setText(self, text):
+        self.text = text
+        self.renderCache()
+
+    def renderCache(self):
+        """문구를 미리 곱해진 알파 픽스맵으로 그려서 보관"""
+        metrics = QFontMetrics(self.font())
+        rect = metrics.boundingRect(QRect(0, 0, 100000, 100000), Qt.AlignmentFlag.AlignCenter, self.text)
+        self.cache_size = QSize(rect.width() + 2, rect.height() + 2)
+
+        ratio = self.devicePixelRatioF()
+        image = QImage(self.cache_size * ratio, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setFont(self.font())
+        painter.setPen(self.color)
+        painter.drawText(QRect(0, 0, self.cache_size.width(), self.cache_size.height()),
+                         Qt.AlignmentFlag.AlignCenter, self.text)
+        painter.end()
+        self.cache = QPixmap.fromImage(image)
+
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self):
+        return self.cache_size
+
+    def changeEvent(self, event):
+        # 폰트 등록기가 폰트를 바꾸면 픽스맵도 다시 그림
+        if event.type() == QEvent.Type.FontChange:
+            self.renderCache()
+        elif event.type() == QEvent.Type.WindowStateChange:
+            # 라벨 자체가 최상위 창인 경우
+            self.updateTimer()
+        super().changeEvent(event)
+
+    def eventFilter(self, watched, event):
+        # WindowStateChange는 최상위 창에만 전달되므로 창의 이벤트를 지켜봄
+        if watched is self.watched_window and event.type() == QEvent.Type.WindowStateChange:
+            self.updateTimer()
+        return super().eventFilter(watched, event)
+
+    def watchWindow(self):
+        window = self.window()
+        if window is self.watched_window:
+            return
+        if self.watched_window is not None:
+            self.watched_window.removeEventFilter(self)
+        self.watched_window = window
+        if window is not self:
+            window.installEventFilter(self)
+
+    def updateTimer(self):
+        """보이는 동안만 타이머 실행 (창이 최소화되면 멈추고 복원되면 다시 시작)"""
+        if self.isVisible() and not self.window().isMinimized():
+            if not self.timer.isActive():
+                self.timer.start()
+        else:
+            self.timer.stop()
+
+    def showEvent(self, event):
+        self.elapsed.start()
+        self.watchWindow()
+        self.updateTimer()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def tick(self):
+        # 삼각파: min → max (half_period) → min (half_period)
+        phase = self.elapsed.elapsed() % (self.half_period * 2)
+        if phase > self.half_period:
+            phase = self.half_period * 2 - phase
+        level = round(phase * self.levels / self.half_period)
+        opacity = self.min_opacity + (self.max_opacity - self.min_opacity) * level / self.levels
+
+        if opacity != self.opacity:
+            self.opacity = opacity
+            self.update()
+
+    def paintEvent(self, event):
+        if self.cache is None:
+            return
+        painter = QPainter(self)
+        painter.setOpacity(self.opacity)
+        x = (self.width() - self.cache_size.width()) // 2
+        y = (self.height() - self.cache_size.height()) // 2
+        painter.drawPixmap(x, y, self.cache)
+        painter.end()
@@ -0,0 +1,54 @@
+from functools import lru_cache
+
+import numpy as np
+import qrcode
+from PySide6.QtGui import QImage, QPixmap
+from config import config
+
+BOX_SIZE = 10
+BORDER = 4
+
+def qr_matrix(qr_url, border=BORDER, mask_pattern=None):
+    """
+    URL의 QR 모듈 행렬 (테두리 포함, True가 검은 모듈)
+
+    qrcode는 기본적으로 마스크 8개를 모두 만들어 점수를 비교하므로 대부분의 시간이 여기에 듭니다.
+    mask_pattern(0~7, config["qr"]["mask_pattern"])을 지정하면 비교를 건너뜁니다 (어느 마스크든 표준에 맞는 QR).
+    """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=BOX_SIZE,
+        border=border,
+        mask_pattern=mask_pattern,
+    )
+    qr.add_data(qr_url)
+    qr.make(fit=True)
+    return np.array(qr.get_matrix(), dtype=bool)
+
+def render_qr_image(qr_url):
+    """
+    URL을 QR 코드 QImage로 변환 (URL별 캐시)
+
+    PIL 이미지 → PNG 인코딩 → QImage.fromData 디코딩을 거치지 않고,
+    모듈 행렬을 NumPy로 box_size배 확대한 8비트 흑백 버퍼를 바로 QImage로 감쌉니다.
+    이벤트마다 URL이 다르므로 캐시는 같은 이벤트를 다시 그리는 경우(미리 만든 이벤트를 다시 표시 등)만
+    다루도록 작게 두고, 모듈 크기/테두리/마스크까지 키에 넣어 다른 크기의 이미지를 돌려주지 않습니다.
+    """
+    image = cached_qr_image(qr_url, BOX_SIZE, BORDER, config["qr"].get("mask_pattern"))
+    # 암시적 공유 사본이라 호출 측에서 고쳐도 캐시는 바뀌지 않음
+    return QImage(image)
+
+@lru_cache(maxsize=4)
+def cached_qr_image(qr_url, box_size, border, mask_pattern):
+    modules = qr_matrix(qr_url, border, mask_pattern)
+    # 검은 모듈 0, 흰 모듈 255
+    pixels = np.where(modules, np.uint8(0), np.uint8(255))
+    pixels = np.ascontiguousarray(pixels.repeat(box_size, axis=0).repeat(box_size, axis=1))
+    height, width = pixels.shape
+    # QImage는 버퍼를 복사하지 않으므로 copy()로 소유권을 가져옴
+    return QImage(pixels.data, width, height, width, QImage.Format.Format_Grayscale8).copy()
+
+def render_qr_pixmap(qr_url):
+    """URL을 QR 코드 QPixmap으로 변환 (GUI 스레드에서 호출)"""
+    return QPixmap.fromImage(render_qr_image(qr_url))
@@ -0,0 +1,92 @@
+from PySide6.QtGui import QFont, QFontMetricsF
+
+FIT_NONE = 0  # 프린터 DrawText2 option: 0(Nofit), 4(Auto)
+
+class GlyphAdvances:
+    """
+    한 (폰트, 크기)의 글자별 너비 캐시
+
+    글자마다 처음 한 번만 QFontMetricsF로 재고, 이후에는 딕셔너리에서 꺼냅니다.
+    """
+
+    def __init__(self, family, size):
+        font = QFont(family)
+        # 프린터 텍스트 크기는 인쇄 영역(width/height)과 같은 단위이므로 픽셀 크기로 잼
+        font.setPixelSize(max(1, size))
+        self.metrics = QFontMetricsF(font)
+        self.line_height = self.metrics.height()
+        self.advances = {}
+
+    def advance(self, char):
+        width = self.advances.get(char)
+        if width is None:
+            width = self.metrics.horizontalAdvance(char)
+            self.advances[char] = width
+        return width
+
+_advance_cache = {}
+
+def glyph_advances(family, size):
+    """(폰트, 크기)별로 공유하는 GlyphAdvances"""
+    key = (family, size)
+    advances = _advance_cache.get(key)
+    if advances is None:
+        advances = GlyphAdvances(family, size)
+        _advance_cache[key] = advances
+    return advances
+
+class FitResult:
+    def __init__(self, width, font_size, fit_size, fits):
+        self.width = width          # 설정 크기로 인쇄했을 때 글자 너비
+        self.font_size = font_size  # 설정 크기 (output_font_size)
+        self.fit_size = fit_size    # 자동 맞춤(option 4) 후 예상 크기
+        self.fits = fits            # 설정 크기 그대로 영역 안에 들어가는지
+
+class TextFit:
+    """
+    인쇄 영역 하나에 입력 글자가 들어가는지 계산
+
+    글자별 너비를 누적한 목록을 들고 있다가, 새 문자열과 앞부분이 같은 만큼은
+    그대로 쓰고 바뀐 끝부분만 더하므로 키 입력 한 번에 한두 글자만 잽니다.
+    커닝은 계산하지 않으므로 실제 인쇄 너비와 약간 다를 수 있습니다.
+    """
+
+    def __init__(self, family, font_size, width, height, option=4):
+        self.font_size = font_size
+        self.box_width = width
+        self.box_height = height
+        self.option = option
+        self.advances = glyph_advances(family, font_size)
+        self.text = ""
+        self.offsets = [0.0]  # offsets[i] = 앞 i 글자의 너비
+
+    def measure(self, text):
+        """text의 한 줄 너비 (이전 문자열과 같은 앞부분은 다시 재지 않음)"""
+        old = self.text
+        common = 0
+        limit = min(len(old), len(text))
+        while common < limit and old[common] == text[common]:
+            common += 1
+
+        del self.offsets[common + 1:]
+        total = self.offsets[common]
+        for char in text[common:]:
+            total += self.advances.advance(char)
+            self.offsets.append(total)
+        self.text = text
+        return total
+
+    def fit(self, text):
+        width = self.measure(text)
+        # 글자 너비와 줄 높이는 크기에 비례하므로 설정 크기에서 잰 값으로 비율만 계산
+        scale = 1.0
+        if width > self.box_width:
+            scale = self.box_width / width
+        if self.advances.line_height > self.box_height:
+            scale = min(scale, self.box_height / self.advances.line_height)
+        fits = scale >= 1.0
+        if fits or self.option == FIT_NONE:
+            fit_size = self.font_size
+        else:
+            fit_size = max(1, int(self.font_size * scale))
+        return FitResult(width, self.font_size, fit_size, fits)
@@ -1,8 +1,10 @@
 from PySide6.QtWidgets import QWidget, QGridLayout, QPushButton, QVBoxLayout, QSizePolicy
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
-from components.hangul_composer import HangulComposer
-from config import config
+from components.hangul_automaton import HangulAutomaton
+from components.keyboard_input import KeyboardInput, is_hangul_syllable
+from components.keyboard_layout import KeyboardLayout, darken_color
+from config import get_settings
 
 class VirtualKeyboard(QWidget):
     # 기본 한글 매핑
@@ -25,12 +27,24 @@ class VirtualKeyboard(QWidget):
         'N': 'ㅜ', 'M': 'ㅡ'
     }
 
+    compiled_layout = None  # keyboard_layout()에서 처음 한 번 만듦
+
     def __init__(self, input_widget):
         super().__init__()
+        # 글자 수 제한은 키를 누를 때마다 config에서 찾지 않도록 미리 읽어 둠
+        settings = get_settings().keyboard
+        self.max_hangul = settings.max_hangul
+        self.max_uppercase = settings.max_uppercase
+        self.max_lowercase = settings.max_lowercase
+
+        # 입력 문자열과 글자 수 (입력 필드를 바깥에서 바꾸면 textChanged로 다시 맞춤)
+        self.input_model = KeyboardInput()
+        self.applying_input = False
+        self._input_widget = None
         self.input_widget = input_widget
         self.is_hangul = True
         self.is_uppercase = False
-        self.hangul_composer = HangulComposer()
+        self.hangul_composer = HangulAutomaton()
         
         # 제목 표시줄 제거 및 항상 상위에 유지
         self.setWindowFlags(
@@ -42,24 +56,59 @@ class VirtualKeyboard(QWidget):
 
         self.bumper = False
 
+    @property
+    def input_widget(self):
+        return self._input_widget
+
+    @input_widget.setter
+    def input_widget(self, widget):
+        if widget is self._input_widget:
+            return
+        if self._input_widget is not None:
+            self._input_widget.textChanged.disconnect(self.on_input_text_changed)
+        self._input_widget = widget
+        self.input_model.reset(widget.text())
+        widget.textChanged.connect(self.on_input_text_changed)
+
+    def on_input_text_changed(self, text):
+        # 키보드가 아닌 곳에서 바꾼 경우(clear() 등)만 다시 셈
+        if not self.applying_input:
+            self.input_model.reset(text)
+
+    def apply_input(self, remove, append=""):
+        """입력 필드 끝에서 remove 글자를 지우고 append를 붙임"""
+        text = self.input_model.replace_tail(remove, append)
+        self.applying_input = True
+        try:
+            self.input_widget.setText(text)
+        finally:
+            self.applying_input = False
+        return text
+
+    @classmethod
+    def keyboard_layout(cls):
+        """키보드 설정으로 만든 스타일시트와 라벨 표 (프로세스에서 한 번만 만듦)"""
+        if cls.compiled_layout is None:
+            VirtualKeyboard.compiled_layout = KeyboardLayout(
+                get_settings().keyboard, VirtualKeyboard.hangul_map, VirtualKeyboard.shift_hangul_map
+            )
+        return cls.compiled_layout
+
+    @classmethod
+    def reset_layout(cls):
+        """키보드 설정이 바뀐 경우 다음 keyboard_layout()에서 다시 만들도록 비움"""
+        VirtualKeyboard.compiled_layout = None
+
     def initUI(self):
+        layout = self.keyboard_layout()
+        settings = get_settings().keyboard
         self.layout = QVBoxLayout()
         self.layout.setSpacing(5)
-        self.setStyleSheet(f"""
-        VirtualKeyboard {{
-            background-color: {config["keyboard"]["bg_color"]};
-            border: {config["keyboard"]["border_width"]}px solid {config["keyboard"]["border_color"]};
-            border-radius: {config["keyboard"]["border_radius"]}px;
-            padding: {config["keyboard"]["padding"]}px;
-        }}
-        """)
+        # 키 종류별 스타일은 objectName 선택자로 한 스타일시트에 모두 있음 (버튼마다 설정하지 않음)
+        self.setStyleSheet(layout.stylesheet)
+        font = QFont('맑은 고딕', settings.font_size)
             
-        self.keys = [
-            ['1', '2', '3', '4', '5', '6', '7', '8', '9', '0'],
-            ['Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P'],
-            ['A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L'],
-            ['Z', 'X', 'C', 'V', 'B', 'N', 'M']
-        ]
+        self.keys = layout.rows
 
         self.button_widgets = []
         for row in self.keys:
@@ -68,10 +117,10 @@ class VirtualKeyboard(QWidget):
             row_buttons = []
             for i, key in enumerate(row):
                 button = QPushButton(self.get_display_key(key))
+                button.setObjectName("key")
                 button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-                button.setFont(QFont('맑은 고딕', config["keyboard"]["font_size"]))
+                button.setFont(font)
                 button.clicked.connect(lambda checked, text=key: self.button_clicked(text))
-                button.setStyleSheet(self.get_button_style())
                 row_layout.addWidget(button, 0, i)
                 row_buttons.append(button)
             self.layout.addLayout(row_layout)
@@ -82,38 +131,38 @@ class VirtualKeyboard(QWidget):
 
         # 각 버튼 설정
         hangul_btn = QPushButton('한/영')
+        hangul_btn.setObjectName("hangulKey")
         hangul_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        hangul_btn.setFont(QFont('맑은 고딕', config["keyboard"]["font_size"]))
+        hangul_btn.setFont(font)
         hangul_btn.clicked.connect(self.toggle_hangul)
-        hangul_btn.setStyleSheet(self.get_special_button_style(config["keyboard"]["hangul_btn_color"]))
-        hangul_btn.setFixedWidth(config["keyboard"]["special_btn_width"])
+        hangul_btn.setFixedWidth(settings.special_btn_width)
 
         shift_btn = QPushButton('Shift')
+        shift_btn.setObjectName("shiftKey")
         shift_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        shift_btn.setFont(QFont('맑은 고딕', config["keyboard"]["font_size"]))
+        shift_btn.setFont(font)
         shift_btn.clicked.connect(self.toggle_shift)
-        shift_btn.setStyleSheet(self.get_special_button_style(config["keyboard"]["shift_btn_color"]))
-        shift_btn.setFixedWidth(config["keyboard"]["special_btn_width"])
+        shift_btn.setFixedWidth(settings.special_btn_width)
 
         space_btn = QPushButton('Space')
+        space_btn.setObjectName("key")
         space_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        space_btn.setFont(QFont('맑은 고딕', config["keyboard"]["font_size"]))
+        space_btn.setFont(font)
         space_btn.clicked.connect(self.space_pressed)
-        space_btn.setStyleSheet(self.get_button_style())
 
         backspace_btn = QPushButton('←')
+        backspace_btn.setObjectName("backspaceKey")
         backspace_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        backspace_btn.setFont(QFont('맑은 고딕', config["keyboard"]["font_size"]))
+        backspace_btn.setFont(font)
         backspace_btn.clicked.connect(self.backspace)
-        backspace_btn.setStyleSheet(self.get_special_button_style(config["keyboard"]["backspace_btn_color"]))
 
         # 다음 버튼 추가
         next_btn = QPushButton('다음')
+        next_btn.setObjectName("nextKey")
         next_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        next_btn.setFont(QFont('맑은 고딕', config["keyboard"]["font_size"]))
+        next_btn.setFont(font)
         next_btn.clicked.connect(self.next_pressed)
-        next_btn.setStyleSheet(self.get_special_button_style(config["keyboard"]["next_btn_color"]))
-        next_btn.setFixedWidth(config["keyboard"]["special_btn_width"])
+        next_btn.setFixedWidth(settings.special_btn_width)
         
         # 레이아웃에 버튼 추가
         special_layout.addWidget(hangul_btn, 0, 0)
@@ -133,24 +182,22 @@ class VirtualKeyboard(QWidget):
         self.setLayout(self.layout)
 
     def button_clicked(self, key):
-        if self.bumper and self.is_hangul and key in self.hangul_map:
-            current_text = self.input_widget.text() + " "
-        else:
-            current_text = self.input_widget.text()
-        
+        model = self.input_model
+
         if self.is_hangul and key in self.hangul_map:
-            # 현재 텍스트 길이 체크 (완성된 글자 기준)
-            completed_chars = len([c for c in current_text if 0xAC00 <= ord(c) <= 0xD7A3])
-            
-            # 연속된 자음/모음 입력 체크
-            consecutive_jamo = len([c for c in current_text if 0x3131 <= ord(c) <= 0x3163])
-            if consecutive_jamo >= config["keyboard"]["max_hangul"]:
+            # bumper: 영문/공백 뒤 첫 한글이면 끝에 자리 표시용 공백을 두고 조합 글자로 바꿈
+            placeholder = self.bumper
+            length = len(model) + (1 if placeholder else 0)
+            last_char = " " if placeholder else model.last
+
+            # 연속된 자음/모음 입력 체크 (공백은 세지 않으므로 자리 표시와 무관)
+            if model.jamo_count >= self.max_hangul:
                 return
             
-            # 글자 수 초과 시 입력 차단
-            if completed_chars >= config["keyboard"]["max_hangul"] and not (
-                len(current_text) > 0 and 
-                current_text[-1] == self.hangul_composer.current_text and 
+            # 글자 수 초과 시 입력 차단 (완성된 글자 기준)
+            if model.syllable_count >= self.max_hangul and not (
+                length > 0 and 
+                last_char == self.hangul_composer.current_text and 
                 self.hangul_composer.cho and 
                 self.hangul_composer.jung and 
                 not self.hangul_composer.jong
@@ -160,33 +207,26 @@ class VirtualKeyboard(QWidget):
             jamo = self.shift_hangul_map[key] if self.is_uppercase else self.hangul_map[key]
             committed, current = self.hangul_composer.add_jamo(jamo)
             
-            if current_text:
-                if self.hangul_composer.current_text:
-                    new_text = current_text[:-1]
-                else:
-                    new_text = current_text
+            # 조합 중이면 마지막 글자(자리 표시 공백 포함)를 새 조합 결과로 바꿈
+            replace_last = length > 0 and bool(self.hangul_composer.current_text)
+            if placeholder:
+                remove, prefix = 0, ("" if replace_last else " ")
             else:
-                new_text = ""
-            
-            if committed:
-                new_text += committed
-            if current:
-                new_text += current
-                
-            self.input_widget.setText(new_text)
+                remove, prefix = (1 if replace_last else 0), ""
+            new_text = self.apply_input(remove, prefix + (committed or "") + (current or ""))
             self.input_widget.setCursorPosition(len(new_text))
             self.bumper = False
         else:
-            if not self.check_length_limit(current_text):
+            if not self.check_length_limit(len(model)):
                 return
             char = key.upper() if self.is_uppercase else key.lower()
-            self.input_widget.setText(current_text + char)
+            self.apply_input(0, char)
             self.bumper = True
         
     def insert_text(self, char):
         if char:
-            self.input_widget.setText(self.input_widget.text() + char)
-            self.input_widget.setCursorPosition(len(self.input_widget.text()))
+            text = self.apply_input(0, char)
+            self.input_widget.setCursorPosition(len(text))
 
     def toggle_hangul(self):
         self.is_hangul = not self.is_hangul
@@ -203,36 +243,34 @@ class VirtualKeyboard(QWidget):
         self.insert_text(' ')
         self.bumper = True
         
-    def check_length_limit(self, current_text):
+    def check_length_limit(self, current_length):
         """
         문자 수 제한을 확인하는 메서드
         """
-        current_length = len(current_text)
-        
         if self.is_hangul:
             # 항상 종성까지 입력 가능하도록 함
-            return current_length < config["keyboard"]["max_hangul"]
+            return current_length < self.max_hangul
         elif self.is_uppercase:
-            return current_length < config["keyboard"]["max_uppercase"]
+            return current_length < self.max_uppercase
         else:
-            return current_length < config["keyboard"]["max_lowercase"]
+            return current_length < self.max_lowercase
 
     def backspace(self):
-        text = self.input_widget.text()
-        if not text:
+        last_char = self.input_model.last
+        if not last_char:
             return
 
-        last_char = text[-1]
-        is_hangul = 0xAC00 <= ord(last_char) <= 0xD7A3
+        is_hangul = is_hangul_syllable(last_char)
+        # 끝에서 지울 글자 수와 대신 붙일 글자
+        remove, append = 1, ""
 
         try:
             if self.hangul_composer.current_text:
                 current, changed = self.hangul_composer.backspace()
                 if changed:
-                    if len(text) > 0:
-                        text = text[:-1]
-                    if current:
-                        text += current
+                    append = current or ""
+                else:
+                    remove = 0
                 if len(current) == 0:
                     self.bumper = True
             elif is_hangul:
@@ -242,19 +280,15 @@ class VirtualKeyboard(QWidget):
                     jung_idx = ((char_code - jong_idx) // 28) % 21
                     cho_idx = ((char_code - jong_idx) // 28) // 21
                     new_code = 0xAC00 + (cho_idx * 21 + jung_idx) * 28
-                    text = text[:-1] + chr(new_code)
-                else:
-                    text = text[:-1]
+                    append = chr(new_code)
                 self.hangul_composer.reset()
-            else:
-                text = text[:-1]
 
         except AttributeError:
             # CHOSUNG/JUNGSUNG 참조 에러 발생 시 단순히 문자 하나 삭제
-            text = text[:-1]
+            remove, append = 1, ""
             self.hangul_composer.reset()
 
-        self.input_widget.setText(text)
+        text = self.apply_input(remove, append)
         self.input_widget.setCursorPosition(len(text))
 
     def next_pressed(self):
@@ -271,48 +305,16 @@ class VirtualKeyboard(QWidget):
         self.hangul_composer.reset()
             
     def update_keyboard_labels(self):
+        # 한/영, Shift 조합별 라벨 표를 미리 만들어 두었으므로 표만 바꿔 씀
+        labels = self.keyboard_layout().labels[(self.is_hangul, self.is_uppercase)]
         for row_buttons, row_keys in zip(self.button_widgets, self.keys):
             for button, key in zip(row_buttons, row_keys):
-                if self.is_hangul:
-                    if self.is_uppercase and key in self.shift_hangul_map:
-                        button.setText(self.shift_hangul_map[key])
-                    else:
-                        button.setText(self.hangul_map.get(key, key))
-                else:
-                    button.setText(key.upper() if self.is_uppercase else key.lower())
+                button.setText(labels[key])
 
     def get_display_key(self, key):
         if self.is_uppercase:
             return key.upper()
         return key.lower()
 
-    def get_button_style(self):
-        return f"""
-            QPushButton {{
-                background-color: {config["keyboard"]["button_bg_color"]};
-                color: {config["keyboard"]["button_text_color"]};
-                border: none;
-                border-radius: {config["keyboard"]["button_radius"]}px;
-            }}
-            QPushButton:pressed {{
-                background-color: {config["keyboard"]["button_pressed_color"]};
-            }}
-        """
-
-    def get_special_button_style(self, color):
-        return f"""
-            QPushButton {{
-                background-color: {color};
-                color: {config["keyboard"]["button_text_color"]};
-                border: none;
-                border-radius: {config["keyboard"]["button_radius"]}px;
-            }}
-            QPushButton:pressed {{
-                background-color: {self.darken_color(color)};
-            }}
-        """
-
     def darken_color(self, color):
-        # 색상 코드가 #RRGGBB 형식이라고 가정
-        r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
-        return f'#{max(0, r-30):02X}{max(0, g-30):02X}{max(0, b-30):02X}'
\ No newline at end of file
+        return darken_color(color)
@@ -1,6 +1,7 @@
 import os
 import sys
 import json
+from config_schema import compile_settings
 
 def get_config_path():
     """설정 파일 경로 반환"""
@@ -35,4 +36,41 @@ if not config_path:
     raise FileNotFoundError("설정 파일(config.json)을 찾을 수 없습니다.")
 
 with open(config_path, 'r', encoding='utf-8') as f:
-    config = json.load(f)
\ No newline at end of file
+    config = json.load(f)
+
+# 검증된 읽기 전용 설정 (잘못된 값이면 여기서 ConfigError로 바로 실패)
+settings = compile_settings(config)
+
+def get_settings():
+    """현재 Settings (config_schema.Settings)"""
+    return settings
+
+# 다시 시작해야 적용되는 섹션 (창 크기, 서버 연결/이벤트 풀)
+RESTART_SECTIONS = ("screen_size", "qr", "server_url")
+
+def apply_config(new_config):
+    """
+    새 설정 딕셔너리로 교체 (설정 파일 다시 읽기용)
+
+    먼저 검증하므로 잘못된 설정이면 ConfigError가 나고 기존 설정은 그대로 남습니다.
+    config 딕셔너리는 같은 객체를 유지한 채 내용만 바꿔서 import해 둔 곳에서도 새 값을 봅니다.
+    RESTART_SECTIONS는 실행 중에 바꾸면 화면/연결 상태와 어긋나므로 다시 시작할 때까지 기존 값을 유지합니다.
+    """
+    global settings
+    new_config = dict(new_config)
+    for key in RESTART_SECTIONS:
+        if key in config:
+            new_config[key] = config[key]
+        else:
+            new_config.pop(key, None)
+    new_settings = compile_settings(new_config)
+    config.clear()
+    config.update(new_config)
+    settings = new_settings
+    return settings
+
+def refresh_settings():
+    """config 딕셔너리를 코드에서 바꾼 뒤 Settings를 다시 만듦 (도구/테스트용)"""
+    global settings
+    settings = compile_settings(config)
+    return settings
@@ -0,0 +1,152 @@
+import re
+import types
+from dataclasses import dataclass, fields, MISSING
+from typing import get_args, get_origin
+
+HEX_COLOR = re.compile(r"^#[0-9A-Fa-f]{6}$")
+SCREEN_INDICES = range(6)  # 0 스플래시 ~ 5 완료
+
+class ConfigError(ValueError):
+    """config.json 값이 잘못된 경우 (경로와 이유를 메시지에 포함)"""
+
+    def __init__(self, path, reason):
+        super().__init__(f"설정 오류 {path}: {reason}")
+        self.path = path
+        self.reason = reason
+
+@dataclass(frozen=True, slots=True)
+class Size:
+    width: int
+    height: int
+
+@dataclass(frozen=True, slots=True)
+class Area:
+    x: int
+    y: int
+    width: int
+    height: int
+
+@dataclass(frozen=True, slots=True)
+class CameraCountSettings:
+    number: int
+    font_size: int
+    font_color: str
+
+@dataclass(frozen=True, slots=True)
+class KeyboardSettings:
+    x: int
+    y: int
+    width: int
+    height: int
+    bg_color: str
+    border_color: str
+    border_width: int
+    border_radius: int
+    padding: int
+    font_size: int
+    button_bg_color: str
+    button_text_color: str
+    button_pressed_color: str
+    button_radius: int
+    hangul_btn_color: str
+    shift_btn_color: str
+    backspace_btn_color: str
+    next_btn_color: str
+    special_btn_width: int
+    max_hangul: int
+    max_lowercase: int
+    max_uppercase: int
+    renderer: str = "painted"
+
+    def validate(self, path):
+        # 특수 키 눌림 색은 darken_color로 계산하므로 #RRGGBB 형식만 가능
+        for name in ("hangul_btn_color", "shift_btn_color", "backspace_btn_color", "next_btn_color"):
+            if not HEX_COLOR.match(getattr(self, name)):
+                raise ConfigError(f"{path}.{name}", "#RRGGBB 형식의 색상이어야 합니다")
+        if self.renderer not in ("painted", "buttons"):
+            raise ConfigError(f"{path}.renderer", '"painted" 또는 "buttons"여야 합니다')
+
+@dataclass(frozen=True, slots=True)
+class PrinterSettings:
+    print_mode: bool = False
+    panel_id: int = 1
+    stats_file: str | None = None  # None이면 기본 파일, ""이면 기록하지 않음
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    config.json에서 자주 읽는 설정을 검증해서 만든 읽기 전용 객체
+
+    키 입력, 카메라 프레임, 인쇄처럼 자주 도는 코드는 딕셔너리 대신 이 속성을 읽습니다.
+    여기 없는 섹션(qr, splash 등)은 그대로 config 딕셔너리에서 읽습니다.
+    """
+    app_name: str
+    screen_size: Size
+    camera_size: Size
+    crop_area: Area
+    frame: Area
+    camera_count: CameraCountSettings
+    screen_order: tuple[int, ...]
+    keyboard: KeyboardSettings
+    printer: PrinterSettings = PrinterSettings()
+
+    def validate(self, path):
+        if not self.screen_order:
+            raise ConfigError(f"{path}.screen_order", "화면이 하나 이상 있어야 합니다")
+        for i, index in enumerate(self.screen_order):
+            if index not in SCREEN_INDICES:
+                raise ConfigError(f"{path}.screen_order[{i}]", f"알 수 없는 화면 번호 {index}")
+
+def convert(value_type, value, path):
+    """JSON 값을 value_type으로 검사/변환"""
+    origin = get_origin(value_type)
+    if origin is types.UnionType:
+        # X | None
+        if value is None and type(None) in get_args(value_type):
+            return None
+        inner = [t for t in get_args(value_type) if t is not type(None)][0]
+        return convert(inner, value, path)
+    if origin is tuple:
+        if not isinstance(value, list):
+            raise ConfigError(path, "목록이어야 합니다")
+        item_type = get_args(value_type)[0]
+        return tuple(convert(item_type, item, f"{path}[{i}]") for i, item in enumerate(value))
+    if hasattr(value_type, "__dataclass_fields__"):
+        return build(value_type, value, path)
+    if value_type is bool:
+        if not isinstance(value, bool):
+            raise ConfigError(path, "true 또는 false여야 합니다")
+        return value
+    if value_type is int:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ConfigError(path, "정수여야 합니다")
+        return value
+    if value_type is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ConfigError(path, "숫자여야 합니다")
+        return float(value)
+    if value_type is str:
+        if not isinstance(value, str):
+            raise ConfigError(path, "문자열이어야 합니다")
+        return value
+    raise TypeError(f"지원하지 않는 설정 타입: {value_type}")
+
+def build(cls, data, path):
+    """딕셔너리를 cls 데이터클래스로 변환 (모르는 키는 무시, 빠진 키는 기본값)"""
+    if not isinstance(data, dict):
+        raise ConfigError(path, "객체여야 합니다")
+    values = {}
+    for field in fields(cls):
+        field_path = f"{path}.{field.name}"
+        if field.name in data:
+            values[field.name] = convert(field.type, data[field.name], field_path)
+        elif field.default is MISSING:
+            raise ConfigError(field_path, "필수 설정이 없습니다")
+    settings = cls(**values)
+    if hasattr(settings, "validate"):
+        settings.validate(path)
+    return settings
+
+def compile_settings(config):
+    """config.json 딕셔너리 전체를 검증해서 Settings로 변환 (잘못되면 ConfigError)"""
+    return build(Settings, config, "config")
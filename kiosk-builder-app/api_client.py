@@ -1,7 +1,10 @@
 ### api_client.py
 import requests
+from utils.outbound_queue import get_outbound_queue
 
 BASE_URL = "https://port-0-kiosk-builder-m47pn82w3295ead8.sel4.cloudtype.app"
+# 응답이 없을 때 로그인 화면이 멈춰 있지 않도록 하는 제한 시간(초)
+REQUEST_TIMEOUT = 10
 
 def login(login_id: str, password: str) -> tuple[bool, str, int]:
     """
@@ -19,7 +22,7 @@ def login(login_id: str, password: str) -> tuple[bool, str]:
     url = f"{BASE_URL}/api/auth/login"
     payload = {"login_id": login_id, "password": password}
     try:
-        response = requests.post(url, json=payload)
+        response = requests.post(url, json=payload, timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             # 로그인 성공 시 사용자 ID 반환 추가
             user_data = response.json()
@@ -28,19 +31,24 @@ def login(login_id: str, password: str) -> tuple[bool, str]:
         else:
             detail = response.json().get("detail", "로그인 실패")
             return False, detail, 0
+    except requests.Timeout:
+        return False, "서버 응답이 없습니다. 네트워크 연결을 확인해 주세요.", 0
     except Exception as e:
         return False, f"서버 통신 실패: {e}", 0
 
 def log_distribution_creation(user_id: int, app_name: str) -> tuple[bool, str]:
     """
     배포용 생성 액션을 로그에 기록하는 함수
+
+    바로 보내지 않고 전송 대기열에 넣으므로 네트워크가 끊겨 있어도 기다리지 않으며,
+    연결이 돌아오면 백그라운드에서 전송됩니다.
     
     Args:
         user_id: 사용자 ID
         app_name: 앱 이름
         
     Returns:
-        tuple: (성공 여부, 메시지)
+        tuple: (성공 여부, 메시지) - 대기열에 넣은 결과
     """
     url = f"{BASE_URL}/api/logs/create"
     payload = {
@@ -50,11 +58,7 @@ def log_distribution_creation(user_id: int, app_name: str) -> tuple[bool, str]:
     }
     
     try:
-        response = requests.post(url, json=payload)
-        if response.status_code == 200:
-            return True, "로그 기록 성공"
-        else:
-            detail = response.json().get("detail", "로그 기록 실패")
-            return False, detail
+        get_outbound_queue().enqueue(url, payload)
+        return True, "로그 전송 대기열에 추가"
     except Exception as e:
-        return False, f"서버 통신 실패: {e}"
+        return False, f"로그 대기열 저장 실패: {e}"
@@ -7,6 +7,7 @@ from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtNetwork import QLocalServer, QLocalSocket
 from PySide6.QtGui import QIcon
 from ui.screens.login_screen import LoginScreen
+from utils.outbound_queue import get_outbound_queue
 
 # 애플리케이션 중복 실행 방지 클래스
 class SingleApplication(QApplication):
@@ -78,6 +79,9 @@ if __name__ == "__main__":
     # 애플리케이션 이름 설정 (작업 표시줄에 표시됨)
     app.setApplicationName("슈퍼 키오스크")
 
+    # 지난 실행에서 보내지 못한 로그 전송
+    get_outbound_queue().start()
+
     login_window = LoginScreen(on_login_success=show_settings_window)
     
     # 로그인 창에도 아이콘 적용
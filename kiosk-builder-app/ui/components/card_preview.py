@@ -0,0 +1,217 @@
+import os
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QColor, QFont, QFontDatabase, QFontMetricsF, QPainter, QPen, QPixmap
+from .change_tracker import field_values, value_changed_signal
+from ..styles.colors import COLORS
+
+# 인쇄 카드 전체 크기 (px, BaseTab 안내 문구와 같음)
+CARD_WIDTH = 635
+CARD_HEIGHT = 1027
+
+# 항목 종류별 자리 표시 색상 (이미지 파일이 없거나 사진/QR처럼 실행 중에 정해지는 항목)
+PLACEHOLDER_COLORS = {
+    "image": "#B0BEC5",
+    "photo": "#81D4FA",
+    "qr": "#A5D6A7",
+    "text_input": "#FFE082",
+}
+PLACEHOLDER_LABELS = {
+    "photo": "촬영 사진",
+    "qr": "QR 업로드 사진",
+}
+
+_font_families = {}
+
+def font_family(file_name):
+    """resources/font의 폰트 파일을 한 번만 등록하고 패밀리 이름을 캐시"""
+    if not file_name:
+        return ""
+    family = _font_families.get(file_name)
+    if family is None:
+        family = ""
+        path = os.path.join("resources", "font", file_name)
+        if os.path.exists(path):
+            font_id = QFontDatabase.addApplicationFont(path)
+            families = QFontDatabase.applicationFontFamilies(font_id) if font_id != -1 else []
+            if families:
+                family = families[0]
+        _font_families[file_name] = family
+    return family
+
+class PreviewItem:
+    def __init__(self, kind, data):
+        self.kind = kind
+        self.data = data
+        self.layer = None  # 항목 크기로 그린 QPixmap (위치만 바뀌면 다시 쓰임)
+
+    def card_rect(self):
+        return QRect(self.data.get("x", 0), self.data.get("y", 0),
+                     self.data.get("width", 0), self.data.get("height", 0))
+
+class CardPreview(QWidget):
+    """
+    카드 인쇄 배치 미리보기
+
+    고정 이미지, 문구, 촬영 사진, QR 사진, 사용자 입력 영역을 카드 위에 그립니다.
+    항목마다 그림(QPixmap)을 캐시해 두고 paintEvent에서는 복사만 하므로,
+    값 하나를 바꾸면 그 항목만 다시 그립니다 (x/y만 바뀌면 다시 그리지 않고 옮기기만 함).
+    항목은 그룹("images", "texts" 등) 단위로 set_items()로 넣고, 설정 탭의 입력 필드는
+    bind_fields()로 연결합니다.
+    """
+
+    # 그리는 순서 (프린터와 같이 이미지 다음 문구)
+    GROUPS = ("photo", "qr_uploaded_image", "images", "texts", "text_input")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.groups = {group: [] for group in self.GROUPS}  # 그룹 이름 -> [PreviewItem]
+        self.scale = 1.0
+        self.card_area = QRect()
+        self.setMinimumSize(CARD_WIDTH // 3, CARD_HEIGHT // 3)
+
+    # ---- 항목 ----
+
+    def set_items(self, group, items):
+        """그룹 항목 전체 교체 [(kind, data), ...] (내용이 같은 항목은 캐시 유지)"""
+        old_items = self.groups.get(group, [])
+        new_items = []
+        dirty = QRect()
+        for i, (kind, data) in enumerate(items):
+            old = old_items[i] if i < len(old_items) else None
+            if old is not None and old.kind == kind and old.data == data:
+                new_items.append(old)
+                continue
+            new_items.append(PreviewItem(kind, dict(data)))
+            dirty = dirty.united(self.to_widget(new_items[-1].card_rect()))
+            if old is not None:
+                dirty = dirty.united(self.to_widget(old.card_rect()))
+        for old in old_items[len(items):]:
+            dirty = dirty.united(self.to_widget(old.card_rect()))
+        self.groups[group] = new_items
+        self.update(dirty.adjusted(-2, -2, 2, 2))
+
+    def update_item(self, group, index, data):
+        """항목 하나의 값 변경 (바뀐 항목만 다시 그림)"""
+        items = self.groups.get(group, [])
+        if index >= len(items):
+            return
+        item = items[index]
+        if item.data == data:
+            return
+        old_rect = self.to_widget(item.card_rect())
+        moved_only = all(item.data.get(key) == data.get(key)
+                         for key in item.data.keys() | data.keys() if key not in ("x", "y"))
+        item.data = dict(data)
+        if not moved_only:
+            item.layer = None
+        self.update(old_rect.united(self.to_widget(item.card_rect())).adjusted(-2, -2, 2, 2))
+
+    # ---- 좌표 ----
+
+    def to_widget(self, rect):
+        """카드 좌표 -> 위젯 좌표"""
+        # 크기는 위치와 따로 반올림 (위치만 바뀌면 캐시한 그림 크기와 같도록)
+        return QRect(self.card_area.x() + round(rect.x() * self.scale),
+                     self.card_area.y() + round(rect.y() * self.scale),
+                     round(rect.width() * self.scale),
+                     round(rect.height() * self.scale))
+
+    def resizeEvent(self, event):
+        self.scale = min(self.width() / CARD_WIDTH, self.height() / CARD_HEIGHT)
+        width, height = round(CARD_WIDTH * self.scale), round(CARD_HEIGHT * self.scale)
+        self.card_area = QRect((self.width() - width) // 2, (self.height() - height) // 2, width, height)
+        # 배율이 바뀌면 모든 항목을 새 크기로 다시 그려야 함
+        for items in self.groups.values():
+            for item in items:
+                item.layer = None
+        super().resizeEvent(event)
+
+    # ---- 그리기 ----
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setClipRect(event.rect())
+        painter.fillRect(self.card_area, QColor("white"))
+        painter.setPen(QPen(QColor(COLORS['border']), 1))
+        painter.drawRect(self.card_area.adjusted(0, 0, -1, -1))
+        painter.setClipRect(self.card_area.intersected(event.rect()))
+        for items in self.groups.values():
+            for item in items:
+                target = self.to_widget(item.card_rect())
+                if target.isEmpty() or not target.intersects(event.rect()):
+                    continue
+                if item.layer is None:
+                    item.layer = self.render_item(item, target.size())
+                painter.drawPixmap(target.topLeft(), item.layer)
+        painter.end()
+
+    def render_item(self, item, size):
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(size * ratio)
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(layer)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        rect = QRect(0, 0, size.width(), size.height())
+
+        data = item.data
+        if item.kind == "image":
+            pixmap = QPixmap(os.path.join("resources", data.get("filename", "")))
+            if pixmap.isNull():
+                self.paint_placeholder(painter, rect, item.kind, data.get("filename", ""))
+            else:
+                painter.drawPixmap(rect, pixmap)
+        elif item.kind == "text":
+            self.paint_text(painter, rect, data.get("content", "").replace("\\n", "\n"), data.get("font", ""),
+                            data.get("font_size", 16), data.get("font_color", "#000000"))
+        elif item.kind == "text_input":
+            self.paint_placeholder(painter, rect, item.kind, "", dashed=True)
+            sample = data.get("placeholder") or data.get("label") or "입력 문구"
+            self.paint_text(painter, rect, sample, data.get("output_font", ""),
+                            data.get("output_font_size", 16), data.get("output_font_color", "#000000"))
+        else:
+            self.paint_placeholder(painter, rect, item.kind, PLACEHOLDER_LABELS.get(item.kind, ""))
+        painter.end()
+        return layer
+
+    def paint_placeholder(self, painter, rect, kind, label, dashed=False):
+        color = QColor(PLACEHOLDER_COLORS.get(kind, "#CCCCCC"))
+        fill = QColor(color)
+        fill.setAlpha(110)
+        painter.fillRect(rect, fill)
+        pen = QPen(color.darker(130), 1)
+        if dashed:
+            pen.setStyle(Qt.PenStyle.DashLine)
+        painter.setPen(pen)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        if label:
+            painter.setPen(QColor(COLORS['text_dark']))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, label)
+
+    def paint_text(self, painter, rect, text, font_file, font_size, color):
+        font = QFont(font_family(font_file) or "맑은 고딕")
+        # 프린터 글자 크기는 카드 좌표 단위이므로 배율만 곱함
+        font.setPixelSize(max(1, round(font_size * self.scale)))
+        # 프린터 자동 맞춤(option 4)처럼 영역보다 크면 줄여서 그림
+        metrics = QFontMetricsF(font)
+        lines = text.split("\n") or [""]
+        width = max(metrics.horizontalAdvance(line) for line in lines)
+        height = metrics.height() * len(lines)
+        shrink = min(1.0, rect.width() / width if width else 1.0, rect.height() / height if height else 1.0)
+        if shrink < 1.0:
+            font.setPixelSize(max(1, int(font.pixelSize() * shrink)))
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+def bind_fields(preview, group, index, fields):
+    """입력 필드가 바뀔 때마다 해당 항목만 갱신되도록 연결"""
+    def refresh(*args):
+        preview.update_item(group, index, field_values(fields))
+    for widget in fields.values():
+        signal = value_changed_signal(widget)
+        if signal is not None:
+            signal.connect(refresh)
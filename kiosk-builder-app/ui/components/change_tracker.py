@@ -0,0 +1,215 @@
+import copy
+from contextlib import contextmanager
+
+from PySide6.QtWidgets import QLineEdit, QComboBox, QSpinBox
+from PySide6.QtCore import QObject, Signal
+from .color_picker import ColorPickerButton
+
+MISSING = object()
+
+# ---- 입력 위젯 값 읽기/쓰기 ----
+
+def widget_value(widget):
+    """입력 위젯의 현재 값 (config.json에 저장되는 형태)"""
+    if isinstance(widget, ColorPickerButton):
+        return widget.color
+    if isinstance(widget, QComboBox):
+        return widget.currentData()
+    if hasattr(widget, "value"):
+        return widget.value()
+    return widget.text()
+
+def set_widget_value(widget, value):
+    if isinstance(widget, ColorPickerButton):
+        widget.update_color(value)
+    elif isinstance(widget, QComboBox):
+        index = widget.findData(value)
+        if index != -1:
+            widget.setCurrentIndex(index)
+    elif hasattr(widget, "setValue"):
+        widget.setValue(value)
+    else:
+        widget.setText(value)
+
+def value_changed_signal(widget):
+    if isinstance(widget, ColorPickerButton):
+        return widget.color_changed
+    if isinstance(widget, QComboBox):
+        return widget.currentIndexChanged
+    if isinstance(widget, QSpinBox):
+        return widget.valueChanged
+    if isinstance(widget, QLineEdit):
+        return widget.textChanged
+    return None
+
+def field_values(fields):
+    """설정 탭 입력 필드 묶음에서 현재 값 읽기"""
+    return {key: widget_value(widget) for key, widget in fields.items()}
+
+# ---- JSON 경로 ----
+
+def get_path(data, path):
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return MISSING
+    return data
+
+def set_path(data, path, value):
+    """path 위치에 value 쓰기 (중간 객체가 없으면 만들고, 목록은 끝에만 추가 가능)"""
+    for key, next_key in zip(path, path[1:]):
+        if isinstance(data, list):
+            if key == len(data):
+                data.append({})
+            data = data[key]
+        else:
+            if not isinstance(data.get(key), (dict, list)):
+                data[key] = [] if isinstance(next_key, int) else {}
+            data = data[key]
+    key = path[-1]
+    if isinstance(data, list) and key == len(data):
+        data.append(value)
+    else:
+        data[key] = value
+
+def diff_paths(old, new, path=()):
+    """두 설정에서 값이 다른 가장 깊은 경로들 (목록 길이가 다르면 목록 경로)"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            yield from diff_paths(old.get(key, MISSING), new.get(key, MISSING), path + (key,))
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from diff_paths(old_item, new_item, path + (i,))
+    elif old is MISSING or new is MISSING or old != new:
+        yield path
+
+def is_under(path, prefix):
+    return path[:len(prefix)] == prefix
+
+class ChangeTracker(QObject):
+    """
+    설정 탭 입력 변경 추적
+
+    입력 위젯이 바뀔 때마다 ("texts", "items", 3, "x") 같은 JSON 경로와 값을 패치로 기록하고,
+    저장할 때는 모든 탭이 섹션 전체를 다시 쓰는 대신 기록된 패치만 config에 적용합니다.
+    저장된 값과 같아진 패치는 지우므로 탭의 변경 표시는 실제로 다른 값이 있을 때만 남습니다.
+    다시 로드할 때는 파일에서 바뀐 경로와 저장하지 않은 패치 경로의 위젯만 새 값으로 바꾸고,
+    위젯이 연결되지 않은 경로(항목 개수 변경 등)만 해당 탭의 update_ui로 다시 채웁니다.
+    """
+    dirty_changed = Signal(object, bool)  # 탭, 저장하지 않은 변경 여부
+
+    def __init__(self, config, parent=None):
+        super().__init__(parent)
+        self.config = config  # 마지막으로 저장/로드한 설정 (비교 기준, 제자리에서 갱신)
+        self.patches = {}     # 경로 -> (탭, 값)
+        self.bindings = {}    # 경로 -> (탭, 위젯)
+        self.owners = {}      # 최상위 섹션 이름 -> 탭
+        self.dirty_tabs = set()
+        self.suspended = 0
+
+    @contextmanager
+    def suspend(self):
+        """코드에서 위젯 값을 채우는 동안 변경 기록 중지"""
+        self.suspended += 1
+        try:
+            yield
+        finally:
+            self.suspended -= 1
+
+    # ---- 연결 ----
+
+    def own(self, tab, *sections):
+        """위젯으로 연결하지 않은 섹션도 다시 로드할 때 tab이 채우도록 등록"""
+        for section in sections:
+            self.owners[section] = tab
+
+    def bind(self, tab, path, widget):
+        """위젯 하나를 경로에 연결 (값이 바뀌면 패치 기록)"""
+        self.bindings[path] = (tab, widget)
+        self.owners.setdefault(path[0], tab)
+        signal = value_changed_signal(widget)
+        if signal is not None:
+            signal.connect(lambda *args: self.record(tab, path, widget_value(widget)))
+
+    def bind_fields(self, tab, prefix, fields):
+        for key, widget in fields.items():
+            self.bind(tab, prefix + (key,), widget)
+
+    def bind_items(self, tab, prefix, fields_list):
+        """항목 목록 위젯을 새로 만든 뒤 다시 연결 (개수가 바뀌면 목록 전체를 패치로 기록)"""
+        for path in [path for path in self.bindings if is_under(path, prefix)]:
+            del self.bindings[path]
+        for i, fields in enumerate(fields_list):
+            self.bind_fields(tab, prefix + (i,), fields)
+        if self.suspended:
+            return
+        for path in [path for path in self.patches if is_under(path, prefix)]:
+            del self.patches[path]
+        items = [field_values(fields) for fields in fields_list]
+        if items != get_path(self.config, prefix):
+            self.patches[prefix] = (tab, items)
+        self.update_dirty()
+
+    # ---- 패치 ----
+
+    def record(self, tab, path, value):
+        if self.suspended:
+            return
+        # 상위 경로(목록 전체) 패치가 있으면 그 값이 오래됐을 수 있으므로 하위 패치를 항상 남김
+        has_parent = any(path[:i] in self.patches for i in range(1, len(path)))
+        if value == get_path(self.config, path) and not has_parent:
+            self.patches.pop(path, None)
+        else:
+            self.patches[path] = (tab, value)
+        self.update_dirty()
+
+    def apply(self, config):
+        """기록된 패치만 config에 적용 (상위 경로부터), 적용한 패치 수 반환"""
+        for path in sorted(self.patches, key=len):
+            set_path(config, path, copy.deepcopy(self.patches[path][1]))
+        return len(self.patches)
+
+    def clear(self):
+        """저장이 끝나면 패치를 비우고 변경 표시 해제"""
+        self.patches.clear()
+        self.update_dirty()
+
+    def is_dirty(self, tab):
+        return tab in self.dirty_tabs
+
+    def update_dirty(self):
+        dirty_tabs = {tab for tab, value in self.patches.values()}
+        for tab in dirty_tabs ^ self.dirty_tabs:
+            self.dirty_changed.emit(tab, tab in dirty_tabs)
+        self.dirty_tabs = dirty_tabs
+
+    # ---- 다시 로드 ----
+
+    def reload(self, new_config):
+        """config 내용을 new_config로 바꾸고 바뀐 필드만 UI에 반영"""
+        paths = set(diff_paths(self.config, new_config)) | set(self.patches)
+        self.config.clear()
+        self.config.update(new_config)
+        self.patches.clear()
+        self.update_dirty()
+        with self.suspend():
+            self.refresh(paths)
+
+    def refresh(self, paths):
+        full_tabs = []
+        fields = []
+        for path in paths:
+            binding = self.bindings.get(path)
+            value = get_path(self.config, path)
+            if binding is None or value is MISSING:
+                tab = self.owners.get(path[0]) if path else None
+                if tab is not None and tab not in full_tabs:
+                    full_tabs.append(tab)
+            else:
+                fields.append((binding, value))
+        for (tab, widget), value in fields:
+            if tab not in full_tabs:
+                set_widget_value(widget, value)
+        for tab in full_tabs:
+            tab.update_ui(self.config)
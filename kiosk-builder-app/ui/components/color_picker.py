@@ -1,7 +1,10 @@
 from PySide6.QtWidgets import QPushButton, QColorDialog
+from PySide6.QtCore import Signal
 from PySide6.QtGui import QColor
 
 class ColorPickerButton(QPushButton):
+    color_changed = Signal(str)
+
     def __init__(self, color="#000000", parent=None):
         super().__init__(parent)
         self.color = color
@@ -12,6 +15,7 @@ class ColorPickerButton(QPushButton):
     def update_color(self, color):
         self.color = color
         self.setStyleSheet(f"background-color: {color}; min-width: 40px; min-height: 25px;")
+        self.color_changed.emit(color)
 
     def pick_color(self):
         color = QColorDialog.getColor(QColor(self.color), self)
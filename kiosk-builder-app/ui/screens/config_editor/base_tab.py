@@ -3,11 +3,14 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QLabel
 from PySide6.QtCore import Qt
 from ui.styles.colors import COLORS
+from ui.components.card_preview import bind_fields, field_values
 
 class BaseTab(QWidget):
     def __init__(self, config):
         super().__init__()
         self.config = config
+        self.preview = None  # 카드 미리보기 (attach_preview로 연결)
+        self.tracker = None  # 변경 추적 (attach_tracker로 연결)
         
     def create_tab_with_scroll(self):
         """스크롤 영역이 있는 탭 기본 구조 생성"""
@@ -45,6 +48,47 @@ class BaseTab(QWidget):
         
         return content_layout
     
+    def attach_preview(self, preview):
+        """카드 미리보기 연결 (인쇄 항목이 있는 탭은 bind_preview_items 구현)"""
+        self.preview = preview
+        self.bind_preview_items()
+
+    def bind_preview_items(self):
+        """인쇄 항목 입력 필드를 미리보기에 연결 (하위 클래스에서 구현)"""
+        pass
+
+    def show_preview_items(self, group, kind, fields_list):
+        """입력 필드 묶음 목록을 미리보기 그룹으로 표시하고 값이 바뀌면 해당 항목만 갱신"""
+        if self.preview is None:
+            return
+        self.preview.set_items(group, [(kind, field_values(fields)) for fields in fields_list])
+        for i, fields in enumerate(fields_list):
+            bind_fields(self.preview, group, i, fields)
+
+    def attach_tracker(self, tracker):
+        """변경 추적 연결 (하위 클래스는 bind_tracked_fields 구현)"""
+        self.tracker = tracker
+        self.bind_tracked_fields()
+
+    def bind_tracked_fields(self):
+        """입력 필드를 config 경로에 연결 (하위 클래스에서 구현)"""
+        pass
+
+    def track_fields(self, section, fields):
+        """입력 필드 묶음을 config[section][key] 경로에 연결"""
+        if self.tracker is not None:
+            self.tracker.bind_fields(self, (section,), fields)
+
+    def track_items(self, section, fields_list):
+        """항목 입력 필드 목록을 config[section]["items"][i][key] 경로에 연결"""
+        if self.tracker is not None:
+            self.tracker.bind_items(self, (section, "items"), fields_list)
+
+    def record_change(self, path, value):
+        """위젯 하나로 연결할 수 없는 값의 변경 기록"""
+        if self.tracker is not None:
+            self.tracker.record(self, path, value)
+
     def update_ui(self, config):
         """설정에 따라 UI 업데이트 (하위 클래스에서 구현)"""
         pass
@@ -306,6 +306,23 @@ class BasicTab(BaseTab):
         
         # UI 업데이트
         self.image_items_container.updateGeometry()
+        self.bind_preview_items()
+        self.track_items("images", self.image_item_fields)
+
+    def bind_preview_items(self):
+        self.show_preview_items("images", "image", self.image_item_fields)
+
+    def bind_tracked_fields(self):
+        self.tracker.bind(self, ("app_name",), self.app_name_edit)
+        self.track_fields("screen_size", {"width": self.screen_width_edit, "height": self.screen_height_edit})
+        self.track_fields("crop_area", self.crop_fields)
+        self.track_fields("printer", {"panel_id": self.panel_combo})
+        self.track_fields("images", {"count": self.image_count_spinbox})
+        self.track_items("images", self.image_item_fields)
+        # 화면 순서, 카메라 해상도, 인쇄 모드는 아래 핸들러에서 직접 기록
+        self.tracker.own(self, "screen_order", "camera_size")
+        self.print_mode_radio.toggled.connect(
+            lambda checked: self.record_change(("printer", "print_mode"), checked))
     
     def on_screen_order_changed(self):
         """화면 순서가 변경되었을 때 호출되는 메소드"""
@@ -318,7 +335,7 @@ class BasicTab(BaseTab):
                 # 변경된 값을 config에 업데이트
                 try:
                     screen_order = [int(x.strip()) for x in screen_order_text.split(",")]
-                    self.config["screen_order"] = screen_order
+                    self.record_change(("screen_order",), screen_order)
                     
                     # 메인 윈도우의 update_tab_enabled_states 메서드 호출
                     # self가 BasicTab 인스턴스이므로 부모 윈도우를 찾아야 함
@@ -337,8 +354,8 @@ class BasicTab(BaseTab):
         
         if selected_resolution:
             width, height = selected_resolution
-            self.config["camera_size"]["width"] = width
-            self.config["camera_size"]["height"] = height
+            self.record_change(("camera_size", "width"), width)
+            self.record_change(("camera_size", "height"), height)
     
     def update_ui(self, config):
         """설정에 따라 UI 업데이트"""
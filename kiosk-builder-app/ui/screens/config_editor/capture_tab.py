@@ -96,6 +96,15 @@ class CaptureTab(BaseTab):
         # 스트레치 추가
         content_layout.addStretch()
     
+    def bind_preview_items(self):
+        self.show_preview_items("photo", "photo", [self.photo_fields])
+
+    def bind_tracked_fields(self):
+        self.track_fields("photo", self.photo_fields)
+        self.track_fields("photo", {"background": self.capture_bg_edit})
+        self.track_fields("frame", self.frame_fields)
+        self.track_fields("camera_count", self.camera_count_fields)
+
     def update_ui(self, config):
         """설정에 따라 UI 업데이트"""
         self.config = config
@@ -83,6 +83,9 @@ class CompleteTab(BaseTab):
         # 스트레치 추가
         content_layout.addStretch()
     
+    def bind_tracked_fields(self):
+        self.track_fields("complete", self.complete_fields)
+
     def update_ui(self, config):
         """설정에 따라 UI 업데이트"""
         self.config = config
@@ -2,6 +2,7 @@
 from PySide6.QtWidgets import QTabWidget
 from PySide6.QtCore import Qt
 from ui.styles.colors import COLORS
+from ui.components.change_tracker import ChangeTracker
 
 from ..basic_tab import BasicTab
 from ..splash_tab import SplashTab
@@ -16,6 +17,8 @@ class TabManager:
         self.main_window = main_window
         self.tab_widget = None
         self.tabs = {}
+        self.tab_titles = {}  # 탭 -> 변경 표시 없는 원래 제목
+        self.change_tracker = None
 
     def create_tabs(self):
         """탭 위젯 생성"""
@@ -28,6 +31,7 @@ class TabManager:
         # 탭들 생성
         self._create_individual_tabs()
         self.update_tab_enabled_states()
+        self._attach_change_tracker()
 
     def _create_individual_tabs(self):
         """개별 탭들 생성"""
@@ -54,6 +58,23 @@ class TabManager:
         self.tabs['complete'] = CompleteTab(config)
         self.tab_widget.addTab(self.tabs['complete'], "발급완료 화면(5)")
 
+    def _attach_change_tracker(self):
+        """입력 변경을 JSON 경로 패치로 기록하고 저장하지 않은 변경이 있는 탭에 * 표시"""
+        self.change_tracker = ChangeTracker(self.main_window.config, self.tab_widget)
+        self.change_tracker.dirty_changed.connect(self.update_tab_dirty_mark)
+        for tab in self.tabs.values():
+            self.tab_titles[tab] = self.tab_widget.tabText(self.tab_widget.indexOf(tab))
+            tab.attach_tracker(self.change_tracker)
+
+    def update_tab_dirty_mark(self, tab, dirty):
+        title = self.tab_titles[tab]
+        self.tab_widget.setTabText(self.tab_widget.indexOf(tab), f"{title} *" if dirty else title)
+
+    def attach_preview(self, preview):
+        """모든 탭의 인쇄 항목을 카드 미리보기에 연결"""
+        for tab in self.tabs.values():
+            tab.attach_preview(preview)
+
     def update_tab_enabled_states(self):
         """화면 순서에 따라 탭 활성화/비활성화"""
         try:
@@ -98,14 +119,14 @@ class TabManager:
                 self.tab_widget.setTabEnabled(i, True)
 
     def update_ui_from_config(self, config):
-        """설정에 따라 모든 탭 UI 업데이트"""
-        for tab in self.tabs.values():
-            if hasattr(tab, 'update_ui'):
-                tab.update_ui(config)
+        """다시 읽은 설정으로 바뀐 필드만 UI 업데이트 (저장하지 않은 변경은 취소)"""
+        self.change_tracker.reload(config)
         self.update_tab_enabled_states()
 
     def update_config_from_tabs(self, config):
-        """모든 탭에서 설정값 수집"""
-        for tab in self.tabs.values():
-            if hasattr(tab, 'update_config'):
-                tab.update_config(config)
+        """탭에서 바뀐 값(패치)만 설정에 적용"""
+        return self.change_tracker.apply(config)
+
+    def mark_saved(self):
+        """저장 완료 후 변경 기록과 탭 변경 표시 지우기"""
+        self.change_tracker.clear()
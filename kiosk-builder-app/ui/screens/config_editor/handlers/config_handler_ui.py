@@ -1,23 +1,42 @@
 from PySide6.QtWidgets import QMessageBox
+from PySide6.QtCore import QTimer
 from ui.styles.colors import COLORS
 import copy
 import os
 
 class ConfigHandlerUI:
+    SAVE_DEBOUNCE_MS = 300  # 저장 버튼을 연달아 눌러도 한 번만 저장
+
     def __init__(self, main_window):
         self.main_window = main_window
+        self.save_timer = QTimer(main_window)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+        self.save_timer.timeout.connect(self.save_config_now)
 
     def save_config(self):
+        """설정 저장 (잠시 기다렸다가 한 번에 저장)"""
+        self.save_timer.start()
+
+    def flush_pending_save(self):
+        """예약된 저장이 있으면 바로 저장 (창을 닫을 때)"""
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self.save_config_now()
+
+    def save_config_now(self):
         """설정 저장"""
-        self.main_window.tab_manager.update_config_from_tabs(self.main_window.config)
-        
         missing_fonts = self._check_missing_fonts()
         if missing_fonts:
             error_msg = "다음 폰트 파일을 찾을 수 없습니다:\n\n" + "\n".join(missing_fonts)
             self._show_message_box("폰트 파일 누락", error_msg, QMessageBox.Warning)
             return
         
+        # 폰트 확인이 끝난 뒤에 바뀐 값만 적용 (저장을 취소하면 config는 그대로)
+        self.main_window.tab_manager.update_config_from_tabs(self.main_window.config)
+        
         if self.main_window.config_handler.save_config(self.main_window.config):
+            self.main_window.tab_manager.mark_saved()
             self._show_message_box("저장 완료", "설정이 저장되었습니다.", QMessageBox.Information)
             self.main_window.statusBar().showMessage("설정이 성공적으로 저장되었습니다.")
             self.update_save_button_state()
@@ -26,8 +45,9 @@ class ConfigHandlerUI:
 
     def reload_config(self):
         """설정 다시 로드"""
-        self.main_window.config = copy.deepcopy(self.main_window.config_handler.load_config())
-        self.main_window.tab_manager.update_ui_from_config(self.main_window.config)
+        # 탭과 변경 추적이 같은 딕셔너리를 참조하므로 내용만 바꿈
+        new_config = copy.deepcopy(self.main_window.config_handler.load_config())
+        self.main_window.tab_manager.update_ui_from_config(new_config)
         self._show_message_box("설정 로드", "설정이 다시 로드되었습니다.", QMessageBox.Information)
 
     def update_save_button_state(self):
@@ -1,9 +1,10 @@
 from PySide6.QtWidgets import QMessageBox,QDialog
+import copy
 import os
 import sys
-import json
 import shutil
 import subprocess
+from utils.config_handler import write_config_file
 from ..download_progress_dialog import DownloadProgressDialog
 
 class DistributionHandler:
@@ -11,6 +12,7 @@ class DistributionHandler:
         self.main_window = main_window
         self.target_dir = None
         self.app_name = None
+        self.dist_config = None
 
     def create_distribution(self):
         """배포용 파일 생성 및 복사"""
@@ -67,7 +69,10 @@ class DistributionHandler:
             return False
 
         # 설정 업데이트
-        self.main_window.tab_manager.update_config_from_tabs(self.main_window.config)
+        # 변경 추적 기준(main_window.config)은 디스크의 config.json과 같아야 하므로
+        # 저장하지 않은 변경은 복사본에만 적용해서 배포
+        self.dist_config = copy.deepcopy(self.main_window.config)
+        self.main_window.tab_manager.update_config_from_tabs(self.dist_config)
         
         # 대상 디렉토리 설정
         app_folder_name = self.app_name.replace(" ", "_").replace(".", "_")
@@ -117,8 +122,7 @@ class DistributionHandler:
     def _copy_config_files(self):
         """설정 파일 복사"""
         target_config_path = os.path.join(self.target_dir, "bin", "config.json")
-        with open(target_config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.main_window.config, f, ensure_ascii=False, indent=4)
+        write_config_file(target_config_path, self.dist_config)
         
         # 저장 버튼 상태 업데이트
         self.main_window.config_handler_ui.update_save_button_state()
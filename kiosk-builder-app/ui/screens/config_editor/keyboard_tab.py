@@ -277,6 +277,8 @@ class KeyboardTab(BaseTab):
         
         # UI 업데이트
         self.text_input_items_container.updateGeometry()
+        self.show_preview_items("text_input", "text_input", self.text_input_item_fields)
+        self.track_items("text_input", self.text_input_item_fields)
     
     def update_text_items(self, count):
         """텍스트 항목 UI 업데이트"""
@@ -357,6 +359,22 @@ class KeyboardTab(BaseTab):
         
         # UI 업데이트
         self.text_items_container.updateGeometry()
+        self.show_preview_items("texts", "text", self.text_item_fields)
+        self.track_items("texts", self.text_item_fields)
+
+    def bind_preview_items(self):
+        self.show_preview_items("text_input", "text_input", self.text_input_item_fields)
+        self.show_preview_items("texts", "text", self.text_item_fields)
+
+    def bind_tracked_fields(self):
+        self.track_fields("keyboard", self.keyboard_position_fields)
+        self.track_fields("keyboard", self.keyboard_style_fields)
+        self.track_fields("text_input", self.text_input_fields)
+        self.track_fields("text_input", {"background": self.keyboard_bg_edit,
+                                         "count": self.text_input_count_spinbox})
+        self.track_fields("texts", {"count": self.text_count_spinbox})
+        self.track_items("text_input", self.text_input_item_fields)
+        self.track_items("texts", self.text_item_fields)
     
     def update_ui(self, config):
         """설정에 따라 UI 업데이트"""
@@ -1,6 +1,6 @@
 # kiosk-builder-app/ui/screens/config_editor/main_window.py 수정
 
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
 import copy
@@ -14,6 +14,7 @@ from utils.config_handler import ConfigHandler
 from utils.auth_manager import AuthManager
 # from utils.auto_updater import AutoUpdater  # 이 줄 삭제
 from ui.styles.colors import COLORS
+from ui.components.card_preview import CardPreview, CARD_WIDTH
 
 from .components.menu_manager import MenuManager
 from .components.tab_manager import TabManager
@@ -96,9 +97,15 @@ class ConfigEditor(QMainWindow):
         # 헤더 추가
         self.add_header(main_layout)
         
-        # 탭 위젯 추가
+        # 탭 위젯과 카드 인쇄 배치 미리보기 추가
         self.tab_manager.create_tabs()
-        main_layout.addWidget(self.tab_manager.tab_widget)
+        body_layout = QHBoxLayout()
+        body_layout.addWidget(self.tab_manager.tab_widget, 1)
+        self.card_preview = CardPreview()
+        self.card_preview.setFixedWidth(CARD_WIDTH // 2)
+        body_layout.addWidget(self.card_preview)
+        main_layout.addLayout(body_layout, 1)
+        self.tab_manager.attach_preview(self.card_preview)
         
         # 버튼 추가
         self.button_manager.create_buttons(main_layout)
@@ -109,6 +116,11 @@ class ConfigEditor(QMainWindow):
         # 상태 바 설정
         self.style_manager.setup_status_bar(self)
 
+    def closeEvent(self, event):
+        """닫기 전에 예약된 설정 저장 마무리"""
+        self.config_handler_ui.flush_pending_save()
+        super().closeEvent(event)
+
     def add_header(self, layout):
         """헤더 추가"""
         from PySide6.QtWidgets import QHBoxLayout, QLabel
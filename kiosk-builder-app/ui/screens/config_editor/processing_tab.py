@@ -83,6 +83,9 @@ class ProcessingTab(BaseTab):
         # 스트레치 추가
         content_layout.addStretch()
     
+    def bind_tracked_fields(self):
+        self.track_fields("process", self.process_fields)
+
     def update_ui(self, config):
         """설정에 따라 UI 업데이트"""
         self.config = config
@@ -80,6 +80,14 @@ class QRTab(BaseTab):
         # 스트레치 추가
         content_layout.addStretch()
     
+    def bind_preview_items(self):
+        self.show_preview_items("qr_uploaded_image", "qr", [self.qr_uploaded_fields])
+
+    def bind_tracked_fields(self):
+        self.track_fields("qr", self.qr_fields)
+        self.track_fields("qr", {"background": self.qr_bg_edit})
+        self.track_fields("qr_uploaded_image", self.qr_uploaded_fields)
+
     def update_ui(self, config):
         """설정에 따라 UI 업데이트"""
         self.config = config
@@ -4,9 +4,120 @@
 import json
 import os
 import sys
+import tempfile
 import tkinter as tk
 from tkinter import messagebox
 
+SCHEMA_VERSION_KEY = "schema_version"
+
+# 스키마 버전 -> 바로 이전 버전 설정을 그 버전으로 바꾸는 함수
+MIGRATIONS = {}
+
+def migration(version):
+    """설정 마이그레이션 등록 (version보다 낮은 버전의 파일을 읽을 때 한 번만 실행)"""
+    def register(func):
+        MIGRATIONS[version] = func
+        return func
+    return register
+
+@migration(1)
+def upgrade_single_image_text(config):
+    """이전 버전의 image/text 하나짜리 구조를 images/texts 목록으로 변환"""
+    if "image" in config and "images" not in config:
+        config["images"] = {
+            "count": 1,
+            "items": [
+                {
+                    "filename": "captured_image.jpg",
+                    "x": config["image"]["x"],
+                    "y": config["image"]["y"],
+                    "width": config["image"]["width"],
+                    "height": config["image"]["height"]
+                }
+            ]
+        }
+        del config["image"]
+    
+    if "text" in config and "texts" not in config:
+        config["texts"] = {
+            "count": 1,
+            "items": [
+                {
+                    "content": "텍스트",
+                    "x": config["text"]["x"],
+                    "y": config["text"]["y"],
+                    "width": config["text"]["width"],
+                    "height": config["text"]["height"],
+                    "font": "LAB디지털.ttf",
+                    "font_size": 16,
+                    "font_color": "#000000"
+                }
+            ]
+        }
+        del config["text"]
+
+def current_schema_version():
+    return max(MIGRATIONS, default=0)
+
+def migrate_config(config):
+    """저장된 스키마 버전 이후의 마이그레이션만 순서대로 실행, 실행했으면 True"""
+    version = config.get(SCHEMA_VERSION_KEY, 0)
+    if version > current_schema_version():
+        print(f"설정 파일 스키마 버전({version})이 프로그램이 아는 버전({current_schema_version()})보다 높습니다.")
+        return False
+    migrated = False
+    for target in sorted(MIGRATIONS):
+        if target > version:
+            MIGRATIONS[target](config)
+            config[SCHEMA_VERSION_KEY] = target
+            migrated = True
+    return migrated
+
+def write_config_file(path, config_data):
+    """
+    설정을 임시 파일에 다 쓰고 fsync한 뒤 이름을 바꿔 교체
+
+    쓰는 도중에 프로그램이 꺼져도 config.json은 이전 내용이나 새 내용 중 하나로만 남고,
+    키오스크는 반쯤 쓴 파일을 읽지 않습니다. 내용이 같으면 파일을 건드리지 않습니다.
+    """
+    text = json.dumps(config_data, ensure_ascii=False, indent=4)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return
+    except OSError:
+        pass
+    
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp는 권한을 0600으로 만들므로 기존 파일 권한 유지
+        if os.path.exists(path):
+            os.chmod(temp_path, os.stat(path).st_mode & 0o777)
+        else:
+            os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    
+    # 이름 바꾸기까지 디스크에 남도록 폴더도 fsync (Windows는 폴더를 열 수 없어 건너뜀)
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
 class ConfigHandler:
     def __init__(self):
         self.config_paths = [
@@ -17,6 +128,7 @@ class ConfigHandler:
         ]
         self.config_path = self.find_config_file()
         self.default_config = {
+            SCHEMA_VERSION_KEY: current_schema_version(),
             "app_name": "",
             "screen_size": {
                 "width": 1920,
@@ -170,41 +282,11 @@ class ConfigHandler:
                 with open(self.config_path, 'r', encoding='utf-8') as f:
                     config = json.load(f)
                 
-                # images, texts 구조가 새로운 형식인지 확인하고 변환
-                if "image" in config and "images" not in config:
-                    # 이전 버전에서 업그레이드
-                    config["images"] = {
-                        "count": 1,
-                        "items": [
-                            {
-                                "filename": "captured_image.jpg",
-                                "x": config["image"]["x"],
-                                "y": config["image"]["y"],
-                                "width": config["image"]["width"],
-                                "height": config["image"]["height"]
-                            }
-                        ]
-                    }
-                    del config["image"]
-                
-                if "text" in config and "texts" not in config:
-                    # 이전 버전에서 업그레이드
-                    config["texts"] = {
-                        "count": 1,
-                        "items": [
-                            {
-                                "content": "텍스트",
-                                "x": config["text"]["x"],
-                                "y": config["text"]["y"],
-                                "width": config["text"]["width"],
-                                "height": config["text"]["height"],
-                                "font": "LAB디지털.ttf",
-                                "font_size": 16,
-                                "font_color": "#000000"
-                            }
-                        ]
-                    }
-                    del config["text"]
+                # 파일에 기록된 스키마 버전 이후의 마이그레이션만 실행하고
+                # 버전을 기록해 두어 다음 로드부터는 다시 실행하지 않음
+                if migrate_config(config):
+                    print(f"설정 파일을 스키마 버전 {config[SCHEMA_VERSION_KEY]}(으)로 변환했습니다.")
+                    self.save_config(config)
                 
                 return config
             except Exception as e:
@@ -222,15 +304,10 @@ class ConfigHandler:
     #     sys.exit(1)
 
     def save_config(self, config_data):
-        """설정을 JSON 파일로 저장"""
+        """설정을 JSON 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
         try:
-            # 폴더가 존재하는지 확인하고 필요하면 생성
-            directory = os.path.dirname(self.config_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory, exist_ok=True)
-                
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=4)
+            config_data.setdefault(SCHEMA_VERSION_KEY, current_schema_version())
+            write_config_file(self.config_path, config_data)
             return True
         except Exception as e:
             print(f"설정 파일 저장 오류: {e}")
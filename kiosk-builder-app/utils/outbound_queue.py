@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import random
+import sqlite3
+import threading
+import time
+
+import requests
+
+class OutboundQueue:
+    """
+    오프라인에서도 잃어버리지 않는 서버 전송 대기열 (로그 등 급하지 않은 요청용)
+
+    요청은 먼저 SQLite 파일에 기록되고, 백그라운드 스레드가 모아서 보냅니다.
+    - 호출하는 쪽(UI 스레드)은 파일에 한 줄 쓰는 시간만 기다림
+    - 네트워크 오류, 408/429, 5xx 응답은 지수 백오프로 다시 시도
+    - 그 밖의 4xx 응답(요청 자체가 잘못됨)이나 max_age가 지난 요청은 버림
+    - 프로그램이 꺼져도 남은 요청은 다음 실행 때 이어서 전송
+    """
+
+    def __init__(self, db_path="outbound_queue.db", batch_size=20, timeout=5,
+                 backoff_base=5, backoff_max=600, max_age=7 * 24 * 3600):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._session = requests.Session()
+
+        # 연결 하나를 두 스레드가 _lock으로 나눠 씀 (with self._db: 블록이 끝나면 커밋)
+        self._db = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._create_table()
+
+    def _create_table(self):
+        with self._lock, self._db as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS outbound (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL
+                )
+            """)
+
+    def start(self):
+        """전송 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="outbound-queue", daemon=True)
+            self._thread.start()
+
+    def enqueue(self, url, payload):
+        """JSON POST 요청을 대기열에 추가하고 바로 반환"""
+        now = time.time()
+        with self._lock, self._db as connection:
+            connection.execute(
+                "INSERT INTO outbound (url, body, created_at, next_attempt_at) VALUES (?, ?, ?, ?)",
+                (url, json.dumps(payload, ensure_ascii=False), now, now)
+            )
+        self.start()
+        self._wakeup.set()
+
+    def pending_count(self):
+        with self._lock, self._db as connection:
+            return connection.execute("SELECT COUNT(*) FROM outbound").fetchone()[0]
+
+    def flush(self):
+        """
+        보낼 때가 된 요청을 batch_size개씩 전송
+
+        Returns:
+            int: 이번에 처리(성공 또는 폐기)한 요청 수
+        """
+        handled = 0
+        while True:
+            with self._lock, self._db as connection:
+                rows = connection.execute(
+                    "SELECT id, url, body, created_at, attempts FROM outbound "
+                    "WHERE next_attempt_at <= ? ORDER BY id LIMIT ?",
+                    (time.time(), self.batch_size)
+                ).fetchall()
+            if not rows:
+                return handled
+
+            done, retry = [], []
+            for index, (row_id, url, body, created_at, attempts) in enumerate(rows):
+                if self._send(url, body):
+                    done.append((row_id,))
+                elif time.time() - created_at > self.max_age:
+                    print(f"전송 대기열: 오래된 요청 폐기 ({url})")
+                    done.append((row_id,))
+                else:
+                    # 네트워크가 끊긴 것으로 보고 남은 요청은 보내 보지 않고 함께 미룸
+                    next_attempt_at = time.time() + self._backoff_delay(attempts)
+                    retry = [(next_attempt_at, rest[0]) for rest in rows[index:]]
+                    break
+
+            # 한 묶음의 결과를 트랜잭션 한 번으로 반영
+            with self._lock, self._db as connection:
+                connection.executemany("DELETE FROM outbound WHERE id = ?", done)
+                connection.executemany(
+                    "UPDATE outbound SET attempts = attempts + 1, next_attempt_at = ? WHERE id = ?", retry
+                )
+            handled += len(done)
+            if retry:
+                return handled
+
+    def _send(self, url, body):
+        """
+        Returns:
+            bool: 대기열에서 지워도 되면 True (성공 또는 다시 보내도 소용없는 응답)
+        """
+        try:
+            response = self._session.post(url, data=body.encode("utf-8"), timeout=self.timeout,
+                                          headers={"Content-Type": "application/json"})
+        except requests.RequestException as e:
+            print(f"전송 대기열: 서버 통신 실패 ({e})")
+            return False
+
+        if response.status_code < 400:
+            return True
+        if response.status_code in (408, 429) or response.status_code >= 500:
+            print(f"전송 대기열: 서버 응답 {response.status_code}, 나중에 다시 시도")
+            return False
+        print(f"전송 대기열: 요청 거부됨 {response.status_code} ({url}), 폐기")
+        return True
+
+    def _backoff_delay(self, attempts):
+        # 지수 백오프에 지터를 섞어 여러 PC가 동시에 몰리지 않도록 함
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempts))
+        return random.uniform(delay / 2, delay)
+
+    def _next_wait(self):
+        with self._lock, self._db as connection:
+            next_attempt_at = connection.execute("SELECT MIN(next_attempt_at) FROM outbound").fetchone()[0]
+        if next_attempt_at is None:
+            return None
+        return max(0.0, next_attempt_at - time.time())
+
+    def _run(self):
+        while True:
+            # 전송 중에 들어온 요청도 놓치지 않도록 먼저 깨움 표시를 지움
+            self._wakeup.clear()
+            try:
+                self.flush()
+                wait = self._next_wait()
+            except Exception as e:
+                print(f"전송 대기열 오류: {e}")
+                wait = self.backoff_base
+            # 새 요청이 들어오면 바로 깨어남
+            self._wakeup.wait(wait)
+
+_outbound_queue = None
+
+def get_outbound_queue():
+    """프로그램 전체에서 공유하는 전송 대기열"""
+    global _outbound_queue
+    if _outbound_queue is None:
+        _outbound_queue = OutboundQueue()
+    return _outbound_queue
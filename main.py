@@ -8,10 +8,33 @@ from screens.process_screen import ProcessScreen
 from screens.complete_screen import CompleteScreen
 from screens.camera_screen import CameraScreen
 from screens.text_input_screen import TextInputScreen  # 추가된 부분
-from config import config
+from config import config, config_path, get_settings, RESTART_SECTIONS
 from webcam_utils.webcam_controller import release_camera
 from PySide6.QtWidgets import QWidget
 from screens.QR_screen import QR_screen
+from components.virtual_keyboard import VirtualKeyboard
+from monitor_utils.memory_watchdog import MemoryWatchdog
+from components.font_registry import font_registry
+from components.config_watcher import ConfigWatcher
+
+# 설정 섹션 -> 새로 만들 화면 인덱스들 (REBUILDABLE_SCREENS의 키)
+SCREEN_SECTIONS = {
+    "splash": (0,),
+    "camera_size": (1,),
+    "crop_area": (1,),
+    "frame": (1,),
+    "camera_count": (1,),
+    "text_input": (2,),
+    "process": (4,),
+    "complete": (5,),
+}
+REBUILDABLE_SCREENS = {
+    0: ("splash_screen", SplashScreen),
+    1: ("photo_screen", CameraScreen),
+    2: ("text_input_screen", TextInputScreen),
+    4: ("process_screen", ProcessScreen),
+    5: ("complete_screen", CompleteScreen),
+}
 
 # 애플리케이션 중복 실행 방지 클래스
 class SingleApplication(QApplication):
@@ -37,8 +60,9 @@ class SingleApplication(QApplication):
 class KioskApp(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.setWindowTitle(config["app_name"])
-        self.screen_size = (config["screen_size"]["width"], config["screen_size"]["height"])
+        settings = get_settings()
+        self.setWindowTitle(settings.app_name)
+        self.screen_size = (settings.screen_size.width, settings.screen_size.height)
         self.setFixedSize(*self.screen_size)
         self.showFullScreen()
         
@@ -52,12 +76,25 @@ class KioskApp(QMainWindow):
             program_directory = os.path.dirname(os.path.abspath(__file__))
         os.chdir(program_directory)
 
+        # 폰트 파일은 백그라운드에서 한 번만 읽어 등록 (화면 생성과 병행)
+        font_registry().start()
+
         self.current_index = 0
 
         self.setupStack()
 
         self.setCentralWidget(self.stack)
 
+        # 스플래시로 돌아올 때마다 세션 버퍼 해제 및 메모리 점검
+        self.memory_watchdog = MemoryWatchdog(self)
+
+        # config.json이 바뀌면 바뀐 부분만 다시 만듦 (표시 중인 화면은 벗어난 뒤에)
+        self.pending_rebuilds = set()
+        self.stack.currentChanged.connect(self.applyPendingRebuilds)
+        if config.get("config_watch", {}).get("enabled", True):
+            self.config_watcher = ConfigWatcher(config_path, self)
+            self.config_watcher.config_changed.connect(self.onConfigChanged)
+
     def setupStack(self):
         self.stack = QStackedWidget()
         self.splash_screen = SplashScreen(self.stack, self.screen_size, self)
@@ -79,8 +116,55 @@ class KioskApp(QMainWindow):
 
     def getNextScreenIndex(self):
         # screen_order의 다음 인덱스로 이동
-        self.current_index = (self.current_index + 1) % len(config["screen_order"])
-        return config["screen_order"][self.current_index]
+        screen_order = get_settings().screen_order
+        self.current_index = (self.current_index + 1) % len(screen_order)
+        return screen_order[self.current_index]
+
+    def onConfigChanged(self, sections):
+        """바뀐 설정 섹션에 해당하는 부분만 다시 만듦"""
+        if "keyboard" in sections:
+            self.pending_rebuilds.add("keyboard")
+        for section in sections:
+            self.pending_rebuilds.update(SCREEN_SECTIONS.get(section, ()))
+        if sections & {"splash", "process", "complete"}:
+            font_registry().build_phrase_fonts()
+        for section in RESTART_SECTIONS:
+            if section in sections:
+                print(f"'{section}' 설정은 프로그램을 다시 시작해야 적용됩니다")
+        # 인쇄 항목(photo, images, texts, printer 등)은 인쇄할 때마다 읽으므로 따로 처리하지 않음
+        self.applyPendingRebuilds()
+
+    def applyPendingRebuilds(self, *args):
+        current = self.stack.currentIndex()
+        for target in list(self.pending_rebuilds):
+            if target == "keyboard":
+                # 입력 화면 전체를 새로 만들 예정이면 그때 키보드도 새로 만들어짐
+                if 2 in self.pending_rebuilds:
+                    VirtualKeyboard.reset_layout()
+                elif current == 2:
+                    continue
+                else:
+                    self.text_input_screen.rebuildKeyboard()
+                self.pending_rebuilds.discard(target)
+            elif target != current and self.rebuildScreen(target):
+                self.pending_rebuilds.discard(target)
+
+    def rebuildScreen(self, index):
+        """화면 하나를 새 설정으로 다시 만들어 같은 자리에 넣음 (작업 중이면 False)"""
+        name, screen_class = REBUILDABLE_SCREENS[index]
+        old_screen = getattr(self, name)
+        if index == 4 and old_screen.isPrinting():
+            return False
+        if index == 1:
+            old_screen.releaseCamera()
+
+        new_screen = screen_class(self.stack, self.screen_size, self)
+        self.stack.removeWidget(old_screen)
+        self.stack.insertWidget(index, new_screen)
+        setattr(self, name, new_screen)
+        old_screen.deleteLater()
+        print(f"화면 {index} 다시 만듦")
+        return True
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
@@ -0,0 +1,201 @@
+import gc
+import linecache
+import os
+import sys
+import tracemalloc
+import weakref
+from collections import Counter
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtGui import QPixmapCache
+from PySide6.QtWidgets import QApplication
+from shiboken6 import isValid
+from config import config
+
+def get_rss_bytes():
+    """현재 프로세스의 RSS(상주 메모리) 바이트 수 반환"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    # 리눅스: /proc/self/statm 의 두 번째 값이 상주 페이지 수
+    if os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+    # 윈도우: psapi.GetProcessMemoryInfo
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+    return 0
+
+def take_snapshot():
+    """tracemalloc 스냅샷 (tracemalloc/linecache 자체가 쓰는 메모리 제외)"""
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, linecache.__file__),
+    ))
+
+# 부모 없이 만든 QThread (위젯 트리에 없으므로 따로 셈)
+_watched_threads = weakref.WeakSet()
+
+def watch_thread(thread):
+    """부모 없는 QThread를 QObject 수 점검 대상에 추가"""
+    _watched_threads.add(thread)
+    return thread
+
+def count_live_qobjects():
+    """앱과 최상위 위젯 트리, 부모 없는 QThread 중 살아 있는 QObject 수"""
+    app = QApplication.instance()
+    if app is None:
+        return 0
+    count = len(app.findChildren(QObject))
+    count += sum(len(widget.findChildren(QObject)) + 1 for widget in app.topLevelWidgets())
+    count += sum(1 for thread in list(_watched_threads) if isValid(thread) and thread.parent() is None)
+    return count
+
+class MemoryWatchdog:
+    """
+    세션이 끝나 스플래시 화면으로 돌아올 때마다 메모리를 점검하는 감시기
+
+    - 각 화면의 releaseSessionResources()를 호출해 세션 버퍼를 명시적으로 해제
+    - RSS, 파이썬 객체 수, 살아 있는 QObject 수(부모 없는 QThread 포함)를 표본 추출
+    - 첫 세션 기준값 대비 증가량이 임계값을 넘으면 로그
+
+    config.json의 "watchdog" 섹션(선택)으로 조정합니다:
+        enabled, rss_threshold_mb, object_threshold, qobject_threshold, top_n,
+        diagnostics, tracemalloc
+
+    운영 중 부담을 줄이기 위해 진단 기능은 기본으로 꺼져 있습니다.
+    - "diagnostics": true 이면 타입별 객체 수를 세어 많이 늘어난 상위 N개 타입을 보고에 추가
+    - "tracemalloc": true 이면 tracemalloc을 켜고(한 프레임) 상위 N개 할당 차이를 보고에 추가
+    """
+
+    def __init__(self, main_window):
+        settings = config.get("watchdog", {})
+        self.enabled = settings.get("enabled", True)
+        self.rss_threshold = settings.get("rss_threshold_mb", 64) * 1024 * 1024
+        self.object_threshold = settings.get("object_threshold", 5000)
+        self.qobject_threshold = settings.get("qobject_threshold", 200)
+        self.top_n = settings.get("top_n", 10)
+        self.diagnostics = settings.get("diagnostics", False)
+        self.use_tracemalloc = settings.get("tracemalloc", False)
+
+        self.main_window = main_window
+        self.stack = main_window.stack
+        self.sessions = 0
+        self.left_splash = False
+        self.baseline = None
+        self.previous = None
+        self.baseline_snapshot = None
+
+        if not self.enabled:
+            return
+        if self.use_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+        self.stack.currentChanged.connect(self.on_screen_changed)
+
+    def on_screen_changed(self, index):
+        if index != 0:
+            self.left_splash = True
+            return
+        if self.left_splash:
+            self.left_splash = False
+            # 스플래시 화면이 먼저 그려지도록 점검은 이벤트 루프가 빈 뒤에 수행
+            QTimer.singleShot(0, self.on_session_end)
+
+    def on_session_end(self):
+        self.sessions += 1
+        self.reclaim()
+        sample = self.sample()
+
+        if self.baseline is None:
+            # 첫 세션이 끝난 시점을 기준으로 삼음 (초기화 시 한 번만 생기는 캐시 제외)
+            self.baseline = sample
+            self.previous = sample
+            if self.use_tracemalloc:
+                self.baseline_snapshot = take_snapshot()
+            print(f"메모리 기준값 설정: RSS {sample['rss'] / 1048576:.1f}MB, QObject {sample['qobjects']}")
+            return
+
+        rss_growth = sample["rss"] - self.baseline["rss"]
+        qobject_growth = sample["qobjects"] - self.baseline["qobjects"]
+        object_growth = sample["object_count"] - self.baseline["object_count"]
+        print(
+            f"[세션 {self.sessions}] RSS {sample['rss'] / 1048576:.1f}MB ({rss_growth / 1048576:+.1f}MB), "
+            f"객체 {object_growth:+d}, QObject {qobject_growth:+d}"
+        )
+
+        if (rss_growth > self.rss_threshold
+                or object_growth > self.object_threshold
+                or qobject_growth > self.qobject_threshold):
+            self.report_growth(sample, rss_growth, object_growth, qobject_growth)
+        self.previous = sample
+
+    def reclaim(self):
+        """세션 동안 쌓인 버퍼를 명시적으로 해제"""
+        for i in range(self.stack.count()):
+            screen = self.stack.widget(i)
+            if hasattr(screen, "releaseSessionResources"):
+                try:
+                    screen.releaseSessionResources()
+                except Exception as e:
+                    print(f"세션 자원 해제 오류 ({type(screen).__name__}): {e}")
+        QPixmapCache.clear()
+        gc.collect()
+
+    def sample(self):
+        objects = gc.get_objects()
+        sample = {
+            "rss": get_rss_bytes(),
+            "object_count": len(objects),
+            "qobjects": count_live_qobjects(),
+        }
+        # 타입별 집계는 모든 객체를 훑으므로 진단을 켰을 때만
+        if self.diagnostics:
+            sample["objects"] = Counter(type(obj).__name__ for obj in objects)
+        del objects
+        return sample
+
+    def report_growth(self, sample, rss_growth, object_growth, qobject_growth):
+        lines = [
+            f"메모리 증가 감지 (세션 {self.sessions}): RSS {rss_growth / 1048576:+.1f}MB, "
+            f"객체 {object_growth:+d}, QObject {qobject_growth:+d}"
+        ]
+
+        # 직전 세션 대비 가장 많이 늘어난 타입
+        if self.diagnostics:
+            type_growth = sample["objects"] - self.previous["objects"]
+            for name, count in type_growth.most_common(self.top_n):
+                lines.append(f"  +{count:>6} {name}")
+
+        if self.baseline_snapshot is not None:
+            snapshot = take_snapshot()
+            lines.append(f"  tracemalloc 상위 {self.top_n}개 (기준값 대비):")
+            for stat in snapshot.compare_to(self.baseline_snapshot, "lineno")[:self.top_n]:
+                lines.append(f"    {stat}")
+
+        print("\n".join(lines))
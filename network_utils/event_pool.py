@@ -0,0 +1,141 @@
+import time
+
+from PySide6.QtCore import QObject, QTimer
+from components.qr_renderer import render_qr_pixmap
+from config import config
+from network_utils.http_client import http_client
+from network_utils.websocket_manager import websocket_manager, kiosk_websocket_url
+
+class PooledEvent:
+    """미리 만들어 둔 이벤트 한 건 (QR 픽스맵, 연결된 웹소켓 포함)"""
+
+    def __init__(self, event_id, event_name, qr_url):
+        self.event_id = event_id
+        self.event_name = event_name
+        self.qr_url = qr_url
+        self.qr_pixmap = None
+        self.ws = None  # websocket_manager 구독
+        self.created_at = time.monotonic()
+
+    @property
+    def closed(self):
+        return self.ws is None or self.ws.closed
+
+    def close(self):
+        if self.ws:
+            self.ws.close()
+            self.ws = None
+
+class EventPool(QObject):
+    """
+    QR 이벤트 미리 만들기
+
+    손님이 QR 화면에 들어오기 전에 이벤트 등록, QR 렌더링, 웹소켓 구독을 끝내 두어
+    QR 화면이 바로 표시되도록 합니다. 꺼내 쓰면 백그라운드에서 다시 채우고,
+    오래된 이벤트나 서버가 구독을 거부한 이벤트는 폐기합니다.
+
+    config.json의 "qr" 섹션(선택)으로 조정합니다:
+        event_pool_size (기본 1, 0이면 사용 안 함), event_ttl (초, 기본 600)
+    """
+    MAINTENANCE_INTERVAL = 30000
+    RETRY_DELAY = 30000
+
+    def __init__(self, server_url, parent=None):
+        super().__init__(parent)
+        self.server_url = server_url
+        self.size = config["qr"].get("event_pool_size", 1)
+        self.ttl = config["qr"].get("event_ttl", 600)
+        self.events = []
+        self.pending_request = None
+
+        # TTL 만료 확인, 부족분 채우기
+        self.maintenance_timer = QTimer(self)
+        self.maintenance_timer.timeout.connect(self.maintain)
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.timeout.connect(self.refill)
+
+    @property
+    def enabled(self):
+        return self.size > 0
+
+    def start(self):
+        if not self.enabled:
+            return
+        self.maintenance_timer.start(self.MAINTENANCE_INTERVAL)
+        self.refill()
+
+    def take(self):
+        """사용 가능한 이벤트를 하나 꺼냄 (없으면 None), 꺼낸 뒤 다시 채움"""
+        self.expire()
+        event = self.events.pop(0) if self.events else None
+        if self.enabled:
+            self.refill()
+        return event
+
+    def refill(self):
+        # 한 번에 하나씩만 요청 (완료되면 이어서 채움)
+        if self.pending_request is not None or len(self.events) >= self.size:
+            return
+        self.pending_request = http_client().post(
+            f"{self.server_url}/api/events/register",
+            params={"event_name": config["app_name"]}
+        )
+        self.pending_request.finished.connect(self.on_event_created)
+        self.pending_request.failed.connect(self.on_event_failed)
+
+    def on_event_created(self, status_code, body):
+        request = self.sender()
+        self.pending_request = None
+        if status_code != 200:
+            print(f"[이벤트 풀] 이벤트 생성 실패: HTTP {status_code}")
+            self.retry_timer.start(self.RETRY_DELAY)
+            return
+        try:
+            event_data = request.json(body)
+            event = PooledEvent(event_data["event_id"], event_data["event_name"], event_data["qr_url"])
+            event.qr_pixmap = render_qr_pixmap(event.qr_url)
+        except Exception as e:
+            print(f"[이벤트 풀] 이벤트 준비 중 오류: {e}")
+            self.retry_timer.start(self.RETRY_DELAY)
+            return
+
+        self.open_websocket(event)
+        self.events.append(event)
+        print(f"[이벤트 풀] 이벤트 준비 완료 {event.event_id} ({len(self.events)}/{self.size})")
+        self.refill()
+
+    def on_event_failed(self, message):
+        self.pending_request = None
+        print(f"[이벤트 풀] 이벤트 생성 중 오류: {message}")
+        self.retry_timer.start(self.RETRY_DELAY)
+
+    def open_websocket(self, event):
+        ws_url = kiosk_websocket_url(self.server_url, event.event_id)
+        event.ws = websocket_manager().subscribe(event.event_id, ws_url)
+
+    def expire(self):
+        """TTL이 지났거나 연결이 끊긴 이벤트 폐기"""
+        now = time.monotonic()
+        alive = []
+        for event in self.events:
+            if event.closed or now - event.created_at > self.ttl:
+                print(f"[이벤트 풀] 이벤트 폐기 {event.event_id}")
+                event.close()
+            else:
+                alive.append(event)
+        self.events = alive
+
+    def maintain(self):
+        self.expire()
+        self.refill()
+
+    def shutdown(self):
+        self.maintenance_timer.stop()
+        self.retry_timer.stop()
+        if self.pending_request is not None:
+            self.pending_request.abort()
+            self.pending_request = None
+        for event in self.events:
+            event.close()
+        self.events = []
@@ -0,0 +1,167 @@
+import json
+import time
+
+from PySide6.QtCore import QObject, QTimer, QUrl, QUrlQuery, Signal
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from config import config
+
+# 다시 시도해도 되는 오류 (연결 단계 실패, 끊긴 keep-alive 연결, 시간 초과)
+RETRYABLE_ERRORS = {
+    QNetworkReply.NetworkError.ConnectionRefusedError,
+    QNetworkReply.NetworkError.RemoteHostClosedError,
+    QNetworkReply.NetworkError.HostNotFoundError,
+    QNetworkReply.NetworkError.TimeoutError,
+    QNetworkReply.NetworkError.TemporaryNetworkFailureError,
+    QNetworkReply.NetworkError.NetworkSessionFailedError,
+    QNetworkReply.NetworkError.UnknownNetworkError,
+}
+RETRYABLE_STATUS = {502, 503, 504}
+# 요청이 서버에 닿기 전에 실패한 오류 (멱등이 아닌 POST도 다시 보내도 안전)
+CONNECT_ERRORS = {
+    QNetworkReply.NetworkError.ConnectionRefusedError,
+    QNetworkReply.NetworkError.HostNotFoundError,
+    QNetworkReply.NetworkError.SslHandshakeFailedError,
+}
+
+class HttpRequest(QObject):
+    """
+    요청 한 건 (재시도 포함)
+
+    결과는 시그널로 전달됩니다:
+    - finished(status_code, body): HTTP 응답을 받음 (상태 코드는 호출 측에서 판단)
+    - failed(message): 재시도까지 모두 실패
+    """
+    finished = Signal(int, bytes)
+    failed = Signal(str)
+
+    def __init__(self, client, method, url, body, retries):
+        super().__init__(client)
+        self.client = client
+        self.method = method
+        self.url = url
+        self.body = body
+        self.retries_left = retries
+        self.attempts = 0
+        self.reply = None
+        self.aborted = False
+        self.started_at = time.perf_counter()
+        self.elapsed_ms = 0.0
+
+    def send(self):
+        if self.aborted:
+            # 재시도 대기 중에 취소된 경우
+            self.deleteLater()
+            return
+        self.attempts += 1
+        request = QNetworkRequest(self.url)
+        request.setTransferTimeout(self.client.timeout_ms)
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        if self.method == "POST":
+            request.setHeader(QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/x-www-form-urlencoded")
+            self.reply = self.client.manager.post(request, self.body)
+        else:
+            self.reply = self.client.manager.get(request)
+        self.reply.finished.connect(self.on_reply_finished)
+
+    def abort(self):
+        """결과가 더 이상 필요 없을 때 (시그널은 발생하지 않음)"""
+        self.aborted = True
+        if self.reply is not None:
+            self.reply.abort()
+
+    def json(self, body):
+        return json.loads(bytes(body).decode("utf-8"))
+
+    def on_reply_finished(self):
+        reply = self.sender()
+        reply.deleteLater()
+        if self.aborted:
+            self.deleteLater()
+            return
+
+        error = reply.error()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute) or 0
+        # setTransferTimeout으로 끊긴 경우 OperationCanceledError로 보고됨
+        timed_out = error == QNetworkReply.NetworkError.OperationCanceledError
+        if self.method == "POST":
+            # 시간 초과나 5xx는 서버가 이미 처리했을 수 있으므로 연결 단계 실패만 다시 보냄
+            retryable = error in CONNECT_ERRORS
+        else:
+            retryable = error in RETRYABLE_ERRORS or timed_out or status in RETRYABLE_STATUS
+
+        if retryable and self.retries_left > 0:
+            self.retries_left -= 1
+            delay = self.client.retry_backoff_ms * (2 ** (self.attempts - 1))
+            print(f"[HTTP] {self.method} {self.url.path()} 재시도 {self.attempts}회 ({reply.errorString()}), {delay}ms 후")
+            QTimer.singleShot(delay, self, self.send)
+            return
+
+        self.elapsed_ms = (time.perf_counter() - self.started_at) * 1000
+        if status:
+            self.finished.emit(status, bytes(reply.readAll().data()))
+        else:
+            self.failed.emit("시간 초과" if timed_out else reply.errorString())
+        self.deleteLater()
+
+class HttpClient(QObject):
+    """
+    QR 흐름용 비동기 HTTP 클라이언트
+
+    QNetworkAccessManager 하나를 공유하므로 호스트별 keep-alive 연결이 재사용되고,
+    GUI 스레드를 막지 않습니다. prewarm()으로 DNS 조회와 TLS 핸드셰이크를 미리 해두면
+    이후 요청은 연결 비용 없이 바로 전송됩니다.
+
+    config.json의 "network" 섹션(선택)으로 조정합니다:
+        timeout_ms, retries, retry_backoff_ms
+
+    POST는 멱등이 아닐 수 있으므로 요청이 서버에 닿기 전의 실패(CONNECT_ERRORS: 연결 거부,
+    DNS, TLS)만 다시 보내고, 본문을 보낸 뒤의 시간 초과나 5xx는 재시도하지 않습니다.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        settings = config.get("network", {})
+        self.timeout_ms = settings.get("timeout_ms", 10000)
+        self.retries = settings.get("retries", 2)
+        self.retry_backoff_ms = settings.get("retry_backoff_ms", 300)
+        self.manager = QNetworkAccessManager(self)
+
+    def prewarm(self, base_url):
+        """DNS 조회와 TLS 핸드셰이크를 미리 수행 (이미 연결돼 있으면 재사용)"""
+        url = QUrl(base_url)
+        if url.scheme() == "https":
+            self.manager.connectToHostEncrypted(url.host(), url.port(443))
+        else:
+            self.manager.connectToHost(url.host(), url.port(80))
+
+    def build_url(self, url, params=None):
+        qurl = QUrl(url)
+        if params:
+            query = QUrlQuery()
+            for key, value in params.items():
+                query.addQueryItem(key, str(value))
+            qurl.setQuery(query)
+        return qurl
+
+    def get(self, url, params=None, retries=None):
+        request = HttpRequest(self, "GET", self.build_url(url, params), None,
+                              self.retries if retries is None else retries)
+        request.send()
+        return request
+
+    def post(self, url, params=None, body=b"", retries=None):
+        request = HttpRequest(self, "POST", self.build_url(url, params), body,
+                              self.retries if retries is None else retries)
+        request.send()
+        return request
+
+def http_client():
+    return HttpClient.instance()
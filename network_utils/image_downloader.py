@@ -0,0 +1,187 @@
+import os
+import tempfile
+import time
+
+import requests
+from PIL import Image, ImageFile
+from PySide6.QtCore import QThread, Signal
+from PySide6.QtGui import QImage
+from components.photo_normalizer import normalize_photo
+
+CHUNK_SIZE = 64 * 1024
+
+# 워커 스레드끼리 keep-alive 연결을 공유
+_session = None
+
+def get_session():
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+def decode_preview(path, width, height):
+    """
+    저장된 이미지를 미리보기 크기로 디코딩해서 QImage로 반환
+
+    JPEG는 draft()로 DCT 단계에서 1/2~1/8로 줄여 읽으므로 전체 해상도 디코딩을 피합니다.
+    """
+    with Image.open(path) as img:
+        img.draft("RGB", (width, height))
+        img = img.convert("RGB")
+        img.thumbnail((width, height), Image.Resampling.LANCZOS)
+        data = img.tobytes("raw", "RGB")
+        # 버퍼 수명과 분리하기 위해 copy()
+        return QImage(data, img.width, img.height, img.width * 3, QImage.Format.Format_RGB888).copy()
+
+def release_parser(parser):
+    """
+    헤더만 읽은 ImageFile.Parser 정리
+
+    Parser.close()는 남은 데이터를 끝까지 디코딩하려다 잘린 이미지라며 실패하므로,
+    디코더와 이미지 객체만 직접 해제합니다.
+    """
+    if parser.decoder is not None:
+        parser.decoder.cleanup()
+        parser.decoder = None
+    if parser.image is not None:
+        parser.image.close()
+    parser.data = None
+
+def header_size(parser):
+    """파싱한 이미지 크기 (헤더를 못 읽었으면 이미지가 아님)"""
+    if parser.image is None:
+        raise ValueError("이미지 형식이 아닙니다")
+    return parser.image.size
+
+class ImageDownloader(QThread):
+    """
+    업로드 이미지 다운로드 워커
+
+    - 스트리밍으로 받아 바로 파일에 쓰고, 크기 상한을 넘으면 중단
+    - 받는 동안 헤더를 파싱해 이미지가 아니면 끝까지 받지 않고 실패 처리
+    - 다 받으면 미리보기 크기로만 디코딩해서 전달 (원본 파일은 인쇄용으로 보관)
+    - print_size를 주면 원본 대신 EXIF 방향 적용, 가운데 자르기를 마친 인쇄 크기 파일을 저장하고
+      미리보기도 같은 디코딩에서 만듦 (normalize_photo)
+    - 처리량(bytes/sec), 첫 바이트까지 시간, 미리보기까지 시간 기록
+    """
+    preview_ready = Signal(QImage, str)
+    failed = Signal(str)
+
+    def __init__(self, image_url, save_path, preview_size, max_bytes, timeout=10,
+                 print_size=None, print_quality=95, parent=None):
+        super().__init__(parent)
+        self.image_url = image_url
+        self.save_path = save_path
+        self.preview_size = preview_size
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.print_size = print_size
+        self.print_quality = print_quality
+        self.metrics = {}
+
+    def run(self):
+        started = time.perf_counter()
+        temp_path = None
+        try:
+            directory = os.path.dirname(self.save_path) or "."
+            os.makedirs(directory, exist_ok=True)
+            # 취소된 이전 워커가 아직 돌고 있을 수 있으므로 워커마다 따로 임시 파일을 씀
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+            os.close(fd)
+            received, source_size, first_byte = self.receive(temp_path)
+            downloaded = time.perf_counter()
+            if self.isInterruptionRequested():
+                raise InterruptedError("다운로드 취소")
+
+            if self.print_size:
+                image = normalize_photo(temp_path, self.save_path, self.print_size,
+                                        self.preview_size, self.print_quality)
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, self.save_path)
+                image = decode_preview(self.save_path, *self.preview_size)
+            if image.isNull():
+                raise ValueError("미리보기 디코딩 실패")
+            preview_done = time.perf_counter()
+
+            download_time = max(downloaded - started, 1e-6)
+            self.metrics = {
+                "bytes": received,
+                "source_size": source_size,
+                "time_to_first_byte_ms": (first_byte - started) * 1000,
+                "download_ms": download_time * 1000,
+                "bytes_per_sec": received / download_time,
+                "time_to_preview_ms": (preview_done - started) * 1000,
+            }
+            print(f"[이미지 다운로드] {received / 1024:.0f}KB {source_size[0]}x{source_size[1]}, "
+                  f"{self.metrics['bytes_per_sec'] / 1024:.0f}KB/s, "
+                  f"첫 바이트 {self.metrics['time_to_first_byte_ms']:.0f}ms, "
+                  f"미리보기까지 {self.metrics['time_to_preview_ms']:.0f}ms")
+            self.preview_ready.emit(image, self.save_path)
+
+        except Exception as e:
+            # 이 워커가 만든 임시 파일만 지움
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            if not isinstance(e, InterruptedError):
+                self.failed.emit(str(e))
+
+    def receive(self, temp_path):
+        """이미지를 temp_path에 저장하고 (받은 바이트 수, 원본 크기, 첫 바이트 시각) 반환"""
+        parser = ImageFile.Parser()
+        try:
+            with get_session().get(self.image_url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                first_byte = time.perf_counter()
+
+                content_length = int(response.headers.get("Content-Length") or 0)
+                if content_length > self.max_bytes:
+                    raise ValueError(f"이미지가 너무 큽니다 ({content_length} bytes)")
+
+                received = 0
+                with open(temp_path, "wb") as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        if self.isInterruptionRequested():
+                            raise InterruptedError("다운로드 취소")
+                        received += len(chunk)
+                        if received > self.max_bytes:
+                            raise ValueError(f"이미지가 너무 큽니다 ({received} bytes 이상)")
+                        f.write(chunk)
+                        # 헤더를 읽을 때까지만 파서에 넣음 (형식/크기 확인용)
+                        if parser.image is None:
+                            parser.feed(chunk)
+
+            return received, header_size(parser), first_byte
+        finally:
+            release_parser(parser)
+
+class InlineImageReceiver(ImageDownloader):
+    """
+    웹소켓 바이너리 프레임으로 이미 받은 이미지 처리
+
+    HTTP 요청 없이 저장과 미리보기 디코딩만 워커 스레드에서 수행합니다.
+    결과 시그널과 측정값은 ImageDownloader와 같습니다.
+    """
+
+    def __init__(self, image_bytes, save_path, preview_size, max_bytes,
+                 print_size=None, print_quality=95, parent=None):
+        super().__init__(None, save_path, preview_size, max_bytes,
+                         print_size=print_size, print_quality=print_quality, parent=parent)
+        self.image_bytes = image_bytes
+
+    def receive(self, temp_path):
+        first_byte = time.perf_counter()
+        if len(self.image_bytes) > self.max_bytes:
+            raise ValueError(f"이미지가 너무 큽니다 ({len(self.image_bytes)} bytes)")
+        parser = ImageFile.Parser()
+        try:
+            for start in range(0, len(self.image_bytes), CHUNK_SIZE):
+                parser.feed(self.image_bytes[start:start + CHUNK_SIZE])
+                if parser.image is not None:
+                    break
+            source_size = header_size(parser)
+        finally:
+            release_parser(parser)
+        with open(temp_path, "wb") as f:
+            f.write(self.image_bytes)
+        return len(self.image_bytes), source_size, first_byte
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import random
+import ssl
+import struct
+import threading
+
+import certifi
+from websockets.asyncio.client import connect
+from websockets.exceptions import InvalidStatus
+from PySide6.QtCore import QObject, Signal
+from config import config
+
+# 바이너리 프레임: [헤더 길이 4바이트(big-endian)][JSON 헤더][본문 바이트]
+BINARY_HEADER = struct.Struct(">I")
+
+def encode_binary_frame(header, payload):
+    header_bytes = json.dumps(header).encode("utf-8")
+    return BINARY_HEADER.pack(len(header_bytes)) + header_bytes + payload
+
+def decode_binary_frame(frame):
+    """바이너리 프레임을 (헤더 dict, 본문 bytes)로 분리"""
+    if len(frame) < BINARY_HEADER.size:
+        raise ValueError("프레임이 너무 짧습니다")
+    (header_length,) = BINARY_HEADER.unpack_from(frame)
+    header_end = BINARY_HEADER.size + header_length
+    if header_end > len(frame):
+        raise ValueError("헤더 길이가 프레임보다 깁니다")
+    header = json.loads(frame[BINARY_HEADER.size:header_end].decode("utf-8"))
+    return header, frame[header_end:]
+
+def websocket_url(server_url, path):
+    """서버 URL(https/http)에 맞는 웹소켓 URL(wss/ws)"""
+    if server_url.startswith("https://"):
+        return "wss://" + server_url[len("https://"):] + path
+    if server_url.startswith("http://"):
+        return "ws://" + server_url[len("http://"):] + path
+    return server_url + path
+
+def kiosk_websocket_url(server_url, event_id):
+    """
+    이벤트 구독 URL
+
+    qr.inline_images(기본 True)이면 업로드 이미지를 URL 대신 바이너리 프레임으로 받겠다고 알림.
+    지원하지 않는 서버는 쿼리를 무시하고 기존처럼 URL 메시지를 보냄.
+    """
+    url = websocket_url(server_url, f"/ws/kiosk/{event_id}")
+    if config["qr"].get("inline_images", True):
+        url += "?inline_images=1"
+    return url
+
+class Subscription:
+    """이벤트 하나의 웹소켓 구독 (끊기면 매니저가 알아서 다시 연결)"""
+
+    def __init__(self, manager, key, url):
+        self.manager = manager
+        self.key = key
+        self.url = url
+        self.task = None
+        self.connection = None
+        self.closed = False  # 서버가 거부했거나 close()로 종료됨
+
+    def send(self, data):
+        self.manager.send(self, data)
+
+    def close(self):
+        self.manager.unsubscribe(self)
+
+class WebSocketManager(QObject):
+    """
+    키오스크 웹소켓 관리자
+
+    asyncio 이벤트 루프 스레드 하나에서 모든 이벤트 구독을 처리합니다.
+    세션마다 스레드를 새로 만들지 않으므로 스레드 수가 늘어나지 않습니다.
+    - ping/pong은 websockets 라이브러리가 프로토콜 수준에서 처리
+    - 연결이 끊기면 지터를 섞은 지수 백오프로 재연결
+    - 수신 메시지는 message_received(구독 키, 데이터) 시그널로 GUI 스레드에 전달
+    - 바이너리 프레임은 binary_received(구독 키, 헤더, 본문) 시그널로 전달
+
+    config.json의 "websocket" 섹션(선택)으로 조정합니다:
+        ping_interval, ping_timeout, open_timeout, backoff_base, backoff_max, keepalive_interval (초)
+    """
+    message_received = Signal(str, object)
+    binary_received = Signal(str, object, bytes)
+    connected = Signal(str)
+    disconnected = Signal(str)
+    subscription_rejected = Signal(object)  # 서버가 거부한 구독 (GUI 스레드에서 목록에서 제거)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        settings = config.get("websocket", {})
+        self.ping_interval = settings.get("ping_interval", 20)
+        self.ping_timeout = settings.get("ping_timeout", 20)
+        self.open_timeout = settings.get("open_timeout", 10)
+        self.backoff_base = settings.get("backoff_base", 0.5)
+        self.backoff_max = settings.get("backoff_max", 30)
+        # 서버의 앱 수준 핑 메시지 ({"type": "ping"}) 간격, 0이면 보내지 않음
+        self.keepalive_interval = settings.get("keepalive_interval", 30)
+        # 이미지가 바이너리 프레임으로 오므로 기본 1MB 제한 대신 이미지 상한 + 헤더 여유
+        self.max_size = config["qr"].get("max_image_mb", 20) * 1024 * 1024 + 64 * 1024
+
+        self.ssl_context = ssl.create_default_context(cafile=certifi.where())
+        self.subscriptions = {}
+        self.loop = None
+        self.thread = None
+        self.lock = threading.Lock()
+        # 구독 목록은 GUI 스레드에서만 바꾸므로 루프 스레드의 거부 알림은 큐 연결로 받음
+        self.subscription_rejected.connect(self.remove_subscription)
+
+    def ensure_loop(self):
+        """이벤트 루프 스레드를 한 번만 시작"""
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(target=self.loop.run_forever, name="websocket-manager", daemon=True)
+            self.thread.start()
+
+    def subscribe(self, key, url):
+        """구독 시작 (같은 키가 있으면 기존 구독은 종료)"""
+        self.ensure_loop()
+        previous = self.subscriptions.get(key)
+        if previous is not None:
+            self.unsubscribe(previous)
+
+        subscription = Subscription(self, key, url)
+        self.subscriptions[key] = subscription
+
+        def start():
+            subscription.task = self.loop.create_task(self.run_subscription(subscription))
+
+        self.loop.call_soon_threadsafe(start)
+        return subscription
+
+    def remove_subscription(self, subscription):
+        # 같은 키로 새로 구독했으면 새 구독은 그대로 둠
+        if self.subscriptions.get(subscription.key) is subscription:
+            del self.subscriptions[subscription.key]
+
+    def unsubscribe(self, subscription):
+        subscription.closed = True
+        self.remove_subscription(subscription)
+
+        def cancel():
+            if subscription.task is not None:
+                subscription.task.cancel()
+
+        self.loop.call_soon_threadsafe(cancel)
+
+    def send(self, subscription, data):
+        async def send_message():
+            if subscription.connection is not None:
+                await subscription.connection.send(json.dumps(data))
+
+        asyncio.run_coroutine_threadsafe(send_message(), self.loop)
+
+    def active_count(self):
+        return len(self.subscriptions)
+
+    def backoff_delay(self, attempt):
+        # 지수 백오프에 지터를 섞어 여러 키오스크가 동시에 재연결하지 않도록 함
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+    async def run_subscription(self, subscription):
+        attempt = 0
+        ssl_context = self.ssl_context if subscription.url.startswith("wss") else None
+        while not subscription.closed:
+            try:
+                async with connect(subscription.url, ssl=ssl_context,
+                                   ping_interval=self.ping_interval,
+                                   ping_timeout=self.ping_timeout,
+                                   open_timeout=self.open_timeout,
+                                   max_size=self.max_size) as ws:
+                    subscription.connection = ws
+                    attempt = 0
+                    print(f"웹소켓 연결됨 ({subscription.key})")
+                    self.connected.emit(subscription.key)
+                    keepalive = asyncio.ensure_future(self.keepalive(ws))
+                    try:
+                        async for message in ws:
+                            self.dispatch(subscription, message)
+                    finally:
+                        keepalive.cancel()
+            except asyncio.CancelledError:
+                raise
+            except InvalidStatus as e:
+                # 핸드셰이크 거부 (없는 이벤트 등) - 다시 시도해도 소용없음
+                print(f"웹소켓 연결 거부 ({subscription.key}): {e}")
+                subscription.closed = True
+                self.subscription_rejected.emit(subscription)
+            except Exception as e:
+                print(f"웹소켓 오류 ({subscription.key}): {e}")
+            finally:
+                if subscription.connection is not None:
+                    subscription.connection = None
+                    self.disconnected.emit(subscription.key)
+
+            if subscription.closed:
+                break
+            delay = self.backoff_delay(attempt)
+            attempt += 1
+            print(f"웹소켓 재연결 대기 {delay:.1f}초 ({subscription.key})")
+            await asyncio.sleep(delay)
+
+    async def keepalive(self, ws):
+        if not self.keepalive_interval:
+            return
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            await ws.send(json.dumps({"type": "ping"}))
+
+    def dispatch(self, subscription, message):
+        if isinstance(message, bytes):
+            try:
+                header, payload = decode_binary_frame(message)
+            except ValueError as e:
+                print(f"[WebSocket] 잘못된 바이너리 프레임: {e}")
+                return
+            print(f"[WebSocket] 바이너리 수신: {header} ({len(payload)} bytes)")
+            self.binary_received.emit(subscription.key, header, payload)
+            return
+
+        try:
+            data = json.loads(message)
+        except ValueError:
+            print(f"[WebSocket] 알 수 없는 메시지: {message!r:.80}")
+            return
+        print("[WebSocket] 수신:", data)
+        self.message_received.emit(subscription.key, data)
+
+def websocket_manager():
+    return WebSocketManager.instance()
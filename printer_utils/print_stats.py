@@ -0,0 +1,87 @@
+"""
+인쇄 작업 소요 시간 기록 (용량 산정용)
+
+PrinterThread가 작업을 끝낼 때마다 한 줄씩 JSON Lines 형식으로 추가합니다.
+요약 보기:
+    python -m printer_utils.print_stats [파일 경로]
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+DEFAULT_STATS_FILE = "resources/print_stats.jsonl"
+
+def record_print_job(path, duration, success, stage_durations, image_count, text_count):
+    """인쇄 작업 한 건의 결과를 파일에 추가"""
+    if not path:
+        return
+    record = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "duration": round(duration, 3),
+        "success": success,
+        "stages": {stage: round(seconds, 3) for stage, seconds in stage_durations.items()},
+        "images": image_count,
+        "texts": text_count,
+    }
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        print(f"인쇄 기록 저장 실패: {e}")
+
+def load_print_stats(path=DEFAULT_STATS_FILE):
+    """기록 파일을 읽어 레코드 목록 반환 (깨진 줄은 건너뜀)"""
+    records = []
+    if not os.path.exists(path):
+        return records
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+def _percentile(ordered, pct):
+    if not ordered:
+        return 0.0
+    rank = min(len(ordered) - 1, max(0, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+def summarize_print_stats(records):
+    """성공한 작업 기준 소요 시간 분포와 시간당 처리 가능 매수"""
+    durations = sorted(r["duration"] for r in records if r.get("success"))
+    stage_totals = {}
+    for r in records:
+        if r.get("success"):
+            for stage, seconds in r.get("stages", {}).items():
+                stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+
+    mean = sum(durations) / len(durations) if durations else 0.0
+    return {
+        "jobs": len(records),
+        "succeeded": len(durations),
+        "mean": mean,
+        "p50": _percentile(durations, 50),
+        "p90": _percentile(durations, 90),
+        "p99": _percentile(durations, 99),
+        "max": durations[-1] if durations else 0.0,
+        "cards_per_hour": 3600.0 / mean if mean > 0 else 0.0,
+        "stage_mean": {stage: total / len(durations) for stage, total in stage_totals.items()},
+    }
+
+if __name__ == "__main__":
+    stats_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_STATS_FILE
+    summary = summarize_print_stats(load_print_stats(stats_path))
+    print(f"작업 {summary['jobs']}건 (성공 {summary['succeeded']}건)")
+    print(f"소요 시간: 평균 {summary['mean']:.2f}초, p50 {summary['p50']:.2f}초, "
+          f"p90 {summary['p90']:.2f}초, p99 {summary['p99']:.2f}초, 최대 {summary['max']:.2f}초")
+    print(f"프린터 1대 기준 시간당 최대 {summary['cards_per_hour']:.0f}장")
+    for stage, seconds in summary["stage_mean"].items():
+        print(f"  {stage}: 평균 {seconds:.2f}초")
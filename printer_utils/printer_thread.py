@@ -2,19 +2,28 @@ from PySide6.QtCore import QThread, Signal
 from .device_functions import get_device_list, get_device_id, open_device, draw_image, get_preview_bitmap, print_image, close_device, load_font, draw_text2, draw_barcode
 from .image_utils import bitmapinfo_to_image
 from .cffi_defs import ffi, SMART_OPENDEVICE_BYID, PAGE_FRONT, PANELID_COLOR
-from config import config
+from .print_stats import record_print_job, DEFAULT_STATS_FILE
+from config import config, get_settings
 import os
 import json
+import time
 
 class PrinterThread(QThread):
     finished = Signal()
     error = Signal(str)
+    progress = Signal(int, str)  # 진행률(0~100), 단계 이름
+    job_finished = Signal(bool, float)  # 성공 여부, 소요 시간(초) - 성공/실패와 관계없이 항상 발생
     # preview_ready = Signal(object)  # 미리보기 이미지 전달용
     
     def __init__(self):
         super().__init__()
         self.images = []  # 이미지 정보 저장 리스트
         self.texts = []   # 텍스트 정보 저장 리스트
+        self.succeeded = False
+        self.stage_durations = {}  # 단계별 소요 시간(초)
+        self.current_stage = None
+        self.stage_started = 0.0
+        self.printer_settings = get_settings().printer
         
     def add_image(self, image_filename, x, y, width, height):
         """이미지 그리기 작업 추가"""
@@ -167,9 +176,38 @@ class PrinterThread(QThread):
         # BGR 형식으로 재조합
         return (b << 16) | (g << 8) | r
     
+    def mark_stage(self, stage, percent):
+        """이전 단계의 소요 시간을 기록하고 진행률 시그널 발생"""
+        now = time.perf_counter()
+        if self.current_stage is not None:
+            elapsed = now - self.stage_started
+            self.stage_durations[self.current_stage] = self.stage_durations.get(self.current_stage, 0.0) + elapsed
+        self.current_stage = stage
+        self.stage_started = now
+        if stage is not None:
+            self.progress.emit(percent, stage)
+
     def run(self):
+        job_started = time.perf_counter()
+        self.succeeded = False
+        self.stage_durations = {}
+        self.current_stage = None
+        try:
+            self.print_job()
+        finally:
+            self.mark_stage(None, 100)
+            duration = time.perf_counter() - job_started
+            record_print_job(
+                DEFAULT_STATS_FILE if self.printer_settings.stats_file is None else self.printer_settings.stats_file,
+                duration, self.succeeded, self.stage_durations,
+                len(self.images), len(self.texts)
+            )
+            self.job_finished.emit(self.succeeded, duration)
+
+    def print_job(self):
         try:
             # 장치 목록 조회
+            self.mark_stage("connect", 5)
             result, printer_list = get_device_list()
             if result != 0:
                 self.error.emit("프린터 목록 가져오기 실패")
@@ -190,9 +228,10 @@ class PrinterThread(QThread):
                 loaded_fonts = {}
                 
                 # 이미지 그리기 (여러 개)
-                for img_info in self.images:
+                for i, img_info in enumerate(self.images):
+                    self.mark_stage("draw_images", 10 + 40 * i // len(self.images))
                     result = draw_image(
-                        device_handle, PAGE_FRONT, config["printer"]["panel_id"], 
+                        device_handle, PAGE_FRONT, self.printer_settings.panel_id, 
                         x=img_info["x"], y=img_info["y"],
                         cx=img_info["width"], cy=img_info["height"], 
                         image_filename=img_info["filename"]
@@ -202,7 +241,8 @@ class PrinterThread(QThread):
                         return
                 
                 # 텍스트 그리기 (여러 개)
-                for text_info in self.texts:
+                for i, text_info in enumerate(self.texts):
+                    self.mark_stage("draw_texts", 50 + 30 * i // len(self.texts))
                     # 폰트 로드 (중복 로드 방지)
                     font_path = f"resources/font/{text_info['font_name']}"
                     if font_path not in loaded_fonts:
@@ -223,7 +263,7 @@ class PrinterThread(QThread):
                         font_color = self.rgb_to_bgr(text_info["font_color"])
                         
                     result = draw_text2(
-                        device_handle, PAGE_FRONT, config["printer"]["panel_id"],
+                        device_handle, PAGE_FRONT, self.printer_settings.panel_id,
                         x=text_info["x"], y=text_info["y"], 
                         width=text_info["width"], height=text_info["height"], 
                         font_name=font_name, 
@@ -241,7 +281,7 @@ class PrinterThread(QThread):
                     
                 # 바코드 그리기
                 # result = draw_barcode(
-                #     device_handle, PAGE_FRONT, config["printer"]["panel_id"],
+                #     device_handle, PAGE_FRONT, self.printer_settings.panel_id,
                 #     x=200, y=400, width=300, height=100,
                 #     color=0x000000,
                 #     name="Code128(C)",  # 표준 바코드 유형 (CODE39, CODE128, QR, EAN13 등)
@@ -251,7 +291,8 @@ class PrinterThread(QThread):
                 # )
                 # if result != 0:
                 #     self.error.emit(f"바코드 그리기 실패 (오류 코드: {result})")
-                if config["printer"]["print_mode"]:
+                self.mark_stage("print" if self.printer_settings.print_mode else "preview", 85)
+                if self.printer_settings.print_mode:
                     # 이미지 인쇄
                     result = print_image(device_handle)
                     if result != 0:
@@ -267,6 +308,7 @@ class PrinterThread(QThread):
                     else:
                         self.error.emit("미리보기 비트맵 가져오기 실패")
                         return
+                self.succeeded = True
                 self.finished.emit()
             finally:
                 # 장치 닫기 (항상 실행)
@@ -1,25 +1,28 @@
 from PySide6.QtWidgets import QWidget, QLabel, QPushButton, QMessageBox
 from PySide6.QtGui import QPixmap, QImage
 from PySide6.QtCore import Qt, QTimer, Signal
-import qrcode
 from PIL import Image
 import io
-import requests
-import json
-import threading
-import websocket
-import certifi
 from io import BytesIO
 import uuid
 import os
-from config import config
+from config import config, get_settings
+from network_utils.http_client import http_client
+from network_utils.event_pool import EventPool
+from network_utils.websocket_manager import websocket_manager, kiosk_websocket_url
+from network_utils.image_downloader import ImageDownloader, InlineImageReceiver
+from components.qr_renderer import render_qr_pixmap
 
-# 서버 URL
-SERVER_URL = "https://port-0-kiosk-builder-m47pn82w3295ead8.sel4.cloudtype.app"
+# 서버 URL (테스트용 로컬 서버를 쓰려면 config.json의 "server_url"로 지정)
+SERVER_URL = config.get("server_url", "https://port-0-kiosk-builder-m47pn82w3295ead8.sel4.cloudtype.app")
 
 class QR_screen(QWidget):
     # 이미지 업로드 시그널 정의
     image_uploaded_signal = Signal(str)
+
+    # 이벤트 생성 재시도 간격 (ms, 실패할 때마다 두 배)
+    EVENT_RETRY_MIN_DELAY = 2000
+    EVENT_RETRY_MAX_DELAY = 30000
     
     def __init__(self, stack, screen_size, main_window):
         super().__init__()
@@ -32,19 +35,40 @@ class QR_screen(QWidget):
         self.event_name = None
         self.qr_url = None
         
-        # 웹소켓 객체 변수
+        # 웹소켓 구독 (연결/핑/재연결은 websocket_manager가 처리)
         self.ws = None 
-        
-        # 핑 타이머 변수 추가
-        self.ping_timer = None
+        websocket_manager().message_received.connect(self.on_websocket_message)
+        websocket_manager().binary_received.connect(self.on_websocket_binary)
+
+        # 진행 중인 HTTP 요청/다운로드 (화면을 벗어나면 취소)
+        self.event_request = None
+        self.image_downloader = None
+        self.fallback_image_url = None
+
+        # 이벤트 생성 실패 시 점점 늘어나는 간격으로 다시 시도 (화면에 있는 동안만)
+        self.event_retry_delay = self.EVENT_RETRY_MIN_DELAY
+        self.event_retry_timer = QTimer(self)
+        self.event_retry_timer.setSingleShot(True)
+        self.event_retry_timer.timeout.connect(self.create_event)
         
         # 이미지 업로드 시그널 연결
         self.image_uploaded_signal.connect(self.display_uploaded_image)
         
         self.setupUI()
         
-        # 화면 표시시 자동으로 이벤트 생성 및 QR 코드 표시
-        QTimer.singleShot(500, self.create_event)
+        # 세션이 시작되면 서버 연결(DNS/TLS)을 미리 맺어 QR 표시 지연을 줄임
+        self.stack.currentChanged.connect(self.prewarm_connection)
+
+        # 미리 만들어 둔 이벤트 (QR/웹소켓 준비 완료)
+        self.event_pool = EventPool(SERVER_URL, self)
+
+        if self.event_pool.enabled:
+            # QR 화면을 쓰지 않는 구성이면 서버에 이벤트를 만들지 않음
+            if 3 in get_settings().screen_order:
+                QTimer.singleShot(500, self.event_pool.start)
+        else:
+            # 화면 표시시 자동으로 이벤트 생성 및 QR 코드 표시
+            QTimer.singleShot(500, self.create_event)
     
     def setupUI(self):
         self.setupBackground()
@@ -116,21 +140,56 @@ class QR_screen(QWidget):
         self.preview_label.setText("아직 업로드된 이미지가 없습니다")
         self.preview_label.setVisible(False)  # 초기에는 숨김 상태로 설정
     
+    def prewarm_connection(self, index):
+        if index != 0 and self.ws is None:
+            http_client().prewarm(SERVER_URL)
+
+    def use_pooled_event(self):
+        """이벤트 풀에서 준비된 이벤트를 꺼내 바로 표시 (없으면 False)"""
+        event = self.event_pool.take()
+        if event is None:
+            return False
+
+        self.event_id = event.event_id
+        self.event_name = event.event_name
+        self.qr_url = event.qr_url
+        self.qr_label.setPixmap(event.qr_pixmap)
+        self.qr_label.setScaledContents(True)
+
+        # 이미 연결된 웹소켓 구독을 넘겨받음
+        self.ws = event.ws
+        print(f"[이벤트 풀] 이벤트 사용 {self.event_id}")
+        return True
+
     def create_event(self):
-        try:
-            # 키오스크 앱 이름을 이벤트 이름으로 사용
-            event_name = f"{config['app_name']}"
+        # 이미 요청 중이거나 이벤트가 있으면 다시 만들지 않음
+        if self.event_request is not None or self.ws is not None:
+            return
 
-            response = requests.post(
-                f"{SERVER_URL}/api/events/register",
-                params={"event_name": event_name}
-            )
+        # 키오스크 앱 이름을 이벤트 이름으로 사용
+        event_name = f"{config['app_name']}"
 
-            if response.status_code == 200:
-                event_data = response.json()
+        # GUI 스레드를 막지 않도록 비동기 요청, 결과는 시그널로 받음
+        self.event_request = http_client().post(
+            f"{SERVER_URL}/api/events/register",
+            params={"event_name": event_name}
+        )
+        self.event_request.finished.connect(self.on_event_created)
+        self.event_request.failed.connect(self.on_event_failed)
+
+    def on_event_created(self, status_code, body):
+        request = self.sender()
+        if request is not self.event_request:
+            return
+        self.event_request = None
+        try:
+            if status_code == 200:
+                event_data = request.json(body)
                 self.event_id = event_data["event_id"]
                 self.event_name = event_data["event_name"]
                 self.qr_url = event_data["qr_url"]
+                print(f"이벤트 생성 완료 ({request.elapsed_ms:.0f}ms, 시도 {request.attempts}회)")
+                self.event_retry_delay = self.EVENT_RETRY_MIN_DELAY
                 
                 # QR 코드 생성
                 self.generate_qr_code()
@@ -138,28 +197,34 @@ class QR_screen(QWidget):
                 # 웹소켓 연결 시작
                 self.start_kiosk_websocket()
             else:
-                print(f"이벤트 생성 실패: {response.text}")
+                print(f"이벤트 생성 실패: {body.decode('utf-8', errors='replace')}")
+                self.schedule_event_retry()
 
         except Exception as e:
             print(f"이벤트 생성 중 오류 발생: {str(e)}")
+            self.schedule_event_retry()
+
+    def on_event_failed(self, message):
+        if self.sender() is not self.event_request:
+            return
+        self.event_request = None
+        print(f"이벤트 생성 중 오류 발생: {message}")
+        self.schedule_event_retry()
+
+    def schedule_event_retry(self):
+        """이벤트 생성 실패 시 잠시 후 다시 시도 (화면을 벗어나면 cancel_requests에서 중지)"""
+        if not self.isVisible():
+            # 화면에 들어올 때 showEvent에서 다시 만듦
+            return
+        delay = self.event_retry_delay
+        self.event_retry_delay = min(delay * 2, self.EVENT_RETRY_MAX_DELAY)
+        print(f"이벤트 생성 재시도 {delay}ms 후")
+        self.qr_label.setText("QR 코드 생성 실패\n잠시 후 다시 시도합니다")
+        self.event_retry_timer.start(delay)
     
     def generate_qr_code(self):
         try:
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(self.qr_url)
-            qr.make(fit=True)
-            qr_img = qr.make_image(fill_color="black", back_color="white")
-
-            # PIL Image를 QPixmap으로 변환
-            byte_arr = io.BytesIO()
-            qr_img.save(byte_arr, format='PNG')
-            qimage = QImage.fromData(byte_arr.getvalue())
-            pixmap = QPixmap.fromImage(qimage)
+            pixmap = render_qr_pixmap(self.qr_url)
 
             # QR 이미지를 QLabel에 표시
             self.qr_label.setPixmap(pixmap)
@@ -168,92 +233,98 @@ class QR_screen(QWidget):
         except Exception as e:
             print(f"QR 코드 생성 중 오류 발생: {str(e)}")
     
-    def start_ping_timer(self):
-        """웹소켓 연결 유지를 위한 핑 타이머 시작"""
-        if self.ping_timer is None:
-            self.ping_timer = QTimer()
-            self.ping_timer.timeout.connect(self.send_ping)
-            self.ping_timer.start(30000)  # 30초마다 실행
-            print("핑 타이머 시작됨")
-    
-    def send_ping(self):
-        """웹소켓으로 핑 메시지 전송"""
-        if self.ws:
-            try:
-                self.ws.send(json.dumps({"type": "ping"}))
-                print("핑 메시지 전송")
-            except Exception as e:
-                print(f"핑 전송 오류: {e}")
-                # 연결 끊어진 경우 재연결 시도
-                self.reconnect_websocket()
-    
-    def reconnect_websocket(self):
-        """웹소켓 연결이 끊어진 경우 재연결 시도"""
-        if self.ws:
-            try:
-                self.ws.close()
-            except:
-                pass
-            self.ws = None
-        
-        print("웹소켓 재연결 시도")
-        self.start_kiosk_websocket()
-    
     def start_kiosk_websocket(self):
-        ws_url = f"{SERVER_URL.replace('https', 'wss')}/ws/kiosk/{self.event_id}"
-    
-        def on_message(ws, message):
-            data = json.loads(message)
-            print("[WebSocket] 수신:", data)
-            if data.get("type") == "image_uploaded":
-                image_url = f"{SERVER_URL}{data['image_url']}"
-                # GUI 스레드에서 이미지 표시를 위해 시그널 사용
-                self.image_uploaded_signal.emit(image_url)
-    
-        def on_open(ws):
-            print("웹소켓 연결됨")
-            # 연결 성공 후 핑 타이머 시작
-            self.start_ping_timer()
-    
-        def on_error(ws, error):
-            print("웹소켓 오류:", error)
-    
-        def on_close(ws, close_status_code, close_msg):
-            print("웹소켓 종료")
-    
-        self.ws = websocket.WebSocketApp(
-            ws_url,
-            on_message=on_message,
-            on_open=on_open,
-            on_error=on_error,
-            on_close=on_close
-        )
-        
-        # certifi의 인증서 번들을 사용하여 웹소켓 연결
-        threading.Thread(target=lambda: self.ws.run_forever(sslopt={"ca_certs": certifi.where()}), daemon=True).start()
+        ws_url = kiosk_websocket_url(SERVER_URL, self.event_id)
+        self.ws = websocket_manager().subscribe(self.event_id, ws_url)
+
+    def on_websocket_message(self, event_id, data):
+        # 현재 화면의 이벤트 메시지만 처리 (이벤트 풀에 대기 중인 구독 제외)
+        if event_id != self.event_id or self.ws is None:
+            return
+        if data.get("type") == "image_uploaded":
+            image_url = f"{SERVER_URL}{data['image_url']}"
+            self.image_uploaded_signal.emit(image_url)
+
+    def on_websocket_binary(self, event_id, header, payload):
+        """웹소켓으로 이미지 바이트가 바로 온 경우 (추가 HTTP 요청 없음)"""
+        if event_id != self.event_id or self.ws is None:
+            return
+        if header.get("type") != "image_uploaded":
+            return
+        print(f"[이미지 표시 시도] 웹소켓 바이너리 {len(payload)} bytes")
+        self.fallback_image_url = f"{SERVER_URL}{header['image_url']}" if header.get("image_url") else None
+        self.start_image_worker(InlineImageReceiver(payload, **self.image_worker_options()))
     
     def display_uploaded_image(self, image_url):
-        try:
-            print(f"[이미지 표시 시도] {image_url}")
-            response = requests.get(image_url)
-            response.raise_for_status()
+        """업로드 이미지를 워커 스레드에서 스트리밍으로 받아 미리보기 크기로 디코딩"""
+        print(f"[이미지 표시 시도] {image_url}")
+        self.fallback_image_url = None
+        self.start_image_worker(ImageDownloader(image_url, **self.image_worker_options()))
 
-            img_data = BytesIO(response.content)
-            
-            # 간단한 파일명으로 이미지를 resources 폴더에 저장
-            file_name = "qr_uploaded_image.jpg"
-            save_path = os.path.join("resources", file_name)
-            
-            # 디렉토리가 존재하는지 확인하고 없으면 생성
-            os.makedirs("resources", exist_ok=True)
-            
-            # 이미지 저장
-            with open(save_path, 'wb') as f:
-                f.write(img_data.getvalue())
-            print(f"[이미지 저장 성공] {save_path}")
-            
-            # 이미지 표시 관련 코드
-            img = QImage.fromData(img_data.getvalue())
+    def print_size(self):
+        """
+        업로드 사진의 인쇄 크기 (qr_uploaded_image 영역 × qr.print_scale)
+
+        qr.normalize_photo를 false로 두면 None (원본을 그대로 저장하고 프린터 DLL이 리샘플링)
+        """
+        if not config["qr"].get("normalize_photo", True):
+            return None
+        area = config.get("qr_uploaded_image", {})
+        scale = config["qr"].get("print_scale", 1.0)
+        return (max(1, round(area.get("width", 300) * scale)),
+                max(1, round(area.get("height", 300) * scale)))
+
+    def image_worker_options(self):
+        return {
+            "save_path": os.path.join("resources", "qr_uploaded_image.jpg"),
+            "preview_size": (config["qr"]["preview_width"], config["qr"]["preview_height"]),
+            "max_bytes": config["qr"].get("max_image_mb", 20) * 1024 * 1024,
+            "print_size": self.print_size(),
+            "print_quality": config["qr"].get("print_quality", 95),
+            "parent": self,
+        }
+
+    def start_image_worker(self, worker):
+        self.cancel_image_download()
+        self.image_downloader = worker
+        self.image_downloader.preview_ready.connect(self.on_image_downloaded)
+        self.image_downloader.failed.connect(self.on_image_failed)
+        self.image_downloader.finished.connect(self.image_downloader.deleteLater)
+        self.image_downloader.start()
+
+    def on_image_downloaded(self, image, save_path):
+        if self.sender() is not self.image_downloader:
+            return
+        self.image_downloader = None
+        self.apply_uploaded_image(image, save_path)
+
+    def on_image_failed(self, message):
+        if self.sender() is not self.image_downloader:
+            return
+        self.image_downloader = None
+        print(f"[이미지 표시 및 저장 오류]: {message}")
+        # 바이너리로 받은 이미지가 깨졌으면 URL로 다시 받음
+        if self.fallback_image_url:
+            self.display_uploaded_image(self.fallback_image_url)
+
+    def cancel_image_download(self):
+        if self.image_downloader is not None:
+            # 스레드는 다음 청크에서 멈추고 finished 후 스스로 삭제됨
+            self.image_downloader.requestInterruption()
+            self.image_downloader = None
+
+    def cancel_requests(self):
+        """화면을 벗어날 때 진행 중인 요청 취소 (늦게 온 응답으로 웹소켓이 열리지 않도록)"""
+        if self.event_request is not None:
+            self.event_request.abort()
+        self.event_request = None
+        self.event_retry_timer.stop()
+        self.event_retry_delay = self.EVENT_RETRY_MIN_DELAY
+        self.cancel_image_download()
+
+    def apply_uploaded_image(self, img, save_path):
+        """미리보기 크기로 디코딩된 이미지를 표시하고 인쇄용 원본 경로를 등록"""
+        try:
             if img.isNull():
                 print("[이미지 로드 실패] 이미지가 null입니다.")
                 return
@@ -262,11 +333,6 @@ class QR_screen(QWidget):
             if pixmap.isNull():
                 print("[픽스맵 변환 실패] 픽스맵이 null입니다.")
                 return
-            
-            # 이미지 크기 조정
-            pixmap = pixmap.scaled(config["qr"]["preview_width"], config["qr"]["preview_height"], 
-                                Qt.AspectRatioMode.KeepAspectRatio, 
-                                Qt.TransformationMode.SmoothTransformation)
 
             # 미리보기 라벨에 이미지 표시
             self.preview_label.setPixmap(pixmap)
@@ -325,6 +391,14 @@ class QR_screen(QWidget):
         """)
         self.close_button.clicked.connect(self.main_window.closeApplication)
     
+    def releaseSessionResources(self):
+        """세션 종료 시 미리보기/QR 이미지 해제 (다음 표시 때 다시 생성됨)"""
+        if self.isVisible():
+            return
+        self.preview_label.setPixmap(QPixmap())
+        if self.ws is None:
+            self.qr_label.setPixmap(QPixmap())
+
     # 인쇄 버튼 추가
     def addPrintButton(self):
         # QR 코드 위치 및 크기 가져오기
@@ -355,11 +429,6 @@ class QR_screen(QWidget):
         self.preview_label.setText("아직 업로드된 이미지가 없습니다")  # 그 다음 텍스트 설정
         self.preview_label.setVisible(False)  # 라벨 숨기기
         
-        # 타이머 정리
-        if self.ping_timer:
-            self.ping_timer.stop()
-            self.ping_timer = None
-        
         # 웹소켓 닫기
         if self.ws:
             self.ws.close()
@@ -415,11 +484,6 @@ class QR_screen(QWidget):
         self.preview_label.setText("아직 업로드된 이미지가 없습니다")  # 그 다음 텍스트 설정
         self.preview_label.setVisible(False)  # 라벨 숨기기
 
-        # 타이머 정리
-        if self.ping_timer:
-            self.ping_timer.stop()
-            self.ping_timer = None
-        
         # 웹소켓 닫기
         if self.ws:
             self.ws.close()
@@ -465,16 +529,14 @@ class QR_screen(QWidget):
                 }
             """)
             
-            # 이벤트 생성 및 QR 코드 표시 시작
-            QTimer.singleShot(100, self.create_event)
+            # 준비된 이벤트가 있으면 바로 표시, 없으면 새로 생성
+            if not self.use_pooled_event():
+                self.create_event()
 
     # 화면이 닫힐 때 이벤트 처리 (예: 앱 종료 시)
     def hideEvent(self, event):
-        # 타이머 정리
-        if self.ping_timer:
-            self.ping_timer.stop()
-            self.ping_timer = None
-        
+        self.cancel_requests()
+
         # 웹소켓 닫기
         if self.ws:
             self.ws.close()
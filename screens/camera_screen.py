@@ -1,8 +1,8 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QPixmap
-from webcam_utils.webcam_controller import WebcamViewer
-from config import config
+from webcam_utils.webcam_controller import WebcamViewer, release_camera
+from config import get_settings
 import os
 
 class CameraScreen(QWidget):
@@ -17,22 +17,24 @@ class CameraScreen(QWidget):
         self.setupBackground()
         # preview_width는 widget의 너비이고 camera_width는 카메라 화질의 너비입니다
         # 프리뷰 크기가 카메라 전체 크기가 아니니 참고 바랍니다 (카메라 크기는 config.json에 있습니다)
-        self.preview_width = config["frame"]["width"]
-        self.preview_height = config["frame"]["height"]
-        self.camera_width = config["camera_size"]["width"]
-        self.camera_height = config["camera_size"]["height"]
-        if 1 in config["screen_order"]:
+        settings = get_settings()
+        frame = settings.frame
+        self.preview_width = frame.width
+        self.preview_height = frame.height
+        self.camera_width = settings.camera_size.width
+        self.camera_height = settings.camera_size.height
+        if 1 in settings.screen_order:
             self.webcam = WebcamViewer(
                 preview_width=self.preview_width, 
                 preview_height=self.preview_height, 
                 camera_width=self.camera_width, 
                 camera_height=self.camera_height, 
-                x=config["frame"]["x"], 
-                y=config["frame"]["y"], 
-                countdown=config["camera_count"]["number"]
+                x=frame.x, 
+                y=frame.y, 
+                countdown=settings.camera_count.number
             )
             self.webcam.setParent(self)
-            self.webcam.setGeometry(config["frame"]["x"], config["frame"]["y"], self.preview_width, self.preview_height)
+            self.webcam.setGeometry(frame.x, frame.y, self.preview_width, self.preview_height)
             self.webcam.photo_captured_signal.connect(self.onPhotoCaptured)
         self.addCloseButton()
 
@@ -62,6 +64,21 @@ class CameraScreen(QWidget):
         next_index = self.main_window.getNextScreenIndex()
         self.stack.setCurrentIndex(next_index)
 
+    def releaseSessionResources(self):
+        """세션 종료 시 카운트다운 스레드와 마지막 프리뷰 프레임 해제"""
+        if hasattr(self, 'webcam'):
+            self.webcam.reset_countdown()
+            if not self.isVisible():
+                self.webcam.preview_label.clear()
+
+    def releaseCamera(self):
+        """화면을 새로 만들기 전에 카메라 장치 해제 (새 화면이 같은 카메라를 다시 엶)"""
+        if hasattr(self, 'webcam'):
+            self.webcam.reset_countdown()
+            self.webcam.timer.stop()
+            release_camera(self.webcam.camera)
+            self.webcam.camera = None
+
     def addCloseButton(self):
         """오른쪽 상단에 닫기 버튼 추가"""
         self.close_button = QPushButton("X", self)
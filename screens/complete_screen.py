@@ -1,8 +1,9 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 from PySide6.QtCore import QTimer
-from PySide6.QtGui import QPixmap, QFont, Qt, QFontDatabase
+from PySide6.QtGui import QPixmap, QFont, Qt
 
-from config import config
+from config import config, get_settings
+from components.font_registry import font_registry
 import os
 
 class CompleteScreen(QWidget):
@@ -11,22 +12,8 @@ class CompleteScreen(QWidget):
         self.stack = stack
         self.screen_size = screen_size
         self.main_window = main_window
-        self.loadCustomFont()
         self.setupUI()
 
-    def loadCustomFont(self):
-        """커스텀 폰트 로드"""
-        font_name = config["complete"]["font"]
-        font_path = os.path.join("resources", "font", font_name)
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                self.font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            else:
-                self.font_family = "맑은 고딕"  # 폰트 로드 실패 시 기본 폰트
-        else:
-            self.font_family = "맑은 고딕"  # 폰트 파일이 없을 때 기본 폰트
-
     def setupUI(self):
         self.setupBackground()
         self.addCloseButton()
@@ -61,9 +48,7 @@ class CompleteScreen(QWidget):
         complete_label.setText(config["complete"]["phrase"])
         
         # 커스텀 폰트 적용
-        custom_font = QFont(self.font_family)
-        custom_font.setPointSize(config["complete"]["font_size"])
-        complete_label.setFont(custom_font)
+        font_registry().bind_label(complete_label, "complete")
         
         # 스타일시트 수정 (폰트 패밀리 제거)
         complete_label_style = f""" color: {config["complete"]["font_color"]};"""
@@ -74,7 +59,7 @@ class CompleteScreen(QWidget):
         
     def getNextScreenIndex(self):
         self.current_index = 0
-        return config["screen_order"][self.current_index]
+        return get_settings().screen_order[self.current_index]
     
     def showEvent(self, event):
         """화면이 표시될 때 2초 후 스플래시 화면으로 이동"""
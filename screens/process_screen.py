@@ -1,34 +1,42 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QMessageBox
-from PySide6.QtCore import QTimer
-from PySide6.QtGui import QPixmap, QFont, Qt, QFontDatabase
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QMessageBox, QProgressBar
+from PySide6.QtCore import QTimer, QElapsedTimer
+from PySide6.QtGui import QPixmap, QFont, Qt
 
 from printer_utils.printer_thread import PrinterThread
+from monitor_utils.memory_watchdog import watch_thread
 from config import config
+from components.font_registry import font_registry
 import os
 
 class ProcessScreen(QWidget):
+    """
+    발급중 화면
+
+    인쇄 작업이 끝나면 다음 화면으로 이동합니다 (고정 타이머가 아닌 완료 기준).
+    - process.min_display_time: 작업이 빨리 끝나도 화면을 보여주는 최소 시간(ms)
+    - process.max_wait_time: 작업이 끝나지 않아도 이동하는 최대 대기 시간(ms)
+    - process.process_time: 인쇄가 실패했을 때 화면을 유지하는 시간(ms)
+    """
     def __init__(self, stack, screen_size, main_window):
         super().__init__()
         self.stack = stack
         self.screen_size = screen_size
         self.main_window = main_window
         self.printer_thread = None
-        self.loadCustomFont()
+        self.min_display_time = config["process"].get("min_display_time", 1000)
+        self.max_wait_time = config["process"].get("max_wait_time", 120000)
+        self.shown_timer = QElapsedTimer()
+
+        # 다음 화면 이동 타이머 (화면을 벗어나면 정지되도록 단발성 멤버 타이머 사용)
+        self.advance_timer = QTimer(self)
+        self.advance_timer.setSingleShot(True)
+        self.advance_timer.timeout.connect(self.goToNextScreen)
+        self.timeout_timer = QTimer(self)
+        self.timeout_timer.setSingleShot(True)
+        self.timeout_timer.timeout.connect(self.onPrintTimeout)
+
         self.setupUI()
     
-    def loadCustomFont(self):
-        """커스텀 폰트 로드"""
-        font_name = config["process"]["font"]
-        font_path = os.path.join("resources", "font", font_name)
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                self.font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            else:
-                self.font_family = "맑은 고딕"  # 폰트 로드 실패 시 기본 폰트
-        else:
-            self.font_family = "맑은 고딕"  # 폰트 파일이 없을 때 기본 폰트
-    
     def setupUI(self):
         self.setupBackground()
         self.addCloseButton()
@@ -37,6 +45,28 @@ class ProcessScreen(QWidget):
         self.process_label = self.createProcessLabel()
         self.process_label.setGeometry(config["process"]["x"], config["process"]["y"],
                                        self.process_label.sizeHint().width(), self.process_label.sizeHint().height())
+        self.progress_bar = self.createProgressBar()
+
+    def createProgressBar(self):
+        """프린터 단계별 진행률 표시줄 (화면 하단 중앙)"""
+        progress_bar = QProgressBar(self)
+        progress_bar.setRange(0, 100)
+        progress_bar.setTextVisible(False)
+        bar_width = self.screen_size[0] * 2 // 5
+        progress_bar.setGeometry((self.screen_size[0] - bar_width) // 2, self.screen_size[1] * 4 // 5, bar_width, 16)
+        progress_bar.setStyleSheet(f"""
+            QProgressBar {{
+                background-color: rgba(255, 255, 255, 60);
+                border: none;
+                border-radius: 8px;
+            }}
+            QProgressBar::chunk {{
+                background-color: {config["process"]["font_color"]};
+                border-radius: 8px;
+            }}
+        """)
+        progress_bar.setVisible(config["process"].get("show_progress", True))
+        return progress_bar
     
     def setupBackground(self):
         # 먼저 인덱스 기반 파일(0.jpg, 0.png)을 찾고, 없으면 기존 파일명 사용
@@ -63,9 +93,7 @@ class ProcessScreen(QWidget):
         process_label.setText(config["process"]["phrase"])
         
         # 커스텀 폰트 적용
-        custom_font = QFont(self.font_family)
-        custom_font.setPointSize(config["process"]["font_size"])
-        process_label.setFont(custom_font)
+        font_registry().bind_label(process_label, "process")
         
         # 스타일시트 수정 (폰트 패밀리 제거)
         process_label_style = f""" color: {config["process"]["font_color"]};"""
@@ -75,22 +103,69 @@ class ProcessScreen(QWidget):
         return process_label
         
     def showEvent(self, event):
+        self.shown_timer.start()
+        self.advance_timer.stop()
+        self.progress_bar.setValue(0)
+
         # PrinterThread가 이미 실행 중인지 확인
         if self.printer_thread is None or not self.printer_thread.isRunning():
             # 프린터 스레드 생성
-            self.printer_thread = PrinterThread()
+            self.printer_thread = watch_thread(PrinterThread())
             
             # 에러 시그널을 팝업 메시지 표시 함수에 연결
             self.printer_thread.error.connect(self.show_error_popup)
+            self.printer_thread.progress.connect(self.onPrintProgress)
+            self.printer_thread.job_finished.connect(self.onPrintFinished)
 
             # 기본 설정에서 컨텐츠 로드
             self.printer_thread.load_contents()
 
             # 스레드 시작
             self.printer_thread.start()
+
+        # 작업이 끝나지 않는 경우를 대비한 최대 대기 시간
+        self.timeout_timer.start(self.max_wait_time)
+
+    def hideEvent(self, event):
+        self.advance_timer.stop()
+        self.timeout_timer.stop()
+        super().hideEvent(event)
+
+    def onPrintProgress(self, percent, stage):
+        """프린터 단계 시그널로 진행률 갱신"""
+        self.progress_bar.setValue(percent)
+
+    def onPrintFinished(self, success, duration):
+        """인쇄 작업 완료 시 최소 표시 시간을 채운 뒤 다음 화면으로 이동"""
+        if not self.isVisible():
+            return
+        self.timeout_timer.stop()
+        self.progress_bar.setValue(100)
+        display_time = self.min_display_time if success else config["process"]["process_time"]
+        remaining = max(0, display_time - self.shown_timer.elapsed())
+        self.advance_timer.start(remaining)
+
+    def onPrintTimeout(self):
+        print(f"인쇄 작업이 {self.max_wait_time}ms 안에 끝나지 않아 다음 화면으로 이동합니다")
+        self.goToNextScreen()
+
+    def goToNextScreen(self):
+        if not self.isVisible():
+            return
+        self.advance_timer.stop()
+        self.timeout_timer.stop()
         next_index = self.main_window.getNextScreenIndex()
-        QTimer.singleShot(config["process"]["process_time"], lambda: self.stack.setCurrentIndex(next_index))
+        self.stack.setCurrentIndex(next_index)
         
+    def isPrinting(self):
+        return self.printer_thread is not None and self.printer_thread.isRunning()
+
+    def releaseSessionResources(self):
+        """세션 종료 시 끝난 프린터 스레드 해제"""
+        if self.printer_thread is not None and not self.printer_thread.isRunning():
+            self.printer_thread.deleteLater()
+            self.printer_thread = None
+
     def show_error_popup(self, error_message):
         """프린터 에러 메시지를 팝업으로 표시"""
         QMessageBox.critical(self, "프린터 오류", error_message)
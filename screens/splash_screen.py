@@ -1,8 +1,10 @@
 from PySide6.QtWidgets import QWidget, QLabel, QGraphicsOpacityEffect, QPushButton
-from PySide6.QtGui import QPixmap, QFont, QFontDatabase
+from PySide6.QtGui import QPixmap, QFont
 from PySide6.QtCore import Qt, QPropertyAnimation, QSequentialAnimationGroup
 import os
 from config import config
+from components.font_registry import font_registry
+from components.pulse_label import PulseLabel
 
 class SplashScreen(QWidget):
     def __init__(self, stack, screen_size, main_window):
@@ -10,23 +12,9 @@ class SplashScreen(QWidget):
         self.stack = stack
         self.screen_size = screen_size
         self.main_window = main_window
-        self.loadCustomFont()
         self.setupUI()
         self.startAnimation()
 
-    def loadCustomFont(self):
-        """커스텀 폰트 로드"""
-        font_name = config["splash"]["font"]
-        font_path = os.path.join("resources", "font", font_name)
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                self.font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            else:
-                self.font_family = "맑은 고딕"  # 폰트 로드 실패 시 기본 폰트
-        else:
-            self.font_family = "맑은 고딕"  # 폰트 파일이 없을 때 기본 폰트
-
     def setupUI(self):
         self.setupBackground()
         self.addCloseButton()
@@ -54,13 +42,18 @@ class SplashScreen(QWidget):
         background_label.resize(*self.screen_size)
 
     def createSplashLabel(self):
+        # 기본은 캐시 픽스맵 방식, "effect"로 설정하면 기존 QGraphicsOpacityEffect 방식
+        if config["splash"].get("animation_backend", "pixmap") == "pixmap":
+            splash_label = PulseLabel(config["splash"]["phrase"], config["splash"]["font_color"],
+                                      fps=config["splash"].get("animation_fps", 30), parent=self)
+            font_registry().bind_label(splash_label, "splash")
+            return splash_label
+
         splash_label = QLabel(self)  # 부모 위젯을 self로 지정
         splash_label.setText(config["splash"]["phrase"])
         
         # 커스텀 폰트 적용
-        custom_font = QFont(self.font_family)
-        custom_font.setPointSize(config["splash"]["font_size"])
-        splash_label.setFont(custom_font)
+        font_registry().bind_label(splash_label, "splash")
         
         # 스타일시트 수정 (폰트 패밀리 제거)
         splash_label_style = f""" color: {config["splash"]["font_color"]};"""
@@ -72,6 +65,10 @@ class SplashScreen(QWidget):
         return splash_label
     
     def startAnimation(self):
+        if isinstance(self.splash_label, PulseLabel):
+            # 픽스맵 방식은 라벨이 보일 때 스스로 타이머를 돌림
+            return
+
         # 🔹 애니메이션 설정 (opacity: 0.3 → 1.0)
         fade_in = QPropertyAnimation(self.opacity_effect, b"opacity")
         fade_in.setDuration(1000)  # 1초 동안 변화
@@ -3,7 +3,10 @@ from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap, QFont
 from components.hangul_composer import HangulComposer
 from components.virtual_keyboard import VirtualKeyboard
-from config import config
+from components.painted_keyboard import PaintedKeyboard
+from components.font_registry import font_registry
+from components.text_fit import TextFit
+from config import config, get_settings
 import os
 
 class CustomLineEdit(QLineEdit):
@@ -18,6 +21,15 @@ class CustomLineEdit(QLineEdit):
             self.on_focus(self)
 
 class TextInputScreen(QWidget):
+    """
+    사용자 텍스트 입력 화면
+
+    입력하는 동안 각 항목의 인쇄 영역(text_input.items[i]의 width/height, output_font,
+    output_font_size)에 글자가 들어가는지 계산해서 입력 필드 아래에 표시합니다.
+    config.json "text_input" 선택 설정:
+        "fit_indicator": false      인쇄 크기 표시 끄기 (기본 true)
+        "min_fit_ratio": 0.5        자동 맞춤 크기가 설정 크기의 이 비율보다 작으면 경고 색으로 표시
+    """
     def __init__(self, stack, screen_size, main_window):
         super().__init__()
         self.stack = stack
@@ -25,6 +37,8 @@ class TextInputScreen(QWidget):
         self.main_window = main_window
         self.active_input = None  # 현재 활성화된 입력 필드
         self.text_inputs = []  # 모든 텍스트 입력 필드 관리
+        self.text_fits = []  # 입력 필드별 인쇄 영역 맞춤 계산 (TextFit)
+        self.fit_labels = []
         self.keyboard = None
         self.setupUI()
     
@@ -82,21 +96,90 @@ class TextInputScreen(QWidget):
             
             # 입력 필드 리스트에 추가
             self.text_inputs.append(text_input)
+
+            if config["text_input"].get("fit_indicator", True):
+                fit_label = QLabel(self)
+                fit_label.setGeometry(x, y + height + 5, width, 30)
+                fit_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.fit_labels.append(fit_label)
+                self.text_fits.append(self.create_text_fit(item_config))
+                text_input.textChanged.connect(lambda text, index=i: self.update_fit(index, text))
+
+        if self.fit_labels:
+            # 출력 폰트가 나중에 등록되면 그 폰트로 다시 계산
+            font_registry().font_loaded.connect(self.on_font_loaded)
         
         # 가상 키보드 초기화 (첫 번째 입력 필드 연결)
         if self.text_inputs:
             self.active_input = self.text_inputs[0]
             self.active_input.setFocus()
-            
-            self.keyboard = VirtualKeyboard(self.active_input)
-            self.keyboard.setGeometry(
-                config["keyboard"]["x"],
-                config["keyboard"]["y"],
-                config["keyboard"]["width"],
-                config["keyboard"]["height"]
-            )
-            self.keyboard.setParent(self)
+            self.keyboard = self.createKeyboard()
+
+    def createKeyboard(self):
+        # 기본은 한 위젯에 직접 그리는 키보드, "renderer": "buttons"면 키마다 QPushButton
+        keyboard_settings = get_settings().keyboard
+        if keyboard_settings.renderer == "buttons":
+            keyboard = VirtualKeyboard(self.active_input)
+        else:
+            keyboard = PaintedKeyboard(self.active_input)
+        keyboard.setGeometry(
+            keyboard_settings.x,
+            keyboard_settings.y,
+            keyboard_settings.width,
+            keyboard_settings.height
+        )
+        keyboard.setParent(self)
+        return keyboard
+
+    def rebuildKeyboard(self):
+        """키보드 설정이 바뀌었을 때 키보드만 새로 만듦 (입력 필드와 화면은 그대로)"""
+        if not self.keyboard:
+            return
+        VirtualKeyboard.reset_layout()
+        old_keyboard = self.keyboard
+        old_keyboard.input_widget.textChanged.disconnect(old_keyboard.on_input_text_changed)
+        self.keyboard = self.createKeyboard()
+        old_keyboard.hide()
+        old_keyboard.deleteLater()
+        if self.isVisible():
+            self.keyboard.show()
     
+    def create_text_fit(self, item_config):
+        # 처음 쓰는 폰트면 등록한 뒤 font_loaded로 다시 계산
+        font_registry().request_font(item_config.get("output_font", ""))
+        return TextFit(
+            font_registry().family(item_config.get("output_font", "")),
+            item_config.get("output_font_size", 16),
+            item_config.get("width", 300),
+            item_config.get("height", 300),
+            item_config.get("option", 4)
+        )
+
+    def update_fit(self, index, text):
+        """인쇄했을 때 글자 크기 표시 (설정 크기 그대로 들어가면 비워 둠)"""
+        label = self.fit_labels[index]
+        result = self.text_fits[index].fit(text)
+        if result.fits:
+            message, color = "", "black"
+        elif result.fit_size == result.font_size:
+            # 자동 맞춤을 쓰지 않는 항목은 영역을 넘는 부분이 잘림
+            message, color = "인쇄 영역을 넘어 일부가 잘립니다", "#E53E3E"
+        else:
+            message = f"인쇄 시 글자 크기 {result.font_size} → {result.fit_size}"
+            too_small = result.fit_size < result.font_size * config["text_input"].get("min_fit_ratio", 0.5)
+            color = "#E53E3E" if too_small else "#DD6B20"
+        if label.text() != message:
+            label.setText(message)
+            label.setStyleSheet(f"color: {color}; font-size: 18px;")
+
+    def on_font_loaded(self, file_name, family):
+        items = config["text_input"]["items"]
+        for i, input_field in enumerate(self.text_inputs):
+            item_config = items[i] if i < len(items) else {}
+            if item_config.get("output_font", "") == file_name:
+                self.text_fits[i] = self.create_text_fit(item_config)
+                self.update_fit(i, input_field.text())
+
     def input_focus_received(self, input_field):
         """입력 필드가 포커스를 받았을 때 호출됨"""
         # print(f"포커스 변경: 인덱스 {input_field.index}로 변경")
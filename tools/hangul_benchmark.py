@@ -0,0 +1,162 @@
+# tools/hangul_benchmark.py
+"""
+한글 입력 처리 속도 벤치마크 (초당 키 입력 수)
+
+작업 종류:
+    typing          일반 글자 (홑모음, 홑받침)
+    compound_vowel  복합 모음 (ㅘ ㅝ ㅢ ...) 위주
+    complex_jong    겹받침 (ㄺ ㅄ ...) 위주
+    backspace       단어를 입력하고 백스페이스로 모두 지우기를 반복
+대상:
+    HangulComposer / HangulAutomaton의 add_jamo, HangulAutomaton.compose (한 번에 입력),
+    VirtualKeyboard (offscreen, 실제 버튼 처리 경로, 조합기별)
+입력은 tools.hangul_fuzz의 참조 분해로 만들고, 같은 seed면 같은 입력입니다.
+
+사용 예 (프로젝트 루트에서 실행):
+    python -m tools.hangul_benchmark --words 2000 --repeat 5
+    python -m tools.hangul_benchmark --json hangul_bench.json
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import random
+import time
+
+from PySide6.QtWidgets import QApplication
+
+# 프로젝트 루트를 import 경로에 추가 (python tools/hangul_benchmark.py 로 실행한 경우)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from config import config, refresh_settings
+from components.hangul_composer import HangulComposer
+from components.hangul_automaton import HangulAutomaton
+from tools.hangul_fuzz import JONG_KEYS, JUNGSUNG, JONGSUNG, VOWEL_KEYS, KeyboardDriver, random_syllable, syllable_keys
+
+SIMPLE_VOWELS = [v for v in JUNGSUNG if v not in VOWEL_KEYS]
+SIMPLE_FINALS = [j for j in JONGSUNG if j not in JONG_KEYS]
+BACKSPACE = None  # 작업 목록에서 백스페이스 표시
+
+WORKLOADS = {
+    "typing": {"vowels": SIMPLE_VOWELS, "finals": SIMPLE_FINALS},
+    "compound_vowel": {"vowels": list(VOWEL_KEYS), "finals": SIMPLE_FINALS},
+    "complex_jong": {"vowels": SIMPLE_VOWELS, "finals": list(JONG_KEYS)},
+    "backspace": {"vowels": None, "finals": None},
+}
+
+def make_words(rng, name, count, max_syllables=6):
+    """작업 종류에 맞는 단어 목록 (단어 = 자모 키 입력 목록)"""
+    options = WORKLOADS[name]
+    words = []
+    for _ in range(count):
+        syllables = [random_syllable(rng, options["vowels"], options["finals"])
+                     for _ in range(rng.randint(1, max_syllables))]
+        words.append(list("".join(syllable_keys(s) for s in syllables)))
+    return words
+
+def operations(name, word):
+    """단어 하나에 대한 입력 순서 (backspace 작업이면 입력한 만큼 지우기 추가)"""
+    if name != "backspace":
+        return word
+    return word + [BACKSPACE] * len(word)
+
+def run_composer(composer_class, name, words):
+    composer = composer_class()
+    sequences = [operations(name, word) for word in words]
+    keystrokes = 0
+    started = time.perf_counter()
+    for ops in sequences:
+        for op in ops:
+            if op is BACKSPACE:
+                composer.backspace()
+            else:
+                composer.add_jamo(op)
+        keystrokes += len(ops)
+        composer.reset()
+    return keystrokes, time.perf_counter() - started
+
+def run_compose(name, words):
+    if name == "backspace":
+        return None
+    automaton = HangulAutomaton()
+    keystrokes = 0
+    started = time.perf_counter()
+    for word in words:
+        automaton.compose(word)
+        automaton.reset()
+        keystrokes += len(word)
+    return keystrokes, time.perf_counter() - started
+
+def run_keyboard(driver, composer_class, name, words):
+    keystrokes = 0
+    elapsed = 0.0
+    for word in words:
+        driver.restart()
+        driver.keyboard.hangul_composer = composer_class()
+        started = time.perf_counter()
+        driver.type(word)
+        if name == "backspace":
+            driver.backspace(len(word))
+            keystrokes += len(word)
+        elapsed += time.perf_counter() - started
+        keystrokes += len(word)
+    return keystrokes, elapsed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="한글 입력 처리 속도 벤치마크")
+    parser.add_argument("--words", type=int, default=1000, help="작업별 단어 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    # 글자 수 제한에 걸리지 않도록 (단어마다 입력 필드를 비움)
+    config["keyboard"]["max_hangul"] = 1000
+    refresh_settings()
+    driver = KeyboardDriver()
+
+    targets = {
+        "HangulComposer": lambda name, words: run_composer(HangulComposer, name, words),
+        "HangulAutomaton": lambda name, words: run_composer(HangulAutomaton, name, words),
+        "Automaton.compose": run_compose,
+        "Keyboard+Composer": lambda name, words: run_keyboard(driver, HangulComposer, name, words),
+        "Keyboard+Automaton": lambda name, words: run_keyboard(driver, HangulAutomaton, name, words),
+    }
+
+    report = {}
+    for name in WORKLOADS:
+        words = make_words(random.Random(f"{args.seed}-{name}"), name, args.words)
+        report[name] = {}
+        for target, run in targets.items():
+            best = None
+            for _ in range(args.repeat):
+                result = run(name, words)
+                if result is None:
+                    break
+                keystrokes, elapsed = result
+                rate = keystrokes / max(elapsed, 1e-9)
+                best = rate if best is None else max(best, rate)
+            if best is not None:
+                report[name][target] = best
+
+    print("\n=== 한글 입력 벤치마크 (초당 키 입력 수) ===")
+    print(f"{'대상':<22}" + "".join(f"{name:>16}" for name in WORKLOADS))
+    for target in targets:
+        cells = [f"{report[name][target]:>16,.0f}" if target in report[name] else f"{'-':>16}"
+                 for name in WORKLOADS]
+        print(f"{target:<22}" + "".join(cells))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+# tools/hangul_equivalence.py
+"""
+HangulAutomaton과 HangulComposer 동작 비교 (전수 검사)
+
+입력 기호(초성/중성/겹받침 낱자 전체 + 백스페이스 + 초기화)로 만들 수 있는
+길이 --depth 이하의 모든 순서를 깊이 우선으로 돌면서, 매 단계의 반환값과 조합 상태
+(cho, jung, jong, current_text, last_jamo)가 같은지 확인합니다.
+백스페이스/초기화가 없는 순서는 compose() 결과도 함께 확인합니다.
+
+사용 예 (프로젝트 루트에서 실행):
+    python -m tools.hangul_equivalence --depth 4
+"""
+
+import os
+import sys
+
+import argparse
+import copy
+import time
+
+# 프로젝트 루트를 import 경로에 추가 (python tools/hangul_equivalence.py 로 실행한 경우)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from components.hangul_composer import HangulComposer
+from components.hangul_automaton import HangulAutomaton
+
+BACKSPACE = "<BS>"
+RESET = "<RESET>"
+
+def input_symbols():
+    jamos = list(dict.fromkeys(
+        HangulComposer.CHOSUNG + HangulComposer.JUNGSUNG + [j for j in HangulComposer.JONGSUNG if j]
+    ))
+    return jamos + [BACKSPACE, RESET]
+
+def snapshot(composer):
+    return (composer.cho, composer.jung, composer.jong, composer.current_text, composer.last_jamo)
+
+def apply(composer, symbol):
+    if symbol == BACKSPACE:
+        return composer.backspace()
+    if symbol == RESET:
+        return composer.reset()
+    return composer.add_jamo(symbol)
+
+class EquivalenceCheck:
+    def __init__(self, depth):
+        self.depth = depth
+        self.symbols = input_symbols()
+        self.sequences = 0
+        self.compose_checks = 0
+
+    def run(self):
+        self.visit(HangulComposer(), HangulAutomaton(), [], [], True)
+
+    def visit(self, reference, automaton, sequence, pieces, jamo_only):
+        if jamo_only and sequence:
+            # 같은 순서를 새 HangulAutomaton.compose()로 한 번에 넣은 결과와 비교
+            current = reference.combine()
+            expected = "".join(pieces) + (current or "")
+            composed = HangulAutomaton().compose(sequence)
+            if composed != expected:
+                raise AssertionError(f"compose 불일치 {sequence}: {composed!r} != {expected!r}")
+            self.compose_checks += 1
+        if len(sequence) == self.depth:
+            return
+
+        for symbol in self.symbols:
+            ref = copy.copy(reference)
+            auto = copy.copy(automaton)
+            path = sequence + [symbol]
+            expected = apply(ref, symbol)
+            try:
+                actual = apply(auto, symbol)
+            except Exception as e:
+                raise AssertionError(f"예외 발생 {path}: {e!r}")
+            if expected != actual:
+                raise AssertionError(f"반환값 불일치 {path}: {actual!r} != {expected!r}")
+            if snapshot(ref) != snapshot(auto):
+                raise AssertionError(f"상태 불일치 {path}: {snapshot(auto)} != {snapshot(ref)}")
+            self.sequences += 1
+
+            is_jamo = symbol not in (BACKSPACE, RESET)
+            next_pieces = pieces + [expected[0]] if is_jamo and expected[0] else pieces
+            self.visit(ref, auto, path, next_pieces, jamo_only and is_jamo)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HangulAutomaton / HangulComposer 전수 비교")
+    parser.add_argument("--depth", type=int, default=4, help="검사할 최대 입력 길이")
+    args = parser.parse_args(argv)
+
+    check = EquivalenceCheck(args.depth)
+    started = time.perf_counter()
+    try:
+        check.run()
+    except AssertionError as e:
+        print(f"불일치: {e}")
+        return 1
+    print(f"입력 기호 {len(check.symbols)}개, 길이 {args.depth} 이하 순서 {check.sequences}개 일치 "
+          f"(compose 확인 {check.compose_checks}개, {time.perf_counter() - started:.1f}초)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
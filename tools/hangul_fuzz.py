@@ -0,0 +1,281 @@
+# tools/hangul_fuzz.py
+"""
+한글 입력 차등 퍼저 (조합/백스페이스 왕복 검사)
+
+무작위 한글 문장을 유니코드 산술로 직접 자모 키 입력으로 분해한 뒤(조합기 표와 독립),
+HangulComposer, HangulAutomaton, 그리고 실제 VirtualKeyboard(offscreen)에 넣어 확인합니다.
+    - 조합: 키 입력을 넣으면 원래 문장이 그대로 나와야 함
+    - 백스페이스: 입력 후 n번 지운 결과가 참조 모델과 같아야 함
+      (조합 중인 마지막 글자는 자모 단위, 이미 완성된 글자는 받침 → 글자 단위로 지워짐)
+    - 완성형 11,172자 전체에 대해 VirtualKeyboard의 받침 분해 산술 확인
+실패하면 문장을 글자 단위로 줄여 가며 가장 짧은 실패 예를 보여 줍니다.
+
+사용 예 (프로젝트 루트에서 실행):
+    python -m tools.hangul_fuzz --cases 2000 --seed 1
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import random
+import time
+
+from PySide6.QtWidgets import QApplication, QLineEdit
+
+# 프로젝트 루트를 import 경로에 추가 (python tools/hangul_fuzz.py 로 실행한 경우)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)
+
+from config import config, refresh_settings
+from components.hangul_composer import HangulComposer
+from components.hangul_automaton import HangulAutomaton
+from components.virtual_keyboard import VirtualKeyboard
+
+# ---- 참조 분해 (유니코드 표준 순서, 조합기 코드와 따로 둠) ----
+
+SYLLABLE_FIRST = 0xAC00
+SYLLABLE_COUNT = 11172
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+            "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 두 키로 입력하는 모음/받침
+VOWEL_KEYS = {"ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"}
+JONG_KEYS = {"ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+             "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ"}
+
+def is_syllable(char):
+    return SYLLABLE_FIRST <= ord(char) < SYLLABLE_FIRST + SYLLABLE_COUNT
+
+def decompose(syllable):
+    """완성형 한 글자 → (초성, 중성, 종성 인덱스)"""
+    code = ord(syllable) - SYLLABLE_FIRST
+    return code // 588, (code % 588) // 28, code % 28
+
+def compose_syllable(cho, jung, jong=0):
+    return chr(SYLLABLE_FIRST + cho * 588 + jung * 28 + jong)
+
+def syllable_keys(syllable):
+    """한 글자를 치는 자모 키 입력 (복합 모음/겹받침은 두 번)"""
+    cho, jung, jong = decompose(syllable)
+    vowel = JUNGSUNG[jung]
+    final = JONGSUNG[jong]
+    return CHOSUNG[cho] + VOWEL_KEYS.get(vowel, vowel) + JONG_KEYS.get(final, final)
+
+def text_keys(text):
+    """문장 → 자모 키 입력 목록 (공백은 " ")"""
+    keys = []
+    for char in text:
+        keys.extend(" " if char == " " else syllable_keys(char))
+    return keys
+
+def random_syllable(rng, vowels=None, finals=None):
+    cho = rng.randrange(len(CHOSUNG))
+    jung = JUNGSUNG.index(rng.choice(vowels)) if vowels else rng.randrange(len(JUNGSUNG))
+    jong = JONGSUNG.index(rng.choice(finals)) if finals is not None else rng.randrange(len(JONGSUNG))
+    return compose_syllable(cho, jung, jong)
+
+def random_text(rng, max_length=12, space_rate=0.15):
+    chars = []
+    for _ in range(rng.randint(1, max_length)):
+        if chars and chars[-1] != " " and rng.random() < space_rate:
+            chars.append(" ")
+        chars.append(random_syllable(rng))
+    return "".join(chars)
+
+def delete_steps(syllable, composing):
+    """
+    글자 하나를 백스페이스로 지울 때 차례로 보이는 모습 (마지막은 빈 문자열)
+
+    조합 중인 글자는 겹받침 → 홑받침 → 받침 없음 → 초성 → 삭제 순서로 지워지고,
+    이미 완성된 글자는 받침 전체 → 글자 순서로 지워짐
+    """
+    if not is_syllable(syllable):
+        return [""]
+    cho, jung, jong = decompose(syllable)
+    steps = []
+    if composing:
+        final = JONGSUNG[jong]
+        if final in JONG_KEYS:
+            steps.append(compose_syllable(cho, jung, JONGSUNG.index(JONG_KEYS[final][0])))
+        if jong:
+            steps.append(compose_syllable(cho, jung))
+        steps.append(CHOSUNG[cho])
+    elif jong:
+        steps.append(compose_syllable(cho, jung))
+    steps.append("")
+    return steps
+
+def expected_after_backspace(text, count):
+    """text를 입력한 직후 백스페이스를 count번 누른 결과 (참조 모델)"""
+    chars = list(text)
+    composing = True  # 입력 직후 마지막 글자는 조합 중
+    while count > 0 and chars:
+        for step in delete_steps(chars[-1], composing):
+            if count == 0:
+                break
+            count -= 1
+            if step:
+                chars[-1] = step
+            else:
+                chars.pop()
+        composing = False
+    return "".join(chars)
+
+# ---- 검사 대상 ----
+
+def composer_output(composer, keys):
+    """조합기에 키를 넣고 화면에 보일 문장 (완성 글자 + 조합 중 글자, 공백은 그대로)"""
+    pieces = []
+    for key in keys:
+        if key == " ":
+            current = composer.combine()
+            if current:
+                pieces.append(current)
+            composer.reset()
+            pieces.append(" ")
+            continue
+        committed, _ = composer.add_jamo(key)
+        if committed:
+            pieces.append(committed)
+    current = composer.combine()
+    if current:
+        pieces.append(current)
+    return "".join(pieces)
+
+class KeyboardDriver:
+    """VirtualKeyboard에 자모를 실제 키(시프트 포함)로 입력"""
+
+    def __init__(self):
+        self.line_edit = QLineEdit()
+        self.keyboard = VirtualKeyboard(self.line_edit)
+        self.key_for = {}
+        for key, jamo in VirtualKeyboard.hangul_map.items():
+            self.key_for.setdefault(jamo, (key, False))
+        for key, jamo in VirtualKeyboard.shift_hangul_map.items():
+            self.key_for.setdefault(jamo, (key, True))
+
+    def restart(self):
+        """새 입력 필드 상태로 (TextInputScreen이 화면을 다시 보일 때와 같음)"""
+        self.line_edit.clear()
+        self.keyboard.hangul_composer = type(self.keyboard.hangul_composer)()
+        self.keyboard.bumper = False
+        if self.keyboard.is_uppercase:
+            self.keyboard.toggle_shift()
+
+    def type(self, keys):
+        for jamo in keys:
+            if jamo == " ":
+                self.keyboard.space_pressed()
+                continue
+            key, shift = self.key_for[jamo]
+            if shift != self.keyboard.is_uppercase:
+                self.keyboard.toggle_shift()
+            self.keyboard.button_clicked(key)
+        return self.line_edit.text()
+
+    def backspace(self, count):
+        for _ in range(count):
+            self.keyboard.backspace()
+        return self.line_edit.text()
+
+# ---- 속성 검사 ----
+
+class HangulFuzz:
+    def __init__(self, seed, cases, max_length):
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.cases = cases
+        self.max_length = max_length
+        self.driver = KeyboardDriver()
+        self.checks = 0
+
+    def check_text(self, text, backspaces):
+        """실패하면 설명 문자열, 통과하면 None"""
+        keys = text_keys(text)
+        for composer_class in (HangulComposer, HangulAutomaton):
+            output = composer_output(composer_class(), keys)
+            if output != text:
+                return f"{composer_class.__name__} 조합 결과 {output!r} != {text!r}"
+        batch = HangulAutomaton().compose(k for k in keys if k != " ")
+        if batch != text.replace(" ", ""):
+            return f"HangulAutomaton.compose 결과 {batch!r} != {text.replace(' ', '')!r}"
+
+        self.driver.restart()
+        typed = self.driver.type(keys)
+        if typed != text:
+            return f"VirtualKeyboard 입력 결과 {typed!r} != {text!r}"
+        remaining = self.driver.backspace(backspaces)
+        expected = expected_after_backspace(text, backspaces)
+        if remaining != expected:
+            return f"VirtualKeyboard 백스페이스 {backspaces}번 결과 {remaining!r} != {expected!r}"
+        return None
+
+    def shrink(self, text, backspaces):
+        """글자를 하나씩 빼 보면서 여전히 실패하는 가장 짧은 문장 찾기"""
+        changed = True
+        while changed:
+            changed = False
+            for index in range(len(text)):
+                candidate = (text[:index] + text[index + 1:]).strip()
+                if candidate and "  " not in candidate and self.check_text(candidate, backspaces):
+                    text = candidate
+                    changed = True
+                    break
+        while backspaces > 0 and self.check_text(text, backspaces - 1):
+            backspaces -= 1
+        return text, backspaces
+
+    def run(self):
+        for case in range(self.cases):
+            text = random_text(self.rng, self.max_length)
+            backspaces = self.rng.randint(0, len(text) * 4)
+            failure = self.check_text(text, backspaces)
+            self.checks += 1
+            if failure:
+                text, backspaces = self.shrink(text, backspaces)
+                return f"사례 {case}: {text!r}, 백스페이스 {backspaces}번 → {self.check_text(text, backspaces)}"
+        return None
+
+    def check_all_syllables(self):
+        """완성 글자 하나에서 백스페이스 한 번 (VirtualKeyboard의 받침 분해 산술)"""
+        for offset in range(SYLLABLE_COUNT):
+            syllable = chr(SYLLABLE_FIRST + offset)
+            self.driver.restart()
+            # 조합기를 거치지 않고 넣으면 이미 완성된 글자로 취급됨
+            self.driver.line_edit.setText(syllable)
+            remaining = self.driver.backspace(1)
+            expected = delete_steps(syllable, composing=False)[0]
+            if remaining != expected:
+                return f"{syllable!r} 백스페이스 결과 {remaining!r} != {expected!r}"
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="한글 입력 조합/백스페이스 차등 퍼저")
+    parser.add_argument("--cases", type=int, default=1000, help="무작위 문장 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-length", type=int, default=12, help="문장 최대 글자 수")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    # 글자 수 제한에 걸리지 않도록
+    config["keyboard"]["max_hangul"] = args.max_length * 4
+    refresh_settings()
+
+    fuzz = HangulFuzz(args.seed, args.cases, args.max_length)
+    started = time.perf_counter()
+    failure = fuzz.run() or fuzz.check_all_syllables()
+    if failure:
+        print(f"실패 (seed {args.seed}) {failure}")
+        return 1
+    print(f"통과: 무작위 문장 {fuzz.checks}개 + 완성형 {SYLLABLE_COUNT}자 "
+          f"(seed {args.seed}, {time.perf_counter() - started:.1f}초)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+# tools/mock_server.py
+"""
+QR 업로드 흐름용 로컬 대체 서버 (부하/지연 테스트용)
+
+클라우드 서버 대신 키오스크가 사용하는 엔드포인트를 한 포트에서 흉내냅니다.
+    POST /api/events/register?event_name=...   이벤트 생성
+    GET  /ws/kiosk/{event_id}                  키오스크 웹소켓 (업로드 알림 수신)
+                                               ?inline_images=1 이면 이미지를 바이너리 프레임으로 전송
+    POST /upload/{event_id}                    모바일 업로드 (요청 본문 = 이미지)
+    GET  /images/{name}                        업로드된 이미지
+    POST /admin/upload/{event_id}              합성 이미지로 모바일 업로드 흉내
+    POST /admin/drop                           연결된 키오스크 웹소켓 모두 끊기 (재연결 확인용)
+
+키오스크를 여기에 연결하려면 config.json에 "server_url": "http://127.0.0.1:8765" 를 넣습니다.
+
+사용 예 (프로젝트 루트에서 실행):
+    python -m tools.mock_server --port 8765 --auto-upload 3 --image-size 3024x4032 --bandwidth-kbps 2000
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import threading
+import time
+import uuid
+from urllib.parse import parse_qs, urlsplit
+
+from PIL import Image
+from websockets.frames import Opcode
+from websockets.server import ServerProtocol
+
+from network_utils.websocket_manager import encode_binary_frame
+
+CHUNK_SIZE = 16 * 1024
+
+def make_test_image(width, height, quality=90, seed=0):
+    """모바일 사진 크기의 합성 JPEG (단색이면 너무 작게 압축되므로 그라데이션 사용)"""
+    gradient = Image.linear_gradient("L").resize((width, height))
+    image = Image.merge("RGB", (gradient, gradient.rotate(90 + seed % 180), gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT)))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+class MockServer:
+    """
+    asyncio 한 포트에서 HTTP와 웹소켓을 모두 처리 (웹소켓은 websockets의 sans-I/O 프로토콜 사용)
+
+    - api_latency: API 응답 전 인위적 지연(초)
+    - bandwidth: 이미지 전송 속도 제한(bytes/sec, 0이면 제한 없음)
+    - auto_upload: 키오스크가 연결되고 이 시간(초) 뒤에 합성 이미지 업로드 (0이면 사용 안 함)
+    - drop_after: 키오스크 웹소켓을 이 시간(초) 뒤에 서버가 먼저 끊음 (0이면 사용 안 함)
+    - inline_images: 키오스크가 요청하면 이미지를 바이너리 프레임으로 전송 (False면 항상 URL만)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, api_latency=0.0, bandwidth=0,
+                 auto_upload=0.0, image_size=(1536, 2048), jpeg_quality=90, drop_after=0.0,
+                 inline_images=True):
+        self.host = host
+        self.port = port
+        self.api_latency = api_latency
+        self.bandwidth = bandwidth
+        self.auto_upload = auto_upload
+        self.image_size = image_size
+        self.jpeg_quality = jpeg_quality
+        self.drop_after = drop_after
+        self.inline_images = inline_images
+
+        self.events = {}
+        self.images = {}
+        self.kiosks = {}  # event_id -> (protocol, writer, 바이너리 이미지 수신 여부)
+        self.upload_times = {}  # image name -> 업로드 수신 시각 (perf_counter)
+        self.stats = {"events": 0, "uploads": 0, "inline_uploads": 0, "ws_connects": 0, "ws_drops": 0, "image_fetches": 0}
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.test_image = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    # ---- 실행 ----
+
+    async def serve(self):
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        print(f"[mock] {self.base_url} 에서 대기 중")
+
+    def start_in_thread(self):
+        """다른 스레드에서 서버 실행 (벤치마크에서 같은 프로세스로 띄울 때)"""
+        ready = threading.Event()
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            self.loop.run_until_complete(self.serve())
+            ready.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, name="mock-server", daemon=True)
+        self.thread.start()
+        ready.wait()
+        return self
+
+    def call(self, coroutine):
+        """다른 스레드에서 서버 루프의 코루틴 실행 후 결과 반환"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    # ---- HTTP ----
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, target, _ = request_line.split(" ", 2)
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                if headers.get("upgrade", "").lower() == "websocket":
+                    await self.handle_websocket(head, target, reader, writer)
+                    return
+
+                body = b""
+                if int(headers.get("content-length") or 0):
+                    body = await reader.readexactly(int(headers["content-length"]))
+                keep_alive = await self.handle_http(method, target, body, writer)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, body=b"", content_type="application/json"):
+        reason = {200: "OK", 404: "Not Found", 400: "Bad Request"}.get(status, "OK")
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: keep-alive\r\n\r\n".encode("latin-1"))
+        if self.bandwidth and content_type.startswith("image/"):
+            # 느린 모바일 망 흉내: 청크마다 대역폭에 맞춰 쉬면서 전송
+            for start in range(0, len(body), CHUNK_SIZE):
+                writer.write(body[start:start + CHUNK_SIZE])
+                await writer.drain()
+                await asyncio.sleep(min(CHUNK_SIZE, len(body) - start) / self.bandwidth)
+        else:
+            writer.write(body)
+        await writer.drain()
+        return True
+
+    async def handle_http(self, method, target, body, writer):
+        url = urlsplit(target)
+        parts = url.path.strip("/").split("/")
+
+        if method == "POST" and url.path == "/api/events/register":
+            await asyncio.sleep(self.api_latency)
+            event_name = parse_qs(url.query).get("event_name", ["kiosk"])[0]
+            event_id = uuid.uuid4().hex[:12]
+            self.events[event_id] = {"event_name": event_name, "created_at": time.time()}
+            self.stats["events"] += 1
+            data = {"event_id": event_id, "event_name": event_name, "qr_url": f"{self.base_url}/upload/{event_id}"}
+            return await self.respond(writer, 200, json.dumps(data).encode())
+
+        if method == "POST" and len(parts) == 2 and parts[0] == "upload":
+            if parts[1] not in self.events:
+                return await self.respond(writer, 404, b'{"detail": "event not found"}')
+            name = await self.store_upload(parts[1], body)
+            return await self.respond(writer, 200, json.dumps({"image": name}).encode())
+
+        if method == "GET" and len(parts) == 2 and parts[0] == "images":
+            image = self.images.get(parts[1])
+            if image is None:
+                return await self.respond(writer, 404, b'{"detail": "image not found"}')
+            self.stats["image_fetches"] += 1
+            return await self.respond(writer, 200, image, "image/jpeg")
+
+        if method == "POST" and len(parts) == 3 and parts[:2] == ["admin", "upload"]:
+            name = await self.simulate_upload(parts[2])
+            return await self.respond(writer, 200 if name else 404, json.dumps({"image": name}).encode())
+
+        if method == "POST" and url.path == "/admin/drop":
+            dropped = await self.drop_kiosks()
+            return await self.respond(writer, 200, json.dumps({"dropped": dropped}).encode())
+
+        if method == "GET" and url.path == "/admin/stats":
+            return await self.respond(writer, 200, json.dumps(self.stats).encode())
+
+        return await self.respond(writer, 404, b'{"detail": "not found"}')
+
+    # ---- 업로드 ----
+
+    async def store_upload(self, event_id, image_bytes):
+        name = f"{event_id}-{uuid.uuid4().hex[:6]}.jpg"
+        self.images[name] = image_bytes
+        self.upload_times[name] = time.perf_counter()
+        self.stats["uploads"] += 1
+        message = {"type": "image_uploaded", "image_url": f"/images/{name}"}
+        kiosk = self.kiosks.get(event_id)
+        if kiosk is not None and kiosk[2]:
+            # URL도 함께 보내서 키오스크가 필요하면 HTTP로 다시 받을 수 있게 함
+            message.update(content_type="image/jpeg", size=len(image_bytes))
+            await self.notify(event_id, encode_binary_frame(message, image_bytes))
+            self.stats["inline_uploads"] += 1
+        else:
+            await self.notify(event_id, message)
+        return name
+
+    async def simulate_upload(self, event_id):
+        """모바일에서 사진을 올린 것처럼 합성 이미지를 업로드"""
+        if event_id not in self.events:
+            return None
+        if self.test_image is None:
+            self.test_image = make_test_image(*self.image_size, quality=self.jpeg_quality)
+        return await self.store_upload(event_id, self.test_image)
+
+    # ---- 웹소켓 ----
+
+    async def handle_websocket(self, head, target, reader, writer):
+        parts = urlsplit(target).path.strip("/").split("/")
+        protocol = ServerProtocol()
+        protocol.receive_data(head)
+        request = protocol.events_received()[0]
+
+        if len(parts) != 3 or parts[:2] != ["ws", "kiosk"] or parts[2] not in self.events:
+            response = protocol.reject(404, "event not found\n")
+            protocol.send_response(response)
+            writer.write(b"".join(protocol.data_to_send()))
+            await writer.drain()
+            return
+
+        protocol.send_response(protocol.accept(request))
+        writer.write(b"".join(protocol.data_to_send()))
+        await writer.drain()
+
+        event_id = parts[2]
+        wants_inline = parse_qs(urlsplit(target).query).get("inline_images") == ["1"]
+        self.kiosks[event_id] = (protocol, writer, self.inline_images and wants_inline)
+        self.stats["ws_connects"] += 1
+        tasks = []
+        if self.auto_upload:
+            tasks.append(asyncio.ensure_future(self.delayed(self.auto_upload, self.simulate_upload(event_id))))
+        if self.drop_after:
+            tasks.append(asyncio.ensure_future(self.delayed(self.drop_after, self.drop_kiosk(event_id))))
+
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    protocol.receive_eof()
+                    break
+                protocol.receive_data(data)
+                for frame in protocol.events_received():
+                    if frame.opcode == Opcode.TEXT and json.loads(frame.data).get("type") == "ping":
+                        protocol.send_text(json.dumps({"type": "pong"}).encode())
+                # ping에 대한 pong, close 응답 등은 프로토콜이 알아서 만듦
+                writer.write(b"".join(protocol.data_to_send()))
+                await writer.drain()
+                if protocol.close_code is not None:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            if self.kiosks.get(event_id, (None,))[0] is protocol:
+                del self.kiosks[event_id]
+
+    async def delayed(self, seconds, coroutine):
+        await asyncio.sleep(seconds)
+        await coroutine
+
+    async def notify(self, event_id, message):
+        kiosk = self.kiosks.get(event_id)
+        if kiosk is None:
+            return False
+        protocol, writer, _ = kiosk
+        if isinstance(message, bytes):
+            protocol.send_binary(message)
+        else:
+            protocol.send_text(json.dumps(message).encode())
+        writer.write(b"".join(protocol.data_to_send()))
+        await writer.drain()
+        return True
+
+    async def drop_kiosk(self, event_id):
+        kiosk = self.kiosks.pop(event_id, None)
+        if kiosk is None:
+            return False
+        # close 핸드셰이크 없이 TCP를 끊어 네트워크 단절을 흉내
+        kiosk[1].transport.abort()
+        self.stats["ws_drops"] += 1
+        return True
+
+    async def drop_kiosks(self):
+        dropped = 0
+        for event_id in list(self.kiosks):
+            dropped += await self.drop_kiosk(event_id)
+        return dropped
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="QR 업로드 흐름 로컬 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--api-latency", type=float, default=0.0, help="API 응답 지연(초)")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0, help="이미지 전송 속도 제한(KB/s, 0이면 제한 없음)")
+    parser.add_argument("--auto-upload", type=float, default=0.0, help="키오스크 연결 후 자동 업로드까지 시간(초, 0이면 사용 안 함)")
+    parser.add_argument("--image-size", type=parse_size, default=(1536, 2048), help="합성 업로드 이미지 크기 (예: 3024x4032)")
+    parser.add_argument("--jpeg-quality", type=int, default=90)
+    parser.add_argument("--drop-after", type=float, default=0.0, help="키오스크 웹소켓을 서버가 끊기까지 시간(초, 0이면 사용 안 함)")
+    parser.add_argument("--no-inline", action="store_true", help="이미지를 바이너리 프레임으로 보내지 않음 (URL만 전송)")
+    args = parser.parse_args(argv)
+
+    server = MockServer(args.host, args.port, api_latency=args.api_latency,
+                        bandwidth=int(args.bandwidth_kbps * 1024), auto_upload=args.auto_upload,
+                        image_size=args.image_size, jpeg_quality=args.jpeg_quality,
+                        drop_after=args.drop_after, inline_images=not args.no_inline)
+
+    async def run():
+        await server.serve()
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"[mock] 종료: {server.stats}")
+
+if __name__ == "__main__":
+    main()
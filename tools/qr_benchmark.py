@@ -0,0 +1,219 @@
+# tools/qr_benchmark.py
+"""
+QR 업로드 흐름 종단간 지연 벤치마크
+
+로컬 대체 서버(tools.mock_server)를 같은 프로세스에서 띄우고 config의 server_url을
+그쪽으로 돌린 뒤 실제 KioskApp의 QR 화면으로 라운드를 반복합니다.
+라운드마다 측정하는 값:
+    - QR 화면 표시 → QR 이미지 표시 및 웹소켓 연결까지
+    - 서버가 업로드를 받은 시점 → 미리보기 표시까지
+    - (--reconnect-every) 서버가 웹소켓을 끊은 시점 → 재연결까지
+
+사용 예 (프로젝트 루트에서 실행):
+    python -m tools.qr_benchmark --rounds 50 --image-size 3024x4032 --bandwidth-kbps 4000
+    python -m tools.qr_benchmark --rounds 20 --reconnect-every 2 --pool-size 0 --json qr_report.json
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import time
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
+
+# 프로젝트 루트를 import 경로에 추가 (python tools/qr_benchmark.py 로 실행한 경우)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)
+
+from config import config, refresh_settings
+from tools.mock_server import MockServer, parse_size
+from tools.soak_driver import install_fakes, percentile
+
+QR_INDEX = 3
+POLL_INTERVAL = 1  # ms
+
+class QrBenchmark:
+    def __init__(self, app, window, server, args):
+        self.app = app
+        self.window = window
+        self.stack = window.stack
+        self.screen = self.stack.widget(QR_INDEX)
+        self.server = server
+        self.args = args
+
+        self.round = 0
+        self.show_to_qr = []
+        self.upload_to_preview = []
+        self.reconnects = []
+        self.failures = []
+
+        self.poll_timer = QTimer()
+        self.poll_timer.setInterval(POLL_INTERVAL)
+        self.poll_timer.timeout.connect(self.poll)
+        self.waiting_for = None
+        self.waiting_since = 0.0
+        self.mark = 0.0
+
+        # 미리보기가 적용되는 순간을 기록
+        original_apply = self.screen.apply_uploaded_image
+
+        def apply_and_record(image, save_path):
+            original_apply(image, save_path)
+            if self.waiting_for == "preview":
+                self.on_preview_shown()
+
+        self.screen.apply_uploaded_image = apply_and_record
+
+    # ---- 라운드 진행 ----
+
+    def start(self):
+        # 이벤트 풀이 처음 채워질 때까지 잠시 대기
+        QTimer.singleShot(self.args.warmup_ms, self.start_round)
+
+    def start_round(self):
+        if self.round >= self.args.rounds:
+            self.finish()
+            return
+        self.round += 1
+        self.mark = time.perf_counter()
+        self.stack.setCurrentIndex(QR_INDEX)
+        self.wait("qr")
+
+    def wait(self, what):
+        self.waiting_for = what
+        self.waiting_since = time.perf_counter()
+        self.poll_timer.start()
+
+    def poll(self):
+        if time.perf_counter() - self.waiting_since > self.args.timeout:
+            self.failures.append(f"라운드 {self.round}: {self.waiting_for} 대기 시간 초과")
+            self.end_round()
+            return
+
+        subscription = self.screen.ws
+        connected = subscription is not None and subscription.connection is not None
+        if self.waiting_for == "qr" and not self.screen.qr_label.pixmap().isNull() and connected:
+            self.poll_timer.stop()
+            self.show_to_qr.append(time.perf_counter() - self.mark)
+            if self.args.reconnect_every and self.round % self.args.reconnect_every == 0:
+                self.server.call(self.server.drop_kiosks())
+                self.mark = time.perf_counter()
+                self.wait("reconnect_drop")
+            else:
+                self.upload()
+        elif self.waiting_for == "reconnect_drop" and not connected:
+            # 끊김이 감지된 뒤 다시 연결되기를 기다림
+            self.waiting_for = "reconnect"
+        elif self.waiting_for == "reconnect" and connected:
+            self.poll_timer.stop()
+            self.reconnects.append(time.perf_counter() - self.mark)
+            self.upload()
+
+    def upload(self):
+        # 서버는 업로드 알림을 보낸 뒤 응답하므로, 미리보기는 이 호출이 끝난 뒤에 처리됨
+        self.waiting_for = "preview"
+        self.waiting_since = time.perf_counter()
+        self.uploaded_name = self.server.call(self.server.simulate_upload(self.screen.event_id))
+        self.poll_timer.start()
+
+    def on_preview_shown(self):
+        self.poll_timer.stop()
+        self.waiting_for = None
+        self.upload_to_preview.append(time.perf_counter() - self.server.upload_times[self.uploaded_name])
+        self.end_round()
+
+    def end_round(self):
+        self.poll_timer.stop()
+        self.waiting_for = None
+        self.screen.on_home_button_clicked()
+        QTimer.singleShot(self.args.round_gap_ms, self.start_round)
+
+    # ---- 보고 ----
+
+    def summarize(self, values):
+        ordered = sorted(values)
+        return {
+            "count": len(ordered),
+            "p50_ms": percentile(ordered, 50) * 1000,
+            "p90_ms": percentile(ordered, 90) * 1000,
+            "p99_ms": percentile(ordered, 99) * 1000,
+            "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+        }
+
+    def finish(self):
+        report = {
+            "rounds": self.round,
+            "server": dict(self.server.stats),
+            "show_to_qr": self.summarize(self.show_to_qr),
+            "upload_to_preview": self.summarize(self.upload_to_preview),
+            "reconnect": self.summarize(self.reconnects),
+            "failures": self.failures,
+        }
+        print("\n=== QR 흐름 벤치마크 결과 ===")
+        print(f"라운드: {report['rounds']}  실패: {len(self.failures)}  서버: {report['server']}")
+        print(f"{'지표':<20}{'횟수':>6}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}")
+        for name in ("show_to_qr", "upload_to_preview", "reconnect"):
+            stats = report[name]
+            if stats["count"]:
+                print(f"{name:<20}{stats['count']:>6}{stats['p50_ms']:>10.1f}{stats['p90_ms']:>10.1f}"
+                      f"{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+        for failure in self.failures:
+            print(f"  {failure}")
+        if self.args.json:
+            with open(self.args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        self.report = report
+        self.app.quit()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="QR 업로드 흐름 종단간 지연 벤치마크")
+    parser.add_argument("--rounds", type=int, default=20, help="반복 횟수")
+    parser.add_argument("--image-size", type=parse_size, default=(1536, 2048), help="업로드 이미지 크기 (예: 3024x4032)")
+    parser.add_argument("--jpeg-quality", type=int, default=90)
+    parser.add_argument("--bandwidth-kbps", type=float, default=0, help="이미지 전송 속도 제한(KB/s, 0이면 제한 없음)")
+    parser.add_argument("--api-latency", type=float, default=0.0, help="API 응답 지연(초)")
+    parser.add_argument("--pool-size", type=int, default=1, help="이벤트 풀 크기 (0이면 화면 표시 때 이벤트 생성)")
+    parser.add_argument("--no-inline", action="store_true", help="이미지를 웹소켓 바이너리 대신 URL로 받음")
+    parser.add_argument("--reconnect-every", type=int, default=0, help="N 라운드마다 서버가 웹소켓을 끊음 (0이면 사용 안 함)")
+    parser.add_argument("--timeout", type=float, default=15.0, help="단계별 대기 제한(초)")
+    parser.add_argument("--warmup-ms", type=int, default=1500, help="첫 라운드 전 대기 시간")
+    parser.add_argument("--round-gap-ms", type=int, default=200, help="라운드 사이 대기 시간")
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    server = MockServer(api_latency=args.api_latency, bandwidth=int(args.bandwidth_kbps * 1024),
+                        image_size=args.image_size, jpeg_quality=args.jpeg_quality,
+                        inline_images=not args.no_inline).start_in_thread()
+
+    # QR_screen을 import하기 전에 서버 주소를 바꿔야 함
+    config["server_url"] = server.base_url
+    config["qr"]["event_pool_size"] = args.pool_size
+    if QR_INDEX not in config["screen_order"]:
+        config["screen_order"] = [0, QR_INDEX, 4, 5]
+    config["camera_count"]["number"] = 0
+    refresh_settings()
+    install_fakes(argparse.Namespace(printer="dry-run", print_time=0, live_qr=True), [])
+
+    from main import KioskApp
+
+    app = QApplication(sys.argv[:1])
+    window = KioskApp()
+    window.show()
+
+    benchmark = QrBenchmark(app, window, server, args)
+    QTimer.singleShot(0, benchmark.start)
+    app.exec()
+    return 0 if not benchmark.failures else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
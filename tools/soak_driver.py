@@ -0,0 +1,407 @@
+# tools/soak_driver.py
+"""
+무인 세션 드라이버 (소크/처리량 테스트용)
+
+QT_QPA_PLATFORM=offscreen 환경에서 KioskApp을 띄우고 터치, 키 입력, 카메라 프레임을
+합성해서 주입하여 스플래시 → 촬영 → 텍스트 → QR → 발급중 → 완료 세션을 사람 없이 반복합니다.
+종료 시 시간당 세션 수, 화면별 지연 백분위수, RSS 증가량을 보고합니다.
+
+사용 예 (프로젝트 루트에서 실행):
+    python -m tools.soak_driver --sessions 2000 --fast --screen-order 0,1,2,3,4,5
+    python -m tools.soak_driver --duration 3600 --json soak_report.json
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import io
+import json
+import math
+import threading
+import time
+import uuid
+
+import numpy as np
+from PIL import Image
+from PySide6.QtWidgets import QApplication, QPushButton
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtTest import QTest
+
+# 프로젝트 루트를 import 경로에 추가 (python tools/soak_driver.py 로 실행한 경우)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)
+
+from config import config, refresh_settings
+from monitor_utils.memory_watchdog import get_rss_bytes
+from network_utils.image_downloader import InlineImageReceiver
+
+# 텍스트 입력 화면에서 입력할 키 시퀀스 (두벌식: "홍길동")
+DEFAULT_KEYS = "GHDRLFEHD"
+
+def percentile(values, pct):
+    """nearest-rank 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+class SyntheticCamera:
+    """cv2.VideoCapture 대신 합성 프레임을 돌려주는 가짜 카메라"""
+
+    def __init__(self, width, height, frame_count=8):
+        # 매 프레임 생성 비용을 피하기 위해 몇 장을 미리 만들어 순환
+        gradient = np.linspace(0, 255, width, dtype=np.uint8)
+        self.frames = []
+        for i in range(frame_count):
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            frame[:, :, 0] = np.roll(gradient, i * width // frame_count)
+            frame[:, :, 1] = (i * 32) % 256
+            frame[:, :, 2] = gradient[::-1]
+            self.frames.append(frame)
+        self.index = 0
+        self.opened = True
+
+    def isOpened(self):
+        return self.opened
+
+    def read(self):
+        frame = self.frames[self.index]
+        self.index = (self.index + 1) % len(self.frames)
+        return True, frame
+
+    def set(self, prop, value):
+        return True
+
+    def get(self, prop):
+        return 0
+
+    def release(self):
+        self.opened = False
+
+def make_upload_jpeg(width=1200, height=1600):
+    """QR 업로드를 흉내 낼 JPEG 바이트 생성"""
+    image = Image.new("RGB", (width, height), (90, 140, 200))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+class SessionDriver:
+    """화면 전환을 감시하며 각 화면에 맞는 합성 입력을 주입"""
+
+    def __init__(self, app, window, args):
+        self.app = app
+        self.window = window
+        self.stack = window.stack
+        self.args = args
+        self.upload_bytes = make_upload_jpeg()
+
+        self.sessions = 0
+        self.stalls = 0
+        self.errors = []
+        self.left_splash = False
+
+        self.current_name = None
+        self.entered_at = time.perf_counter()
+        self.action_at = None
+        self.transition_latency = {}  # 화면별: 입력 주입 → 다음 화면 전환
+        self.show_latency = {}        # 화면별: 화면 전환 → 이벤트 루프 유휴
+        self.dwell = {}               # 화면별: 화면 체류 시간
+
+        self.rss_samples = [get_rss_bytes()]
+        self.thread_samples = [threading.active_count()]
+        self.started_at = time.perf_counter()
+
+        self.actions = {
+            "SplashScreen": self.tap_splash,
+            "CameraScreen": self.tap_camera,
+            "TextInputScreen": self.type_text,
+            "QR_screen": self.upload_and_print,
+        }
+
+        self.stack.currentChanged.connect(self.on_screen_changed)
+
+        self.stall_timer = QTimer()
+        self.stall_timer.timeout.connect(self.check_stall)
+        self.stall_timer.start(1000)
+
+    def start(self):
+        self.on_screen_changed(self.stack.currentIndex())
+
+    def on_screen_changed(self, index):
+        now = time.perf_counter()
+        widget = self.stack.widget(index)
+        name = type(widget).__name__
+
+        if self.current_name is not None:
+            self.dwell.setdefault(self.current_name, []).append(now - self.entered_at)
+            if self.action_at is not None:
+                self.transition_latency.setdefault(self.current_name, []).append(now - self.action_at)
+        self.action_at = None
+        self.current_name = name
+        self.entered_at = now
+
+        # 전환 직후 동기 처리(showEvent 등)가 끝나고 이벤트 루프가 비는 시점까지 측정
+        QTimer.singleShot(0, lambda: self.show_latency.setdefault(name, []).append(time.perf_counter() - now))
+
+        if index == 0:
+            if self.left_splash:
+                self.finish_session()
+        else:
+            self.left_splash = True
+
+        action = self.actions.get(name)
+        if action:
+            QTimer.singleShot(self.args.think_time, lambda: self.run_action(name, action))
+
+    def run_action(self, name, action):
+        # 지연 실행 사이에 화면이 바뀌었으면 무시
+        if self.current_name != name:
+            return
+        self.action_at = time.perf_counter()
+        action(self.stack.currentWidget())
+
+    def tap_splash(self, screen):
+        QTest.mouseClick(screen, Qt.MouseButton.LeftButton)
+
+    def tap_camera(self, screen):
+        if hasattr(screen, "webcam"):
+            QTest.mouseClick(screen.webcam, Qt.MouseButton.LeftButton)
+        else:
+            screen.onPhotoCaptured()
+
+    def type_text(self, screen):
+        keyboard = screen.keyboard
+        if keyboard is None:
+            # 입력 필드가 없는 설정이면 바로 다음 화면으로
+            screen.confirm_pressed(None)
+            return
+
+        if hasattr(keyboard, "key_rect"):
+            # PaintedKeyboard: 키 영역 가운데를 직접 터치
+            for key in self.args.keys:
+                rect = keyboard.key_rect(key)
+                if not rect.isNull():
+                    QTest.mouseClick(keyboard, Qt.MouseButton.LeftButton, pos=rect.center())
+            QTest.mouseClick(keyboard, Qt.MouseButton.LeftButton, pos=keyboard.key_rect("next").center())
+            return
+
+        buttons = {}
+        for row_buttons, row_keys in zip(keyboard.button_widgets, keyboard.keys):
+            for button, key in zip(row_buttons, row_keys):
+                buttons[key] = button
+        for key in self.args.keys:
+            if key in buttons:
+                QTest.mouseClick(buttons[key], Qt.MouseButton.LeftButton)
+
+        next_button = next((b for b in keyboard.findChildren(QPushButton) if b.text() == "다음"), None)
+        if next_button is not None:
+            QTest.mouseClick(next_button, Qt.MouseButton.LeftButton)
+        else:
+            keyboard.next_pressed()
+
+    def upload_and_print(self, screen):
+        # 웹소켓 바이너리로 받은 것처럼 실제와 같은 워커 경로로 저장/디코딩한 뒤 인쇄
+        worker = InlineImageReceiver(self.upload_bytes, **screen.image_worker_options())
+        screen.start_image_worker(worker)
+        # 화면의 미리보기 처리(인쇄 버튼 활성화)가 먼저 연결돼 있으므로 그 뒤에 실행됨
+        worker.preview_ready.connect(
+            lambda image, save_path: QTest.mouseClick(screen.print_button, Qt.MouseButton.LeftButton))
+
+    def check_stall(self):
+        """한 화면에 너무 오래 머물면 멈춤으로 기록하고 스플래시로 복귀"""
+        if time.perf_counter() - self.entered_at < self.args.stall_timeout:
+            return
+        self.stalls += 1
+        print(f"[soak] 멈춤 감지: {self.current_name} 화면에서 {self.args.stall_timeout}초 이상 대기")
+        self.action_at = None
+        self.window.current_index = 0
+        if self.stack.currentIndex() == 0:
+            # 스플래시에서 멈춘 경우 입력만 다시 주입
+            self.entered_at = time.perf_counter()
+            self.run_action(self.current_name, self.tap_splash)
+        else:
+            self.stack.setCurrentIndex(0)
+
+    def finish_session(self):
+        self.sessions += 1
+        self.rss_samples.append(get_rss_bytes())
+        self.thread_samples.append(threading.active_count())
+
+        if self.args.progress and self.sessions % self.args.progress == 0:
+            elapsed = time.perf_counter() - self.started_at
+            print(f"[soak] {self.sessions} 세션, {elapsed:.0f}초, RSS {self.rss_samples[-1] / 1048576:.1f}MB")
+
+        elapsed = time.perf_counter() - self.started_at
+        done_by_count = self.args.sessions and self.sessions >= self.args.sessions
+        done_by_time = self.args.duration and elapsed >= self.args.duration
+        if done_by_count or done_by_time:
+            self.stall_timer.stop()
+            QTimer.singleShot(0, self.finish)
+
+    def finish(self):
+        report = self.build_report()
+        self.print_report(report)
+        if self.args.json:
+            with open(self.args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=4)
+            print(f"[soak] 보고서 저장: {self.args.json}")
+        self.window.close()
+        self.app.quit()
+
+    def build_report(self):
+        elapsed = time.perf_counter() - self.started_at
+        screens = {}
+        names = set(self.dwell) | set(self.transition_latency) | set(self.show_latency)
+        for name in sorted(names):
+            screens[name] = {
+                metric: {
+                    "count": len(values),
+                    "p50_ms": percentile(values, 50) * 1000,
+                    "p90_ms": percentile(values, 90) * 1000,
+                    "p99_ms": percentile(values, 99) * 1000,
+                    "max_ms": max(values) * 1000 if values else 0.0,
+                }
+                for metric, values in (
+                    ("transition", self.transition_latency.get(name, [])),
+                    ("show", self.show_latency.get(name, [])),
+                    ("dwell", self.dwell.get(name, [])),
+                )
+            }
+        rss_start = self.rss_samples[0]
+        rss_end = self.rss_samples[-1]
+        return {
+            "sessions": self.sessions,
+            "elapsed_sec": elapsed,
+            "sessions_per_hour": self.sessions / elapsed * 3600 if elapsed > 0 else 0.0,
+            "stalls": self.stalls,
+            "errors": self.errors,
+            "screens": screens,
+            "rss": {
+                "start_mb": rss_start / 1048576,
+                "end_mb": rss_end / 1048576,
+                "max_mb": max(self.rss_samples) / 1048576,
+                "growth_mb": (rss_end - rss_start) / 1048576,
+                "growth_per_1000_sessions_mb": (rss_end - rss_start) / 1048576 / self.sessions * 1000 if self.sessions else 0.0,
+            },
+            "threads": {
+                "start": self.thread_samples[0],
+                "end": self.thread_samples[-1],
+                "max": max(self.thread_samples),
+            },
+        }
+
+    def print_report(self, report):
+        print("\n=== 소크 테스트 결과 ===")
+        print(f"세션: {report['sessions']}  경과: {report['elapsed_sec']:.1f}초  "
+              f"시간당 세션: {report['sessions_per_hour']:.0f}  멈춤: {report['stalls']}  오류: {len(report['errors'])}")
+        print(f"{'화면':<18}{'지표':<12}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}")
+        for name, metrics in report["screens"].items():
+            for metric, stats in metrics.items():
+                if stats["count"]:
+                    print(f"{name:<18}{metric:<12}{stats['p50_ms']:>10.1f}{stats['p90_ms']:>10.1f}"
+                          f"{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+        rss = report["rss"]
+        print(f"RSS: 시작 {rss['start_mb']:.1f}MB → 종료 {rss['end_mb']:.1f}MB "
+              f"(최대 {rss['max_mb']:.1f}MB, 증가 {rss['growth_mb']:+.1f}MB, "
+              f"1000세션당 {rss['growth_per_1000_sessions_mb']:+.2f}MB)")
+        threads = report["threads"]
+        print(f"스레드: 시작 {threads['start']} → 종료 {threads['end']} (최대 {threads['max']})")
+
+def apply_overrides(args):
+    """실행 전에 메모리상의 config를 테스트용으로 조정 (파일은 수정하지 않음)"""
+    if args.screen_order:
+        config["screen_order"] = [int(x) for x in args.screen_order.split(",")]
+    if args.fast:
+        config["camera_count"]["number"] = 0
+        config["process"]["process_time"] = args.fast_delay
+        config["process"]["min_display_time"] = args.fast_delay
+        config["complete"]["complete_time"] = args.fast_delay
+    refresh_settings()
+
+def install_fakes(args, driver_errors):
+    """카메라/프린터/QR 서버를 테스트용으로 교체"""
+    from webcam_utils import webcam_controller
+    width = config["camera_size"]["width"]
+    height = config["camera_size"]["height"]
+    webcam_controller.initialize_camera = lambda *a, **k: SyntheticCamera(width, height)
+
+    from screens.process_screen import ProcessScreen
+    ProcessScreen.show_error_popup = lambda self, message: driver_errors.append(message)
+
+    if args.printer == "dry-run":
+        from printer_utils.printer_thread import PrinterThread
+
+        def dry_run(thread):
+            # 실제 장치 대신 인쇄 시간만큼 대기 (완료/진행 시그널은 run()이 그대로 처리)
+            thread.mark_stage("print", 85)
+            time.sleep(args.print_time / 1000.0)
+            thread.succeeded = True
+            thread.finished.emit()
+
+        PrinterThread.print_job = dry_run
+        # 가짜 인쇄는 용량 산정 기록에 남기지 않음
+        config["printer"]["stats_file"] = ""
+        refresh_settings()
+
+    if not args.live_qr:
+        from screens.QR_screen import QR_screen
+
+        def offline_create_event(screen):
+            # 서버 없이 QR 코드 생성까지만 수행
+            screen.event_id = f"soak-{uuid.uuid4().hex[:8]}"
+            screen.event_name = config["app_name"]
+            screen.qr_url = f"https://kiosk.invalid/upload/{screen.event_id}"
+            screen.generate_qr_code()
+
+        QR_screen.create_event = offline_create_event
+        # 이벤트 풀도 서버에 요청하므로 사용하지 않음
+        config["qr"]["event_pool_size"] = 0
+        QR_screen.start_kiosk_websocket = lambda screen: None
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="키오스크 무인 세션 드라이버")
+    parser.add_argument("--sessions", type=int, default=1000, help="반복할 세션 수 (0이면 --duration만 사용)")
+    parser.add_argument("--duration", type=float, default=0, help="최대 실행 시간(초)")
+    parser.add_argument("--screen-order", default="", help="config의 screen_order 대신 사용할 순서 (예: 0,1,2,3,4,5)")
+    parser.add_argument("--fast", action="store_true", help="카운트다운/발급중/완료 대기 시간을 최소화")
+    parser.add_argument("--fast-delay", type=int, default=50, help="--fast 사용 시 발급중/완료 화면 대기(ms)")
+    parser.add_argument("--think-time", type=int, default=20, help="화면 표시 후 입력 주입까지 대기(ms)")
+    parser.add_argument("--keys", default=DEFAULT_KEYS, help="텍스트 화면에서 누를 키 (영문 자판 기준)")
+    parser.add_argument("--printer", choices=["dry-run", "real"], default="dry-run", help="프린터 동작 방식")
+    parser.add_argument("--print-time", type=int, default=200, help="dry-run 인쇄 시간(ms)")
+    parser.add_argument("--live-qr", action="store_true", help="실제 서버로 QR 이벤트 생성")
+    parser.add_argument("--stall-timeout", type=float, default=30, help="멈춤으로 판단할 화면 체류 시간(초)")
+    parser.add_argument("--progress", type=int, default=100, help="N 세션마다 진행 상황 출력 (0이면 끔)")
+    parser.add_argument("--json", default="", help="결과 보고서를 저장할 JSON 경로")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not args.sessions and not args.duration:
+        print("--sessions 또는 --duration 중 하나는 지정해야 합니다.")
+        return 2
+
+    apply_overrides(args)
+    driver_errors = []
+    install_fakes(args, driver_errors)
+
+    from main import KioskApp
+
+    app = QApplication(sys.argv[:1])
+    window = KioskApp()
+    window.show()
+
+    driver = SessionDriver(app, window, args)
+    driver.errors = driver_errors
+    QTimer.singleShot(0, driver.start)
+    app.exec()
+    return 0 if driver.stalls == 0 and not driver.errors else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
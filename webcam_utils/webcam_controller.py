@@ -5,7 +5,8 @@ from PySide6.QtGui import QImage, QPixmap, QMouseEvent
 from PySide6.QtWidgets import QLabel, QWidget, QVBoxLayout
 import time
 import os
-from config import config
+from config import get_settings
+from monitor_utils.memory_watchdog import watch_thread
 
 def initialize_camera(camera_index=0, width=1920, height=1080, fps=60):
     """카메라 초기화 및 최적화"""
@@ -14,8 +15,8 @@ def initialize_camera(camera_index=0, width=1920, height=1080, fps=60):
         camera = cv2.VideoCapture(camera_index)
     
     if camera.isOpened():
-        camera.set(cv2.CAP_PROP_FRAME_WIDTH, config["camera_size"]["width"])
-        camera.set(cv2.CAP_PROP_FRAME_HEIGHT, config["camera_size"]["height"])
+        camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
 
         # 실제 설정된 해상도 확인
         actual_width = camera.get(cv2.CAP_PROP_FRAME_WIDTH)
@@ -112,13 +113,15 @@ class WebcamViewer(QWidget):
         self.preview_height = preview_height
         
         # config에서 카메라 설정 및 crop_area 설정 가져오기
-        self.capture_width = config["crop_area"]["width"]
-        self.capture_height = config["crop_area"]["height"]
-        self.capture_x = config["crop_area"]["x"]
-        self.capture_y = config["crop_area"]["y"]
+        settings = get_settings()
+        self.crop_area = settings.crop_area
+        self.capture_width = self.crop_area.width
+        self.capture_height = self.crop_area.height
+        self.capture_x = self.crop_area.x
+        self.capture_y = self.crop_area.y
         
         # 카메라 초기화 - config에서 설정된 해상도 사용
-        self.camera = initialize_camera(camera_index, config["camera_size"]["width"], config["camera_size"]["height"])
+        self.camera = initialize_camera(camera_index, settings.camera_size.width, settings.camera_size.height)
         
         # 프리뷰 레이블 - 프리뷰 크기로 설정 및 정확한 위치에 배치
         self.preview_label = QLabel(self)
@@ -128,8 +131,8 @@ class WebcamViewer(QWidget):
         self.countdown_label = QLabel(self)
         self.countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.countdown_label.setStyleSheet(
-            f"font-size: {config['camera_count']['font_size']}px;"
-            f"color: {config['camera_count']['font_color']};"
+            f"font-size: {settings.camera_count.font_size}px;"
+            f"color: {settings.camera_count.font_color};"
         )  # 글자 크기 조정
         self.countdown_label.setGeometry(0, 0, preview_width, preview_height)  # 중앙 상단 배치
         self.countdown_label.hide()
@@ -144,10 +147,10 @@ class WebcamViewer(QWidget):
     
     def set_capture_area(self, x, y, width, height):
         # config에서 crop_area 설정을 사용하여 크롭 영역을 설정
-        self.capture_x = config["crop_area"]["x"]
-        self.capture_y = config["crop_area"]["y"]
-        self.capture_width = config["crop_area"]["width"]
-        self.capture_height = config["crop_area"]["height"]
+        self.capture_x = self.crop_area.x
+        self.capture_y = self.crop_area.y
+        self.capture_width = self.crop_area.width
+        self.capture_height = self.crop_area.height
     
     def update_frame(self):
         frame = get_frame(self.camera)
@@ -169,7 +172,7 @@ class WebcamViewer(QWidget):
                 
             if self.countdown_time > 0:
                 self.countdown_label.show()
-                self.countdown_thread = CountdownThread(self.countdown_time)
+                self.countdown_thread = watch_thread(CountdownThread(self.countdown_time))
                 self.countdown_thread.countdown_signal.connect(self.update_countdown)
                 self.countdown_thread.finished_signal.connect(self.capture_photo)
                 self.countdown_thread.start()